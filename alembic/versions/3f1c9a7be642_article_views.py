@@ -0,0 +1,40 @@
+"""Article views
+
+Adds the table storing the views of the articles, with an index on their
+time-decayed popularity for ranking the popular articles.
+
+Revision ID: 3f1c9a7be642
+Revises: 495792b3075f
+Create Date: 2026-10-19 12:52:17.402915
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f1c9a7be642"
+down_revision = "495792b3075f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "article_views",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("views", sa.BigInteger(), nullable=False),
+        sa.Column("popularity", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+    op.create_index(
+        "ix_article_views_popularity",
+        "article_views",
+        [sa.text("popularity DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_views_popularity", table_name="article_views")
+    op.drop_table("article_views")
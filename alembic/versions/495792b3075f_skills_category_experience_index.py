@@ -0,0 +1,43 @@
+"""Skills category experience index
+
+Replaces the index on the category of the skills with an index on the category
+and the experience, that supports grouping the skills by category ordered by
+their experience.
+
+Revision ID: 495792b3075f
+Revises: b2e3ec90d2ea
+Create Date: 2026-10-19 12:34:50.118226
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "495792b3075f"
+down_revision = "b2e3ec90d2ea"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_skills_category_experience",
+            "skills",
+            ["category", sa.text("experience DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(op.f("ix_skills_category"), table_name="skills", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_skills_category"),
+            "skills",
+            ["category"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_skills_category_experience", table_name="skills", postgresql_concurrently=True)
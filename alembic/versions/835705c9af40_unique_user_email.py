@@ -0,0 +1,32 @@
+"""Unique user email
+
+Revision ID: 835705c9af40
+Revises: e77d231aa500
+Create Date: 2026-10-19 09:12:41.532187
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "835705c9af40"
+down_revision = "e77d231aa500"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fails in case mail addresses exist that only differ in their case,
+    # these need to be cleaned up manually before running the migration.
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=False)
+    op.drop_index("ix_users_email_lower", table_name="users")
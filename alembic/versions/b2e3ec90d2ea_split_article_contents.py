@@ -0,0 +1,39 @@
+"""Split article contents
+
+Moves the content of the articles into a separate table, so that listings,
+sorts and filters on the articles only need to read the small metadata rows.
+
+Revision ID: b2e3ec90d2ea
+Revises: dce72f23d51c
+Create Date: 2026-10-19 11:21:08.406113
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b2e3ec90d2ea"
+down_revision = "dce72f23d51c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "article_contents",
+        sa.Column("article_id", sa.Integer(), nullable=False),
+        sa.Column("content", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["article_id"], ["articles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("article_id"),
+    )
+    op.execute("INSERT INTO article_contents (article_id, content) SELECT id, content FROM articles")
+    op.drop_column("articles", "content")
+
+
+def downgrade() -> None:
+    op.add_column("articles", sa.Column("content", sa.String(), nullable=True))
+    op.execute(
+        "UPDATE articles SET content = article_contents.content "
+        "FROM article_contents WHERE article_contents.article_id = articles.id"
+    )
+    op.drop_table("article_contents")
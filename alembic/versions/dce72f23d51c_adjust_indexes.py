@@ -0,0 +1,60 @@
+"""Adjust indexes
+
+Drops the indexes on the ID columns that duplicate the primary keys and adds
+indexes for ordering the articles and filtering the skills. All indexes are
+created and dropped concurrently outside of a transaction, so that the
+migration does not lock the tables of a live database.
+
+Revision ID: dce72f23d51c
+Revises: 835705c9af40
+Create Date: 2026-10-19 10:03:27.914520
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "dce72f23d51c"
+down_revision = "835705c9af40"
+branch_labels = None
+depends_on = None
+
+REDUNDANT_INDEXES = {
+    "articles": "ix_articles_id",
+    "projects": "ix_projects_id",
+    "skills": "ix_skills_id",
+    "users": "ix_users_id",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_articles_created_at"),
+            "articles",
+            ["created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_skills_category"),
+            "skills",
+            ["category"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        for table_name, index_name in REDUNDANT_INDEXES.items():
+            op.drop_index(op.f(index_name), table_name=table_name, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name, index_name in REDUNDANT_INDEXES.items():
+            op.create_index(
+                op.f(index_name),
+                table_name,
+                ["id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+        op.drop_index(op.f("ix_skills_category"), table_name="skills", postgresql_concurrently=True)
+        op.drop_index(op.f("ix_articles_created_at"), table_name="articles", postgresql_concurrently=True)
@@ -0,0 +1 @@
+"""This folder contains benchmarks, most of them require a running database."""
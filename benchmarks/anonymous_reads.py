@@ -0,0 +1,125 @@
+"""Benchmark the overhead of the JWT authentication for reads.
+
+Mounts the same endpoint on a public router and on a router with the
+```JWTAuthentication``` dependency, as done in ```src/routers/api.py```, and
+calls it directly through ASGI, so that the measured difference is the time
+spent for parsing and verifying the bearer token. The database is not used.
+
+Usage:
+    python -m benchmarks.anonymous_reads --requests 20000
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI
+from starlette.types import Message
+
+from src.services.token_service import token_service
+from src.util.jwt_authentication import JWTAuthentication
+
+
+def create_app() -> FastAPI:
+    """Create an app serving the same endpoint publicly and protected.
+
+    Returns:
+        FastAPI: The app.
+    """
+
+    async def get_items() -> List[Dict[str, int]]:
+        return [{"id": 1}]
+
+    public_router = APIRouter()
+    public_router.get("/items/")(get_items)
+    protected_router = APIRouter()
+    protected_router.get("/items/")(get_items)
+
+    app = FastAPI()
+    app.include_router(public_router, prefix="/public")
+    app.include_router(
+        protected_router, prefix="/protected", dependencies=[Depends(JWTAuthentication(auto_error=False))]
+    )
+    return app
+
+
+async def measure(app: FastAPI, path: str, token: Optional[str], requests: int) -> float:
+    """Call the path repeatedly and return the mean duration.
+
+    Args:
+        app (FastAPI): The app to call.
+        path (str): The path to request.
+        token (Optional[str]): The bearer token to send, ```None``` for anonymous requests.
+        requests (int): The number of requests.
+
+    Returns:
+        float: The mean duration per request in microseconds.
+    """
+    headers = [(b"host", b"bench")]
+    if token is not None:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    # Warm up the routing and the dependency caches
+    for _ in range(100):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(requests: int) -> None:
+    """Run the scenarios and print the results.
+
+    Args:
+        requests (int): The number of requests per scenario.
+    """
+    app = create_app()
+    token = token_service.generate_auth_tokens("bench@example.com")["access_token"]["token"]
+
+    scenarios = {
+        "public, anonymous": ("/public/items/", None),
+        "public, with token": ("/public/items/", token),
+        "protected, anonymous (403)": ("/protected/items/", None),
+        "protected, with token": ("/protected/items/", token),
+    }
+    results = {
+        name: await measure(app, path, scenario_token, requests)
+        for name, (path, scenario_token) in scenarios.items()
+    }
+
+    baseline = results["public, anonymous"]
+    print(f"{requests} requests per scenario")
+    print(f"{'scenario':<32}{'us/request':>14}{'overhead':>14}")
+    for name, duration in results.items():
+        print(f"{name:<32}{duration:>14.1f}{duration - baseline:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=20000, help="Number of requests per scenario")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
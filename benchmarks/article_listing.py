@@ -0,0 +1,166 @@
+"""Benchmark the article listing with inline and separately stored contents.
+
+Creates a temporary schema in the configured database containing the article
+layout before (content stored inline) and after (content stored in
+```article_contents```) the vertical split, seeds both with the same number of
+articles and measures listing scans, vacuum duration and relation sizes.
+
+Usage:
+    python -m benchmarks.article_listing --articles 100000
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.config.settings import settings
+
+SCHEMA = "bench_article_listing"
+
+SETUP_STATEMENTS = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""CREATE TABLE {SCHEMA}.articles_inline (
+        id serial PRIMARY KEY, title varchar, author varchar, image_url varchar,
+        description varchar, content varchar, tags jsonb, created_at date NOT NULL, updated_at date
+    )""",
+    f"""CREATE TABLE {SCHEMA}.articles_split (
+        id serial PRIMARY KEY, title varchar, author varchar, image_url varchar,
+        description varchar, tags jsonb, created_at date NOT NULL, updated_at date
+    )""",
+    f"""CREATE TABLE {SCHEMA}.article_contents (
+        article_id integer PRIMARY KEY REFERENCES {SCHEMA}.articles_split (id) ON DELETE CASCADE,
+        content varchar
+    )""",
+]
+
+SEED_STATEMENTS = [
+    f"""INSERT INTO {SCHEMA}.articles_inline
+        (title, author, image_url, description, content, tags, created_at)
+    SELECT
+        'Title ' || i, 'Author ' || (i % 50), 'www.example.com/' || i || '.svg',
+        rpad('Description ' || i, 100, '.'),
+        (SELECT string_agg(md5(random()::text || i), '') FROM generate_series(1, :content_chunks)),
+        '[{{"icon_name": "python", "name": "Python"}}]'::jsonb,
+        current_date - (i % 3650)
+    FROM generate_series(1, :articles) AS i""",
+    f"""INSERT INTO {SCHEMA}.articles_split
+        (id, title, author, image_url, description, tags, created_at)
+    SELECT id, title, author, image_url, description, tags, created_at FROM {SCHEMA}.articles_inline""",
+    f"""INSERT INTO {SCHEMA}.article_contents (article_id, content)
+    SELECT id, content FROM {SCHEMA}.articles_inline""",
+    f"CREATE INDEX ON {SCHEMA}.articles_inline (created_at)",
+    f"CREATE INDEX ON {SCHEMA}.articles_split (created_at)",
+]
+
+LISTING_COLUMNS = "id, title, author, image_url, description, tags, created_at, updated_at"
+
+
+async def timed(connection: AsyncConnection, statement: str, repeat: int) -> float:
+    """Execute the statement several times and return the mean duration.
+
+    Args:
+        connection (AsyncConnection): The connection to use.
+        statement (str): The SQL statement to execute.
+        repeat (int): The number of executions.
+
+    Returns:
+        float: The mean duration in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await connection.execute(text(statement))
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def measure(connection: AsyncConnection, table: str, repeat: int) -> Dict[str, float]:
+    """Measure the listing scans and the vacuum behavior of the table.
+
+    Args:
+        connection (AsyncConnection): The connection to use, needs to be in autocommit mode.
+        table (str): The name of the articles table.
+        repeat (int): The number of executions per scan.
+
+    Returns:
+        Dict[str, float]: The measured values.
+    """
+    results = {
+        "first page (ms)": await timed(
+            connection,
+            f"SELECT {LISTING_COLUMNS} FROM {SCHEMA}.{table} ORDER BY created_at DESC LIMIT 100",
+            repeat,
+        ),
+        "deep page (ms)": await timed(
+            connection,
+            f"SELECT {LISTING_COLUMNS} FROM {SCHEMA}.{table} ORDER BY created_at DESC LIMIT 100 OFFSET 50000",
+            repeat,
+        ),
+        "full listing scan (ms)": await timed(
+            connection, f"SELECT {LISTING_COLUMNS} FROM {SCHEMA}.{table}", repeat
+        ),
+        "filtered count (ms)": await timed(
+            connection, f"SELECT count(*) FROM {SCHEMA}.{table} WHERE author = 'Author 7'", repeat
+        ),
+    }
+
+    # Touch every tenth article, as updating the metadata does in production
+    await connection.execute(text(f"UPDATE {SCHEMA}.{table} SET updated_at = current_date WHERE id % 10 = 0"))
+    results["vacuum after update (ms)"] = await timed(connection, f"VACUUM {SCHEMA}.{table}", 1)
+
+    size = await connection.scalar(text(f"SELECT pg_relation_size('{SCHEMA}.{table}')"))
+    total_size = await connection.scalar(text(f"SELECT pg_total_relation_size('{SCHEMA}.{table}')"))
+    results["heap size (MB)"] = size / 1024 / 1024
+    results["total size incl. TOAST (MB)"] = total_size / 1024 / 1024
+    return results
+
+
+async def main(articles: int, content_size: int, repeat: int, keep: bool) -> None:
+    """Seed the benchmark tables and print the results.
+
+    Args:
+        articles (int): The number of articles to seed.
+        content_size (int): The approximate size of the content per article in bytes.
+        repeat (int): The number of executions per scan.
+        keep (bool): Flag indicating, whether to keep the benchmark schema afterwards.
+    """
+    engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI, isolation_level="AUTOCOMMIT")
+
+    async with engine.connect() as connection:
+        for statement in SETUP_STATEMENTS:
+            await connection.execute(text(statement))
+        for statement in SEED_STATEMENTS:
+            await connection.execute(
+                text(statement), {"articles": articles, "content_chunks": max(1, content_size // 32)}
+            )
+        await connection.execute(text(f"VACUUM ANALYZE {SCHEMA}.articles_inline"))
+        await connection.execute(text(f"VACUUM ANALYZE {SCHEMA}.articles_split"))
+        await connection.execute(text(f"VACUUM ANALYZE {SCHEMA}.article_contents"))
+
+        before = await measure(connection, "articles_inline", repeat)
+        after = await measure(connection, "articles_split", repeat)
+
+        if not keep:
+            await connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+
+    await engine.dispose()
+
+    rows: List[str] = [f"{'metric':<32}{'inline':>14}{'split':>14}"]
+    rows.extend(f"{metric:<32}{before[metric]:>14.2f}{after[metric]:>14.2f}" for metric in before)
+    print(f"{articles} articles, ~{content_size} bytes content each")
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--articles", type=int, default=100000, help="Number of articles to seed")
+    parser.add_argument("--content-size", type=int, default=1900, help="Content size per article in bytes")
+    parser.add_argument("--repeat", type=int, default=5, help="Executions per scan")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark schema afterwards")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.articles, args.content_size, args.repeat, args.keep))
@@ -0,0 +1,77 @@
+"""Configures the logging of the app."""
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict
+
+from src.config.settings import settings
+
+# Attributes of every log record, all other attributes have been passed using ```extra```
+RECORD_ATTRIBUTES = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats the log records as single line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, including the fields passed using ```extra```.
+
+        Args:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: The record as JSON object.
+        """
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in record.__dict__.items() if key not in RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Puts the records into the queue without formatting them.
+
+    The default ```QueueHandler``` formats the message in the logging thread, to be able to
+    pickle the record. Since the queue is only consumed within the process, formatting is
+    deferred to the listener thread, so that the event loop only has to enqueue the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unchanged.
+
+        Args:
+            record (logging.LogRecord): The record to enqueue.
+
+        Returns:
+            logging.LogRecord: The unchanged record.
+        """
+        return record
+
+
+def configure_logging() -> QueueListener:
+    """Route all log records through a queue to a JSON handler writing to stdout.
+
+    Returns:
+        QueueListener: The listener, formatting and writing the records in its own thread.
+            It needs to be started and should be stopped on shutdown, to flush the queue.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter())
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [DeferredQueueHandler(log_queue)]
+    root_logger.setLevel(settings.LOG_LEVEL)
+
+    return QueueListener(log_queue, stream_handler, respect_handler_level=True)
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     API_PATH: str = "/api/v1"
     API_NAME: str = "Blog-RestAPI-service"
     API_DESC: str = "This API can be used to store new articles posts and skills for the blog frontend"
+    DEBUG: bool = False
+    LOG_LEVEL: str = "INFO"
 
     # API contact configuration
     API_CONTACT_NAME: str
@@ -61,6 +63,128 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_MINUTES: int
+    # Asymmetric algorithms (e.g. RS256) sign with the newest private key <kid>.pem of the directory,
+    # once it has been published for JWKS_MAX_AGE_SECONDS. The previous keys verify the tokens until
+    # the grace period after the rotation passed
+    JWT_KEYS_DIR: str = "keys"
+    JWT_KEY_GRACE_MINUTES: Optional[int] = None
+    JWT_KEYS_RELOAD_SECONDS: float = 300
+    JWKS_MAX_AGE_SECONDS: int = 300
+    # Revoked tokens are mirrored in memory, the revocations of other workers apply after the interval
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 5
+
+    @validator("JWT_KEY_GRACE_MINUTES", pre=True, always=True)
+    def assemble_jwt_key_grace_minutes(cls, v: Optional[int], values: Dict[str, Any]) -> int:
+        """Keep the previous keys as long as the refresh tokens they signed are valid, by default.
+
+        Args:
+            v (Optional[int]): The configured grace period in minutes.
+            values (Dict[str, Any]): The dictionary containing the
+                loaded environment variables.
+
+        Returns:
+            int: The grace period in minutes.
+        """
+        return int(v) if v is not None else values.get("REFRESH_TOKEN_EXPIRE_MINUTES", 0)
+
+    # Maximum number of IDs that can be requested at once
+    BATCH_MAX_IDS: int = 50
+
+    # Tables with more rows are not counted exactly, but estimated
+    COUNT_ESTIMATE_THRESHOLD: int = 10000
+
+    # GraphQL configuration, only used in case the graphql extra is installed
+    GRAPHQL_ENABLED: bool = True
+    GRAPHQL_MAX_DEPTH: int = 5
+    GRAPHQL_MAX_COST: int = 2500
+    GRAPHQL_MAX_LIMIT: int = 100
+
+    # Login rate limiting
+    LOGIN_IP_BUCKET_SIZE: int = 20
+    LOGIN_IP_REFILL_PER_MINUTE: float = 10
+    LOGIN_ACCOUNT_BUCKET_SIZE: int = 5
+    LOGIN_ACCOUNT_REFILL_PER_MINUTE: float = 2
+    LOGIN_MAX_CONCURRENT_HASHES: int = 4
+
+    # User cache configuration, a TTL of 0 disables the cache
+    USER_CACHE_TTL_SECONDS: float = 60
+    USER_CACHE_MAX_SIZE: int = 256
+
+    # Overview cache configuration, a TTL of 0 disables the cache
+    OVERVIEW_CACHE_TTL_SECONDS: float = 300
+
+    # Skills cache configuration, a TTL of 0 disables the cache
+    SKILLS_CACHE_TTL_SECONDS: float = 300
+
+    # Related articles, the index is rebuilt from the database after the interval
+    RELATED_ARTICLES_TOP_K: int = 10
+    RELATED_ARTICLES_REBUILD_SECONDS: float = 3600
+
+    # Article views are counted in memory and flushed to the database periodically,
+    # the views counted since the last flush are lost in case a worker crashes
+    ARTICLE_VIEWS_FLUSH_SECONDS: float = 10
+    ARTICLE_VIEWS_MAX_PENDING: int = 1000
+    ARTICLE_VIEWS_HALF_LIFE_HOURS: float = 72
+
+    # Feeds and sitemap, the links point to the pages of the blog frontend
+    FEEDS_TITLE: str = "Blog"
+    FEEDS_DESCRIPTION: str = "The latest articles of the blog"
+    FEEDS_SITE_URL: Optional[str] = None
+    FEEDS_ARTICLE_PATH: str = "/articles/{article_id}"
+    FEEDS_PROJECT_PATH: str = "/projects/{project_id}"
+    FEEDS_MAX_ITEMS: int = 20
+    FEEDS_MAX_AGE_SECONDS: int = 3600
+    FEEDS_REBUILD_SECONDS: float = 900
+
+    @validator("FEEDS_SITE_URL", pre=True)
+    def assemble_feeds_site_url(cls, v: Optional[str], values: Dict[str, Any]) -> str:
+        """Use the contact site as URL of the blog, in case none is configured.
+
+        Args:
+            v (Optional[str]): The configured URL of the blog.
+            values (Dict[str, Any]): The dictionary containing the
+                loaded environment variables.
+
+        Returns:
+            str: The URL of the blog without trailing slash.
+        """
+        return (v or values.get("API_CONTACT_SITE") or "").rstrip("/")
+
+    # Profiling, requires the profiling extra. Requests of the admin user containing the
+    # header return their profile, sampled requests store it in the output directory
+    PROFILING_ENABLED: bool = True
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_SAMPLE_RATE: float = 0
+    PROFILING_INTERVAL_SECONDS: float = 0.001
+    PROFILING_OUTPUT_DIR: str = "profiles"
+
+    # Event loop monitoring, blocking calls are only logged in debug mode
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.5
+    LOOP_BLOCKING_THRESHOLD_SECONDS: float = 0.1
+
+    # Share of the successful GET requests that are written to the access log
+    ACCESS_LOG_SAMPLE_RATE: float = 0.1
+
+    # Deadline of the requests, after which the endpoint and its DB statement are cancelled.
+    # The deadlines of single routes can be overridden by their name, e.g. {"get_articles": 5}
+    REQUEST_DEADLINE_SECONDS: float = 10
+    REQUEST_DEADLINES: Dict[str, float] = {}
+
+    # Adaptive concurrency limit per route class, requests exceeding it wait in a short queue
+    # and are rejected with 503, in case the queue is full or they waited too long
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_INITIAL_LIMIT: int = 10
+    CONCURRENCY_MIN_LIMIT: int = 1
+    CONCURRENCY_MAX_LIMIT: int = 100
+    CONCURRENCY_QUEUE_SIZE: int = 20
+    CONCURRENCY_QUEUE_TIMEOUT_SECONDS: float = 0.5
+    CONCURRENCY_LATENCY_TOLERANCE: float = 2
+    CONCURRENCY_BACKOFF_RATIO: float = 0.9
+    CONCURRENCY_RETRY_AFTER_SECONDS: int = 1
+
+    # OpenTelemetry tracing, requires the tracing extra. The spans are written as JSON lines
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORT_FILE: str = "traces.jsonl"
 
     # API Admin user configuration
     ADMIN_USER: EmailStr
@@ -1,4 +1,13 @@
 """Base settings for interacting with the database."""
+import asyncio
+import math
+import time
+from typing import Any, AsyncIterator, Callable, Coroutine, Optional, cast
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -16,27 +25,191 @@ async_session = sessionmaker(
 )
 
 
-async def get_session() -> AsyncSession:
+class LazySession:
+    """Proxy for an ```AsyncSession``` that is only created on first use.
+
+    Requests that never access the database (e.g. failing validations or early
+    returns) therefore do not create a session at all. The proxy can be released
+    as soon as the work is done and transparently creates a new session, in case
+    it is used again afterwards.
+
+    In case a deadline is given, every transaction of the session sets the remaining
+    time as ```statement_timeout```, so that Postgres aborts statements exceeding the
+    deadline, even if the cancellation of the request does not reach the server. A
+    changed ```deadline``` applies to the transactions begun afterwards.
+
+    Like the session, the proxy can be used as async context manager, that releases
+    the session on exit.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AsyncSession] = async_session, deadline: Optional[float] = None
+    ):
+        """Initiate a new instance.
+
+        Args:
+            session_factory (Callable[[], AsyncSession], optional): The factory for creating
+                the session. Defaults to ```async_session```.
+            deadline (Optional[float], optional): The ```time.monotonic``` timestamp, until which
+                the statements need to be finished. Defaults to ```None```, meaning no timeout.
+        """
+        self.__session_factory = session_factory
+        self.__session: Optional[AsyncSession] = None
+        self.deadline: Optional[float] = deadline
+
+    @property
+    def started(self) -> bool:
+        """Flag indicating, whether the underlying session has been created.
+
+        Returns:
+            bool: ```True``` in case the session has been created.
+        """
+        return self.__session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward the attribute access to the underlying session.
+
+        Args:
+            name (str): The name of the attribute.
+
+        Returns:
+            Any: The attribute of the session.
+        """
+        if self.__session is None:
+            self.__session = self.__session_factory()
+            event.listen(self.__session.sync_session, "after_begin", self.__set_statement_timeout)
+        return getattr(self.__session, name)
+
+    def __set_statement_timeout(self, session: Any, transaction: Any, connection: Connection) -> None:
+        """Limit the duration of the statements of the transaction to the remaining time.
+
+        Args:
+            session (Any): The session beginning the transaction.
+            transaction (Any): The transaction being begun.
+            connection (Connection): The connection of the transaction.
+        """
+        if self.deadline is None:
+            return
+        remaining_ms = max(1, math.ceil((self.deadline - time.monotonic()) * 1000))
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {remaining_ms}")
+
+    async def release(self) -> None:
+        """Close the underlying session.
+
+        Rolls back any uncommitted transaction and returns the connection to the pool.
+        """
+        if self.__session is not None:
+            session, self.__session = self.__session, None
+            await session.close()
+
+    async def __aenter__(self) -> "LazySession":
+        """Enter the context, without creating the session yet.
+
+        Special methods are not looked up via ```__getattr__```, therefore they
+        are not forwarded to the underlying session.
+
+        Returns:
+            LazySession: The proxy itself.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Release the session when leaving the context.
+
+        Args:
+            exc_info (Any): The type, value and traceback of the raised exception, if any.
+        """
+        await self.release()
+
+
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
     """Session generator.
 
-    Provides a new session that allows, to conduct CRUD actions
-    on the database.
+    Provides a new lazy session that allows, to conduct CRUD actions
+    on the database. The connection is only checked out from the pool on first use.
+
+    Args:
+        request (Request): The current request, used for releasing the session
+            by the ```SessionReleasingRoute``` as soon as the endpoint finished and
+            for limiting the statements to the deadline of the request.
 
     Yields:
         Iterator[AsyncSession]: The session instance to use for conducting operations
     """
-    session: AsyncSession = None
+    session = LazySession(deadline=getattr(request.state, "deadline", None))
+    request.state.db_session = session
 
     try:
-        async with async_session() as session:
-            yield session
+        yield cast(AsyncSession, session)
     except BaseException:
-        if session is not None:
+        if session.started:
             await session.rollback()
         raise
     finally:
-        if session is not None:
-            await session.close()
+        await session.release()
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """Wait until the client disconnects.
+
+    Must only be called after the body of the request has been read completely.
+
+    Args:
+        request (Request): The request, whose client is observed.
+    """
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+class SessionReleasingRoute(APIRoute):
+    """Route that releases the session of the request before the response is sent.
+
+    Dependencies with ```yield``` are only closed after the response has been sent.
+    Releasing the session directly after the endpoint finished returns the connection
+    to the pool while the response is still being transmitted.
+
+    The endpoint is cancelled, as soon as the client disconnects or the deadline of the
+    route is exceeded, which also cancels the running DB statement. The deadline can be
+    configured per route name using ```REQUEST_DEADLINES```.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the route handler for enforcing the deadline and releasing the session.
+
+        Returns:
+            Callable[[Request], Coroutine[Any, Any, Response]]: The wrapped route handler.
+        """
+        route_handler = super().get_route_handler()
+
+        async def session_releasing_route_handler(request: Request) -> Response:
+            timeout = settings.REQUEST_DEADLINES.get(self.name, settings.REQUEST_DEADLINE_SECONDS)
+            request.state.deadline = time.monotonic() + timeout
+            # Reading the body upfront allows to observe the connection for the disconnect
+            await request.body()
+            handler = asyncio.ensure_future(route_handler(request))
+            disconnect = asyncio.ensure_future(wait_for_disconnect(request))
+            try:
+                await asyncio.wait(
+                    (handler, disconnect), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                disconnect.cancel()
+                if not handler.done():
+                    handler.cancel()
+                    await asyncio.wait((handler,))
+                session: Optional[LazySession] = getattr(request.state, "db_session", None)
+                if session is not None:
+                    await session.release()
+
+            if not handler.cancelled() and handler.exception() is None:
+                return handler.result()
+            if disconnect.done() and not disconnect.cancelled():
+                raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "The client disconnected")
+            if time.monotonic() >= request.state.deadline:
+                raise HTTPException(status.HTTP_504_GATEWAY_TIMEOUT, "The request exceeded its deadline")
+            return handler.result()
+
+        return session_releasing_route_handler
 
 
 Base = declarative_base()
@@ -0,0 +1,23 @@
+"""Functions for restricting the columns loaded from the database."""
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def load_columns(model: Any, columns: Optional[Iterable[str]]) -> List[LoaderOption]:
+    """Create the loader options for only loading the specified columns.
+
+    The primary key ```id``` is always loaded.
+
+    Args:
+        model (Any): The model to load.
+        columns (Optional[Iterable[str]]): The names of the columns to load. In case of
+            ```None```, all columns are loaded.
+
+    Returns:
+        List[LoaderOption]: The options that need to be passed to ```select(...).options()```.
+    """
+    if columns is None:
+        return []
+    return [load_only(*(getattr(model, column) for column in {"id", *columns}))]
@@ -0,0 +1 @@
+"""This folder contains the optional GraphQL API, that requires the ```graphql``` extra."""
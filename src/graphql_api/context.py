@@ -0,0 +1,104 @@
+"""Request context and data loaders of the GraphQL API."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+from strawberry.fastapi import BaseContext
+
+from src.models.article_model import Article
+from src.models.project_model import Project
+from src.models.skill_model import Skill
+from src.services.articles_service import articles_service
+from src.services.projects_service import projects_service
+from src.services.skills_service import skills_service
+
+BatchLoader = Callable[[List[int], AsyncSession, Optional[List[str]]], Awaitable[List[Any]]]
+
+BATCH_LOADERS: Dict[Any, BatchLoader] = {
+    Article: articles_service.get_articles_by_ids,
+    Project: projects_service.get_projects_by_ids,
+    Skill: skills_service.get_skills_by_ids,
+}
+
+
+class GraphQLContext(BaseContext):
+    """The context of a single GraphQL request.
+
+    Provides the data loaders, that batch and de-duplicate the loads of the request.
+    The loaders share the session of the request, which is why its usage is serialized.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        """Initiate a new instance.
+
+        Args:
+            db_session (AsyncSession): The session for the DB of the current request.
+        """
+        super().__init__()
+        self.db_session = db_session
+        self.session_lock = asyncio.Lock()
+        self.__loaders: Dict[Tuple[Any, FrozenSet[str]], DataLoader] = {}
+        self.article_content_loader: DataLoader[int, Optional[str]] = DataLoader(self.__load_article_contents)
+
+    def loader(self, model: Any, columns: FrozenSet[str]) -> DataLoader:
+        """Get the data loader for the model, that loads the specified columns.
+
+        Args:
+            model (Any): The model to load.
+            columns (FrozenSet[str]): The columns to load.
+
+        Returns:
+            DataLoader: The data loader, that is created on first use.
+        """
+        key = (model, columns)
+        if key not in self.__loaders:
+            self.__loaders[key] = DataLoader(self.__batch_load_fn(model, columns))
+        return self.__loaders[key]
+
+    async def run(self, service_call: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        """Execute the service call with the session of the request.
+
+        Args:
+            service_call (Callable[[AsyncSession], Awaitable[Any]]): The call to execute.
+
+        Returns:
+            Any: The result of the call.
+        """
+        async with self.session_lock:
+            return await service_call(self.db_session)
+
+    def __batch_load_fn(
+        self, model: Any, columns: FrozenSet[str]
+    ) -> Callable[[List[int]], Awaitable[List[Any]]]:
+        """Create the batch function for the data loader of the model.
+
+        Args:
+            model (Any): The model to load.
+            columns (FrozenSet[str]): The columns to load.
+
+        Returns:
+            Callable[[List[int]], Awaitable[List[Any]]]: The batch function.
+        """
+        batch_loader = BATCH_LOADERS[model]
+
+        async def load(ids: List[int]) -> List[Any]:
+            rows = await self.run(lambda db_session: batch_loader(list(ids), db_session, sorted(columns)))
+            rows_by_id = {row.id: row for row in rows}
+            return [rows_by_id.get(id) for id in ids]
+
+        return load
+
+    async def __load_article_contents(self, article_ids: List[int]) -> List[Optional[str]]:
+        """Load the contents of the articles.
+
+        Args:
+            article_ids (List[int]): The IDs of the articles.
+
+        Returns:
+            List[Optional[str]]: The contents in the order of the IDs.
+        """
+        contents = await self.run(
+            lambda db_session: articles_service.get_article_contents(list(article_ids), db_session)
+        )
+        return [contents.get(article_id) for article_id in article_ids]
@@ -0,0 +1,113 @@
+"""Validation rule limiting the cost of GraphQL queries."""
+from typing import Any, Optional
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    IntValueNode,
+    ListValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValidationRule,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+)
+
+from src.config.settings import settings
+
+
+class QueryCostLimiter(ValidationRule):
+    """Rejects queries, whose estimated cost exceeds ```GRAPHQL_MAX_COST```.
+
+    Every requested field costs one unit, multiplied by the number of items its
+    parents can return. The number of items of a list field is derived from its
+    ```ids``` or ```limit``` argument, falling back to the maximum in case a
+    variable is used and to the default of the ```limit``` argument otherwise.
+    """
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args: Any) -> None:
+        """Calculate the cost of the operation.
+
+        Args:
+            node (OperationDefinitionNode): The operation to validate.
+            _args (Any): The remaining arguments passed by the visitor.
+        """
+        cost = self.__cost(node.selection_set, self.context.schema.get_root_type(node.operation), 1)
+        if cost > settings.GRAPHQL_MAX_COST:
+            self.report_error(
+                GraphQLError(
+                    f"Query cost of {cost} exceeds the maximum of {settings.GRAPHQL_MAX_COST}",
+                    node,
+                )
+            )
+
+    def __cost(
+        self,
+        selection_set: Optional[SelectionSetNode],
+        parent_type: Optional[GraphQLNamedType],
+        multiplier: int,
+    ) -> int:
+        """Calculate the cost of the selections.
+
+        Args:
+            selection_set (Optional[SelectionSetNode]): The selections to calculate the cost for.
+            parent_type (Optional[GraphQLNamedType]): The type the selections are conducted on.
+            multiplier (int): The number of items the parent fields can return.
+
+        Returns:
+            int: The cost of the selections.
+        """
+        if selection_set is None or not isinstance(parent_type, GraphQLObjectType):
+            return 0
+
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field = parent_type.fields.get(selection.name.value)
+                if field is None:
+                    continue
+                cost += multiplier + self.__cost(
+                    selection.selection_set,
+                    get_named_type(field.type),
+                    multiplier * self.__items(selection, field),
+                )
+            elif isinstance(selection, InlineFragmentNode):
+                cost += self.__cost(selection.selection_set, parent_type, multiplier)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.context.get_fragment(selection.name.value)
+                if fragment is not None:
+                    cost += self.__cost(fragment.selection_set, parent_type, multiplier)
+        return cost
+
+    @staticmethod
+    def __items(selection: FieldNode, field: GraphQLField) -> int:
+        """Estimate the number of items the field returns.
+
+        Args:
+            selection (FieldNode): The selection of the field in the query.
+            field (GraphQLField): The definition of the field in the schema.
+
+        Returns:
+            int: The estimated number of items.
+        """
+        if not is_list_type(get_nullable_type(field.type)):
+            return 1
+
+        arguments = {argument.name.value: argument.value for argument in selection.arguments or []}
+        if "ids" in arguments:
+            ids = arguments["ids"]
+            return max(1, len(ids.values)) if isinstance(ids, ListValueNode) else settings.BATCH_MAX_IDS
+        if "limit" in arguments:
+            limit = arguments["limit"]
+            if isinstance(limit, IntValueNode):
+                return max(1, min(int(limit.value), settings.GRAPHQL_MAX_LIMIT))
+            return settings.GRAPHQL_MAX_LIMIT
+        if "limit" in field.args and isinstance(field.args["limit"].default_value, int):
+            return max(1, field.args["limit"].default_value)
+        return 1
@@ -0,0 +1,228 @@
+"""Schema of the GraphQL API."""
+from datetime import date
+from typing import Any, FrozenSet, List, Optional
+
+import strawberry
+from strawberry.extensions import AddValidationRules, QueryDepthLimiter
+from strawberry.schema.config import StrawberryConfig
+from strawberry.types import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+
+from src.config.settings import settings
+from src.graphql_api.context import GraphQLContext
+from src.graphql_api.cost import QueryCostLimiter
+from src.models.article_model import Article
+from src.models.project_model import Project
+from src.models.skill_model import Skill
+from src.services.articles_service import articles_service
+from src.services.projects_service import projects_service
+from src.services.skills_service import skills_service
+
+
+@strawberry.type
+class Tag:
+    """A tag of an article or project."""
+
+    icon_name: str
+    name: str
+
+
+def to_tags(tags: Optional[List[dict]]) -> List[Tag]:
+    """Convert the tags stored in the database.
+
+    Args:
+        tags (Optional[List[dict]]): The tags as stored in the JSONB column.
+
+    Returns:
+        List[Tag]: The converted tags.
+    """
+    return [Tag(icon_name=tag["icon_name"], name=tag["name"]) for tag in tags or []]
+
+
+@strawberry.type(name="Article")
+class ArticleNode:
+    """An article, the content is only loaded in case it is requested."""
+
+    id: int
+    title: Optional[str]
+    author: Optional[str]
+    image_url: Optional[str]
+    description: Optional[str]
+    created_at: date
+    updated_at: Optional[date]
+
+    @strawberry.field
+    def tags(self) -> List[Tag]:
+        """Resolve the tags of the article."""
+        return to_tags(self.tags)  # type: ignore[arg-type]
+
+    @strawberry.field
+    async def content(self, info: Info[GraphQLContext, None]) -> Optional[str]:
+        """Resolve the content of the article using the batching data loader."""
+        return await info.context.article_content_loader.load(self.id)  # type: ignore[no-any-return]
+
+
+@strawberry.type(name="Project")
+class ProjectNode:
+    """A project."""
+
+    id: int
+    title: Optional[str]
+    image_url: Optional[str]
+    description: Optional[str]
+    project_url: Optional[str]
+
+    @strawberry.field
+    def tags(self) -> List[Tag]:
+        """Resolve the tags of the project."""
+        return to_tags(self.tags)  # type: ignore[arg-type]
+
+
+@strawberry.type(name="Skill")
+class SkillNode:
+    """A skill."""
+
+    id: int
+    name: Optional[str]
+    category: Optional[str]
+    experience: Optional[int]
+
+
+def requested_columns(info: Info, model: Any) -> FrozenSet[str]:
+    """Get the columns of the model, that are requested by the query.
+
+    Args:
+        info (Info): The information about the currently resolved field.
+        model (Any): The model, whose columns should be obtained.
+
+    Returns:
+        FrozenSet[str]: The names of the requested columns.
+    """
+    column_names = set(model.__table__.columns.keys())
+    requested = set()
+    selections = list(info.selected_fields[0].selections)
+    while selections:
+        selection = selections.pop()
+        if isinstance(selection, (FragmentSpread, InlineFragment)):
+            selections.extend(selection.selections)
+        elif isinstance(selection, SelectedField) and selection.name in column_names:
+            requested.add(selection.name)
+    return frozenset(requested)
+
+
+async def load_one(info: Info[GraphQLContext, None], model: Any, id: int) -> Any:
+    """Load a single row through the data loader of the request.
+
+    Args:
+        info (Info[GraphQLContext, None]): The information about the currently resolved field.
+        model (Any): The model to load.
+        id (int): The ID of the row.
+
+    Returns:
+        Any: The loaded row or ```None```.
+    """
+    return await info.context.loader(model, requested_columns(info, model)).load(id)
+
+
+async def load_list(
+    info: Info[GraphQLContext, None], model: Any, ids: Optional[List[int]], skip: int, limit: int
+) -> List[Any]:
+    """Load several rows, either by their IDs or paginated.
+
+    Args:
+        info (Info[GraphQLContext, None]): The information about the currently resolved field.
+        model (Any): The model to load.
+        ids (Optional[List[int]]): The IDs of the rows to load.
+        skip (int): The number of rows to skip, in case no IDs are provided.
+        limit (int): The maximum number of rows, in case no IDs are provided.
+
+    Raises:
+        ValueError: Too many IDs or a too large limit requested.
+
+    Returns:
+        List[Any]: The loaded rows.
+    """
+    columns = requested_columns(info, model)
+    loader = info.context.loader(model, columns)
+
+    if ids is not None:
+        if len(ids) > settings.BATCH_MAX_IDS:
+            raise ValueError(f"At most {settings.BATCH_MAX_IDS} IDs can be requested at once")
+        rows = await loader.load_many(list(dict.fromkeys(ids)))
+        return [row for row in rows if row is not None]
+
+    if limit > settings.GRAPHQL_MAX_LIMIT:
+        raise ValueError(f"The limit must not exceed {settings.GRAPHQL_MAX_LIMIT}")
+    list_service_calls = {
+        Article: articles_service.get_articles,
+        Project: projects_service.get_projects,
+        Skill: skills_service.get_skills,
+    }
+    rows = await info.context.run(
+        lambda db_session: list_service_calls[model](skip, limit, db_session, sorted(columns))
+    )
+    loader.prime_many({row.id: row for row in rows or []})
+    return rows or []
+
+
+@strawberry.type
+class Query:
+    """The entry points of the GraphQL API."""
+
+    @strawberry.field
+    async def article(self, info: Info[GraphQLContext, None], id: int) -> Optional[ArticleNode]:
+        """Get the specified article."""
+        return await load_one(info, Article, id)  # type: ignore[no-any-return]
+
+    @strawberry.field
+    async def articles(
+        self,
+        info: Info[GraphQLContext, None],
+        ids: Optional[List[int]] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[ArticleNode]:
+        """Get the specified articles, or all articles paginated in case no IDs are provided."""
+        return await load_list(info, Article, ids, skip, limit)
+
+    @strawberry.field
+    async def project(self, info: Info[GraphQLContext, None], id: int) -> Optional[ProjectNode]:
+        """Get the specified project."""
+        return await load_one(info, Project, id)  # type: ignore[no-any-return]
+
+    @strawberry.field
+    async def projects(
+        self,
+        info: Info[GraphQLContext, None],
+        ids: Optional[List[int]] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[ProjectNode]:
+        """Get the specified projects, or all projects paginated in case no IDs are provided."""
+        return await load_list(info, Project, ids, skip, limit)
+
+    @strawberry.field
+    async def skill(self, info: Info[GraphQLContext, None], id: int) -> Optional[SkillNode]:
+        """Get the specified skill."""
+        return await load_one(info, Skill, id)  # type: ignore[no-any-return]
+
+    @strawberry.field
+    async def skills(
+        self,
+        info: Info[GraphQLContext, None],
+        ids: Optional[List[int]] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> List[SkillNode]:
+        """Get the specified skills, or all skills paginated in case no IDs are provided."""
+        return await load_list(info, Skill, ids, skip, limit)
+
+
+schema = strawberry.Schema(
+    query=Query,
+    config=StrawberryConfig(auto_camel_case=False),
+    extensions=[
+        QueryDepthLimiter(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        AddValidationRules([QueryCostLimiter]),
+    ],
+)
@@ -1,11 +1,26 @@
 """Initializes the App with the provided configurations and middlewares."""
+from importlib.util import find_spec
+
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
+from src.config.logging_config import configure_logging
 from src.config.settings import settings
+from src.db.base import engine
+from src.middlewares.access_log_middleware import AccessLogMiddleware, track_db_time
+from src.middlewares.concurrency_limit_middleware import ConcurrencyLimitMiddleware
+from src.middlewares.profiling_middleware import ProfilingMiddleware
+from src.routers import well_known_route
 from src.routers.api import api_open_tag_information, api_router
+from src.services.article_views_service import article_views_service
+from src.services.token_revocation_service import token_revocation_service
+from src.util.loop_monitor import event_loop_monitor
+from src.util.tracing import TRACING_AVAILABLE, configure_tracing
+
+# Formats and writes the logs in a separate thread
+log_listener = configure_logging()
 
 # Init the Sentry client
 sentry_sdk.init(
@@ -14,6 +29,7 @@ sentry_sdk.init(
 )
 
 # Init the app
+api_open_tag_information.append(well_known_route.TAG_INFORMATION)
 app = FastAPI(
     title=settings.API_NAME,
     description=settings.API_DESC,
@@ -28,10 +44,42 @@ app = FastAPI(
 )
 
 # Add the middlewares to the chain
+# Innermost, so that rejected requests are logged and contain the CORS headers
+if settings.CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(ConcurrencyLimitMiddleware)
 # TODO: Configure CORS correctly
 app.add_middleware(CORSMiddleware)
 app.add_middleware(GZipMiddleware)
+# The profiler is optional and requires the profiling extra
+if settings.PROFILING_ENABLED and find_spec("pyinstrument") is not None:
+    app.add_middleware(ProfilingMiddleware)
+# Outermost, to measure the whole handling of the request
+app.add_middleware(AccessLogMiddleware)
+track_db_time(engine)
+# The tracing is optional and requires the tracing extra
+if TRACING_AVAILABLE:
+    configure_tracing(app, engine)
 
 
 # Attach all the routers
 app.include_router(api_router, prefix=settings.API_PATH)
+# The well-known locations are defined relative to the host
+app.include_router(well_known_route.router)
+
+
+@app.on_event("startup")
+async def start_background_tasks() -> None:
+    """Start the tasks running in the background of the app."""
+    log_listener.start()
+    await article_views_service.start()
+    await token_revocation_service.start()
+    await event_loop_monitor.start()
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks() -> None:
+    """Stop the background tasks, flushing the data they still hold."""
+    await event_loop_monitor.stop()
+    await token_revocation_service.stop()
+    await article_views_service.stop()
+    log_listener.stop()
@@ -0,0 +1 @@
+"""This folder contains the ASGI middlewares, that are wrapped around the whole API."""
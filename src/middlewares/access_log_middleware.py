@@ -0,0 +1,135 @@
+"""Middleware for logging the handled requests."""
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import settings
+
+logger = logging.getLogger("src.access")
+
+# The accumulated duration of the DB statements executed for the current request
+db_durations: ContextVar[Optional[List[float]]] = ContextVar("db_durations", default=None)
+
+
+def track_db_time(engine: AsyncEngine) -> None:
+    """Measure the duration of every statement executed by the engine for the access log.
+
+    Args:
+        engine (AsyncEngine): The engine, whose statements are measured.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(conn: Any, *args: Any) -> None:
+        conn.info.setdefault("statement_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def stop_timer(conn: Any, *args: Any) -> None:
+        duration = time.perf_counter() - conn.info["statement_start"].pop()
+        durations = db_durations.get()
+        if durations is not None:
+            durations[0] += duration
+
+
+class AccessLogMiddleware:
+    """Logs every handled request as structured record.
+
+    Successful ```GET``` and ```HEAD``` requests are only logged with the
+    ```ACCESS_LOG_SAMPLE_RATE```, all other requests and all errors are logged.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initiate a new instance.
+
+        Args:
+            app (ASGIApp): The app to wrap.
+        """
+        self.app = app
+        self.__route_paths: Optional[Dict[Callable[..., Any], str]] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request and log it afterwards.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for receiving messages.
+            send (Send): The channel for sending messages.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        response: Dict[str, int] = {"status": 500, "bytes": 0}
+        durations = [0.0]
+        db_durations.set(durations)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.__log(
+                scope, response["status"], response["bytes"], time.perf_counter() - start, durations[0]
+            )
+
+    def __log(self, scope: Scope, status: int, sent_bytes: int, duration: float, db_duration: float) -> None:
+        """Log the request, in case it is not skipped by the sampling.
+
+        Args:
+            scope (Scope): The connection scope.
+            status (int): The status of the response.
+            sent_bytes (int): The number of bytes in the response body.
+            duration (float): The duration of handling the request in seconds.
+            db_duration (float): The duration of the DB statements in seconds.
+        """
+        sampled = status < 400 and scope["method"] in ("GET", "HEAD")
+        if sampled and random.random() >= settings.ACCESS_LOG_SAMPLE_RATE:
+            return
+
+        logger.log(
+            logging.ERROR if status >= 500 else logging.INFO,
+            "%s %s %d",
+            scope["method"],
+            scope["path"],
+            status,
+            extra={
+                "method": scope["method"],
+                "route": self.__route_path(scope),
+                "status": status,
+                "latency_ms": round(duration * 1000, 3),
+                "db_ms": round(db_duration * 1000, 3),
+                "bytes": sent_bytes,
+                "user": scope.get("state", {}).get("user"),
+                "sample_rate": settings.ACCESS_LOG_SAMPLE_RATE if sampled else 1,
+            },
+        )
+
+    def __route_path(self, scope: Scope) -> Optional[str]:
+        """Get the path template of the route, that handled the request.
+
+        Args:
+            scope (Scope): The connection scope, containing the endpoint after routing.
+
+        Returns:
+            Optional[str]: The path template, ```None``` in case no route matched.
+        """
+        if self.__route_paths is None:
+            routes: List[BaseRoute] = getattr(scope.get("app"), "routes", [])
+            self.__route_paths = {
+                route.endpoint: route.path
+                for route in routes
+                if hasattr(route, "endpoint") and hasattr(route, "path")
+            }
+        return self.__route_paths.get(scope.get("endpoint"))  # type: ignore[arg-type]
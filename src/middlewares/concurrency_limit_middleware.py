@@ -0,0 +1,132 @@
+"""Middleware for limiting the number of concurrently handled requests."""
+import json
+import time
+from typing import Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import settings
+from src.middlewares.access_log_middleware import db_durations
+from src.util.adaptive_limiter import AdaptiveLimiter
+from src.util.metrics import metrics
+
+ROUTE_CLASSES = ("read", "write", "auth")
+
+# The limiters of the route classes, since reads, writes and logins differ widely in their latency
+limiters: Dict[str, AdaptiveLimiter] = {route_class: AdaptiveLimiter() for route_class in ROUTE_CLASSES}
+
+limit_gauge = metrics.gauge("concurrency_limit", "Current concurrency limit", ("route_class",))
+in_flight_gauge = metrics.gauge("concurrency_in_flight", "Number of requests being handled", ("route_class",))
+shed_counter = metrics.counter(
+    "requests_shed_total", "Number of requests rejected due to the concurrency limit", ("route_class",)
+)
+
+
+def get_route_class(scope: Scope) -> str:
+    """Classify the request for choosing its limiter.
+
+    Args:
+        scope (Scope): The connection scope.
+
+    Returns:
+        str: The class of the route, one of ```ROUTE_CLASSES```.
+    """
+    if scope["path"].startswith(f"{settings.API_PATH}/auth"):
+        return "auth"
+    if scope["method"] in ("GET", "HEAD", "OPTIONS"):
+        return "read"
+    return "write"
+
+
+class ConcurrencyLimitMiddleware:
+    """Limits the number of concurrently handled requests per route class.
+
+    Requests exceeding the adaptive limit wait in a short queue. In case the queue is
+    full or they waited too long, they are rejected with ```503``` and ```Retry-After```
+    before any work has been done, so that the accepted requests keep a low latency.
+
+    Only successful requests, that executed DB statements, and requests exceeding their
+    deadline adapt the limit. The latency of cached, not modified or invalid requests does
+    not reflect the load of the database, neither do the requests of disconnected clients.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initiate a new instance.
+
+        Args:
+            app (ASGIApp): The app to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request, in case the limit of its route class allows it.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for receiving messages.
+            send (Send): The channel for sending messages.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = get_route_class(scope)
+        limiter = limiters[route_class]
+        if not await limiter.acquire():
+            shed_counter.inc(route_class)
+            await self.__reject(send)
+            return
+
+        in_flight_gauge.set(limiter.in_flight, route_class)
+        start = time.perf_counter()
+        response = {"status": 500}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            overloaded = response["status"] == 504
+            if overloaded or self.__reflects_load(response["status"]):
+                limiter.release(time.perf_counter() - start, overloaded)
+            else:
+                limiter.release()
+            limit_gauge.set(limiter.limit, route_class)
+            in_flight_gauge.set(limiter.in_flight, route_class)
+
+    @staticmethod
+    def __reflects_load(status: int) -> bool:
+        """Check, whether the latency of the request reflects the load of the database.
+
+        Args:
+            status (int): The status of the response.
+
+        Returns:
+            bool: ```True``` in case the request succeeded and executed DB statements. In case
+                the DB time is not tracked, all successful requests are considered.
+        """
+        durations = db_durations.get()
+        return 200 <= status < 300 and (durations is None or durations[0] > 0)
+
+    async def __reject(self, send: Send) -> None:
+        """Send the response for a rejected request.
+
+        Args:
+            send (Send): The channel for sending messages.
+        """
+        body = json.dumps({"detail": "The service is overloaded, please retry later"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(settings.CONCURRENCY_RETRY_AFTER_SECONDS).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
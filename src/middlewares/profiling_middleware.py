@@ -0,0 +1,148 @@
+"""Middleware for profiling single requests on demand."""
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from fastapi import HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import settings
+from src.services.token_service import token_service
+from src.util.jwt_authentication import JWTAuthentication
+
+
+class ProfilingMiddleware:
+    """Runs selected requests under the statistical profiler of ```pyinstrument```.
+
+    A request is profiled, in case it either contains the ```PROFILING_HEADER```
+    together with a valid token of the admin user, or it is sampled with the
+    ```PROFILING_SAMPLE_RATE```. Profiles of requests with the header replace the
+    response with the profile in the speedscope format, sampled profiles are
+    stored in ```PROFILING_OUTPUT_DIR```. All other requests only pay for the
+    lookup of the header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initiate a new instance.
+
+        Args:
+            app (ASGIApp): The app to wrap.
+        """
+        self.app = app
+        self.header = settings.PROFILING_HEADER.lower().encode("latin-1")
+        self.authentication = JWTAuthentication(auto_error=False)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request, profiling it if requested or sampled.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for receiving messages.
+            send (Send): The channel for sending messages.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if any(name == self.header for name, _ in scope["headers"]):
+            if await self.__is_admin(Request(scope)):
+                await self.__return_profile(scope, receive, send)
+                return
+        elif settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE:
+            await self.__store_profile(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    async def __is_admin(self, request: Request) -> bool:
+        """Check whether the request contains a valid token of the admin user.
+
+        Args:
+            request (Request): The request to check.
+
+        Returns:
+            bool: ```True``` in case the request has been made by the admin user.
+        """
+        try:
+            credentials = await self.authentication(request)
+            return token_service.decode_token(credentials.credentials).sub == settings.ADMIN_USER
+        except HTTPException:
+            return False
+
+    async def __return_profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile the request and return the profile instead of the response.
+
+        The status of the actual response is provided in the ```X-Profiled-Status``` header.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for receiving messages.
+            send (Send): The channel for sending messages.
+        """
+        messages: List[Message] = []
+
+        async def discard(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                messages.append(message)
+
+        profile = await self.__profile(scope, receive, discard)
+        profiled_status = messages[0]["status"] if messages else status.HTTP_500_INTERNAL_SERVER_ERROR
+        body = profile.encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_200_OK,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"content-disposition", b'attachment; filename="profile.speedscope.json"'),
+                    (b"cache-control", b"no-store"),
+                    (b"x-profiled-status", str(profiled_status).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def __store_profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile the request and store the profile in the output directory.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for receiving messages.
+            send (Send): The channel for sending messages.
+        """
+        profile = await self.__profile(scope, receive, send)
+        route = scope["path"].strip("/").replace("/", "_") or "root"
+        file_name = f"{time.time_ns()}-{scope['method']}-{route}.speedscope.json"
+        path = Path(settings.PROFILING_OUTPUT_DIR) / file_name
+
+        def write() -> None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(profile)
+
+        await run_in_threadpool(write)
+
+    async def __profile(self, scope: Scope, receive: Receive, send: Send) -> str:
+        """Run the request under the profiler.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for receiving messages.
+            send (Send): The channel for sending messages.
+
+        Returns:
+            str: The profile in the speedscope format.
+        """
+        # Imported lazily, since the profiler is an optional dependency
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        profiler = Profiler(interval=settings.PROFILING_INTERVAL_SECONDS, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+        return profiler.output(SpeedscopeRenderer())  # type: ignore[no-any-return]
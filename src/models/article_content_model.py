@@ -0,0 +1,17 @@
+"""Article content model for the database."""
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+from src.db.base import Base
+
+
+class ArticleContent(Base):
+    """Represents the article contents table in the database.
+
+    The content is stored separately from the article metadata, so that
+    listings do not have to scan the large markdown contents.
+    """
+
+    __tablename__ = "article_contents"
+
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    content = Column(String)
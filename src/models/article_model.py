@@ -1,8 +1,12 @@
 """Article model for the database."""
-from sqlalchemy import Column, Integer, String
+from typing import Optional
+
+from sqlalchemy import Column, Integer, String, inspect
 from sqlalchemy.dialects.postgresql import DATE, JSONB
+from sqlalchemy.orm import relationship
 
 from src.db.base import Base
+from src.models.article_content_model import ArticleContent
 
 
 class Article(Base):
@@ -10,12 +14,50 @@ class Article(Base):
 
     __tablename__ = "articles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String)
     author = Column(String, index=True)
     image_url = Column(String)
     description = Column(String)
-    content = Column(String)
     tags = Column(JSONB)
-    created_at = Column(DATE, nullable=False)
+    created_at = Column(DATE, nullable=False, index=True)
     updated_at = Column(DATE)
+
+    # The content is never loaded implicitly, it needs to be requested
+    # explicitly using ```joinedload(Article.article_content)```
+    article_content = relationship(
+        ArticleContent,
+        uselist=False,
+        lazy="noload",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def content(self) -> Optional[str]:
+        """Get the content of the article.
+
+        Returns:
+            Optional[str]: The content or ```None```, in case the content has not been loaded.
+        """
+        return self.article_content.content if self.article_content is not None else None
+
+    @content.setter
+    def content(self, content: Optional[str]) -> None:
+        """Set the content of the article.
+
+        Every stored article has a content row, a stored article without content has
+        been loaded without it. Creating a new content row would violate its primary key.
+
+        Args:
+            content (Optional[str]): The new content of the article.
+
+        Raises:
+            ValueError: The article is stored, but its content has not been loaded.
+        """
+        if self.article_content is None:
+            if inspect(self).has_identity:
+                raise ValueError("The content needs to be loaded using joinedload(Article.article_content)")
+            self.article_content = ArticleContent(content=content)
+        else:
+            self.article_content.content = content
@@ -0,0 +1,23 @@
+"""Article view model for the database."""
+from sqlalchemy import BigInteger, Column, Float, ForeignKey, Index, Integer
+
+from src.db.base import Base
+
+
+class ArticleView(Base):
+    """Represents the article views table in the database.
+
+    The views are stored separately from the article metadata, so that the
+    frequent counter updates do not rewrite the article rows. ```popularity```
+    is the logarithm of the views, each weighted by its exponential decay relative
+    to a fixed epoch. Since the decay of all articles progresses equally, ordering
+    by it ranks by the time-decayed views without ever rewriting old rows.
+    """
+
+    __tablename__ = "article_views"
+
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    views = Column(BigInteger, nullable=False, default=0)
+    popularity = Column(Float, nullable=False)
+
+    __table_args__ = (Index("ix_article_views_popularity", popularity.desc()),)
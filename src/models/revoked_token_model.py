@@ -0,0 +1,23 @@
+"""Revoked token model for the database."""
+from sqlalchemy import Column, DateTime, Index, String, func
+
+from src.db.base import Base
+
+
+class RevokedToken(Base):
+    """Represents the revoked tokens table in the database.
+
+    A token is identified by its ```jti``` claim. The row is only needed until the
+    token expires, afterwards the token is rejected anyway and the row is deleted.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(32), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_revoked_tokens_expires_at", expires_at),
+        Index("ix_revoked_tokens_revoked_at", revoked_at),
+    )
@@ -1,5 +1,5 @@
 """User model for the database."""
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 
 from src.db.base import Base
 
@@ -9,7 +9,9 @@ class Skill(Base):
 
     __tablename__ = "skills"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, index=True)
     category = Column(String)
     experience = Column(Integer)
+
+    __table_args__ = (Index("ix_skills_category_experience", category, experience.desc()),)
@@ -2,7 +2,7 @@
 import hmac
 
 import bcrypt
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String, func
 
 from src.db.base import Base
 
@@ -12,10 +12,27 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, index=True)
+    id = Column(Integer, primary_key=True)
+    email = Column(String)
     password = Column(String)
 
+    __table_args__ = (Index("ix_users_email_lower", func.lower(email), unique=True),)
+
+    @staticmethod
+    def generate_password_hash(password: str) -> str:
+        """Hash the password using bcrypt.
+
+        The hashing is CPU intensive and should not be executed directly
+        on the event loop.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The salted hash of the password.
+        """
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
     @property
     def hash_password(self) -> None:
         """Init the property.
@@ -35,7 +52,7 @@ class User(Base):
         Args:
             hash_password (str): The password to hash.
         """
-        self.password = bcrypt.hashpw(hash_password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        self.password = self.generate_password_hash(hash_password)
 
     def verify_password(self, password: str) -> bool:
         """Verify the password.
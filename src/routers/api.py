@@ -1,11 +1,16 @@
 """Provides a new router instance, containing all the endpoints available."""
+from importlib.util import find_spec
 from typing import Dict, List
 
 from fastapi import APIRouter, Depends
 
+from src.config.settings import settings
 from src.routers.v1 import (
     articles_route,
     auth_route,
+    feeds_route,
+    metrics_route,
+    overview_route,
     projects_route,
     skills_route,
     user_route,
@@ -17,30 +22,63 @@ api_open_tag_information: List[Dict[str, str]] = []
 
 # Add the routers
 api_router.include_router(auth_route.router, prefix="/auth", tags=["auth"])
+# The feeds are polled by feed readers and crawlers, that can not authenticate
+api_router.include_router(feeds_route.router)
+# Anonymous reads of the content do not run the token verification at all
+api_router.include_router(articles_route.public_router, prefix="/articles")
 api_router.include_router(
     articles_route.router,
     prefix="/articles",
     dependencies=[Depends(JWTAuthentication(auto_error=False))],
 )
+api_router.include_router(projects_route.public_router, prefix="/projects")
 api_router.include_router(
     projects_route.router,
     prefix="/projects",
     dependencies=[Depends(JWTAuthentication(auto_error=False))],
 )
+api_router.include_router(skills_route.public_router, prefix="/skills")
 api_router.include_router(
     skills_route.router,
     prefix="/skills",
     dependencies=[Depends(JWTAuthentication(auto_error=False))],
 )
+api_router.include_router(
+    overview_route.router,
+    prefix="/overview",
+    dependencies=[Depends(JWTAuthentication(auto_error=False))],
+)
+api_router.include_router(
+    metrics_route.router,
+    prefix="/metrics",
+    dependencies=[Depends(JWTAuthentication(auto_error=False))],
+)
 api_router.include_router(
     user_route.router,
     prefix="/users",
     dependencies=[Depends(JWTAuthentication(auto_error=False))],
 )
 
+# The GraphQL endpoint is optional and requires the graphql extra
+GRAPHQL_AVAILABLE = settings.GRAPHQL_ENABLED and find_spec("strawberry") is not None
+if GRAPHQL_AVAILABLE:
+    from src.routers.v1 import graphql_route
+
+    api_router.include_router(
+        graphql_route.router,
+        prefix="/graphql",
+        tags=[graphql_route.TAG_INFORMATION["name"]],
+        dependencies=[Depends(JWTAuthentication(auto_error=False))],
+    )
+
 # Add the open tag information to the array
 api_open_tag_information.append(auth_route.TAG_INFORMATION)
 api_open_tag_information.append(articles_route.TAG_INFORMATION)
 api_open_tag_information.append(projects_route.TAG_INFORMATION)
 api_open_tag_information.append(skills_route.TAG_INFORMATION)
+api_open_tag_information.append(overview_route.TAG_INFORMATION)
 api_open_tag_information.append(user_route.TAG_INFORMATION)
+api_open_tag_information.append(feeds_route.TAG_INFORMATION)
+api_open_tag_information.append(metrics_route.TAG_INFORMATION)
+if GRAPHQL_AVAILABLE:
+    api_open_tag_information.append(graphql_route.TAG_INFORMATION)
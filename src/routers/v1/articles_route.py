@@ -1,29 +1,67 @@
 """All article related endpoints."""
-from typing import List, Union
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.base import get_session
+from src.config.settings import settings
+from src.db.base import SessionReleasingRoute, get_session
 from src.schemas.articles_schema import (
     ArticleCreated,
     ArticleDB,
     ArticleDeleted,
     ArticleUpdated,
     CreateArticle,
+    PopularArticle,
+    RelatedArticle,
     UpdateArticle,
 )
+from src.schemas.return_schema import ReturnPreference
+from src.services.article_views_service import article_views_service
 from src.services.articles_service import articles_service
+from src.services.count_service import count_service
+from src.services.related_articles_service import related_articles_service
+from src.util.batch_ids import parse_ids, report_missing_ids
 
 TAG_INFORMATION = {
     "name": "articles",
     "description": "This endpoint can be used to manage articles",
 }
 
-router = APIRouter(tags=[TAG_INFORMATION["name"]])
+# The reads are public, the writes are included with the authentication
+public_router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
 
 
-@router.get(
+@public_router.get(
+    "/popular",
+    summary="Get the popular articles",
+    description="Get the articles with the most views, recent views weighing more than older ones",
+    status_code=status.HTTP_200_OK,
+    response_model=List[PopularArticle],
+)
+async def get_popular_articles(
+    limit: int = Query(default=10, ge=1, le=100, description="The maximum number of articles to return"),
+    db_session: AsyncSession = Depends(get_session),
+) -> List[PopularArticle]:
+    """Endpoint for obtaining the articles with the most time-decayed views.
+
+    The views are counted in memory and flushed periodically, recent views might
+    therefore not be considered yet.
+
+    Args:
+        limit (int, optional): The maximum number of articles to return. Defaults to 10.
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        List[PopularArticle]: The popular articles, most popular first.
+    """
+    articles = await article_views_service.get_popular_articles(limit, db_session)
+    return articles
+
+
+@public_router.get(
     "/{article_id}",
     summary="Get the specified article",
     description="Get the specified article from the database",
@@ -36,6 +74,8 @@ async def get_article(
 ) -> ArticleDB:
     """Endpoint for obtaining the specified article from the database.
 
+    Counts the view of the article, which is written to the DB asynchronously.
+
     Args:
         article_id (int, optional): The ID of the article to obtain.
         db_session (AsyncSession, optional): The session for the DB that will
@@ -45,10 +85,44 @@ async def get_article(
         ArticleDB: The obtained article or nothing, in case nothing matches the ID.
     """
     article = await articles_service.get_article(article_id, db_session)
+    if article is not None:
+        article_views_service.count_view(article_id)
     return article
 
 
-@router.get(
+@public_router.get(
+    "/{article_id}/related",
+    summary="Get the related articles",
+    description="Get the articles sharing the most tags with the specified article",
+    status_code=status.HTTP_200_OK,
+    response_model=List[RelatedArticle],
+)
+async def get_related_articles(
+    article_id: int = Path(description="The ID of the article to obtain the related articles for."),
+    limit: int = Query(
+        default=5,
+        ge=1,
+        le=settings.RELATED_ARTICLES_TOP_K,
+        description="The maximum number of related articles to return",
+    ),
+    db_session: AsyncSession = Depends(get_session),
+) -> List[RelatedArticle]:
+    """Endpoint for obtaining the articles that share the most tags with the specified article.
+
+    Args:
+        article_id (int, optional): The ID of the article to obtain the related articles for.
+        limit (int, optional): The maximum number of related articles to return. Defaults to 5.
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        List[RelatedArticle]: The related articles, most similar first.
+    """
+    articles = await related_articles_service.get_related_articles(article_id, limit, db_session)
+    return articles
+
+
+@public_router.get(
     "/",
     summary="Get all articles",
     description="Get all articles stored in the database",
@@ -56,22 +130,44 @@ async def get_article(
     response_model=List[ArticleDB],
 )
 async def get_articles(
+    response: Response,
     db_session: AsyncSession = Depends(get_session),
-    skip: int = Query(default=0, description="The number of items to skip in the article table"),
-    limit: int = Query(default=100, description="The maximum number to return from the article table"),
+    skip: int = Query(default=0, ge=0, description="The number of items to skip in the article table"),
+    limit: int = Query(
+        default=100, ge=1, le=100, description="The maximum number to return from the article table"
+    ),
+    article_ids: Optional[List[int]] = Depends(parse_ids),
+    total: bool = Query(
+        default=False, description="Whether to return the total number in ```X-Total-Count```"
+    ),
 ) -> Union[List[ArticleDB], None]:
     """Endpoint for obtaining all the articles in the database.
 
     Args:
+        response (Response): The response, used for reporting missing IDs and the total count.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
         skip (int, optional): The number of items to skip. Defaults to 0.
         limit (int, optional): The maximum number of items to return. Defaults to 100.
+        article_ids (Optional[List[int]], optional): The IDs of the articles to obtain. In case they are
+            provided, only these articles are returned in the requested order, ```skip``` and ```limit```
+            are ignored and the IDs that were not found are reported in the ```X-Missing-IDs``` header.
+        total (bool, optional): Whether to add the total number of articles in the ```X-Total-Count```
+            header. It is estimated for large tables, which is indicated by ```X-Total-Count-Type```.
+            Defaults to ```False```.
 
     Returns:
         List[ArticleDB]: The list of articles obtained from the DB.
     """
+    if article_ids is not None:
+        articles = await articles_service.get_articles_by_ids(article_ids, db_session)
+        report_missing_ids(response, article_ids, (article.id for article in articles))
+        return articles  # type: ignore[return-value]
+
     articles = await articles_service.get_articles(skip, limit, db_session)
+    if total:
+        total_count = await articles_service.count_articles(db_session)
+        count_service.add_total_count_headers(response, total_count)
     return articles  # type: ignore[no-any-return]
 
 
@@ -104,25 +200,37 @@ async def add_article(
     summary="Updates an article",
     description="Updated the specified article with the information provided",
     status_code=status.HTTP_200_OK,
-    response_model=ArticleUpdated,
+    response_model=Union[ArticleDB, ArticleUpdated],
 )
 async def update_article(
     article: UpdateArticle,
     article_id: int = Path(description="The ID of the article to update."),
+    return_preference: ReturnPreference = Query(
+        default=ReturnPreference.MINIMAL,
+        alias="return",
+        description="Use ```representation``` to obtain the updated article instead of the status.",
+    ),
     db_session: AsyncSession = Depends(get_session),
-) -> UpdateArticle:
+) -> Union[ArticleDB, ArticleUpdated]:
     """Endpoint to update an article in the database.
 
     Args:
         article (UpdateArticle): The information to update on the specified article.
         article_id (int): The id of the article to update.
+        return_preference (ReturnPreference, optional): Whether to return the updated article
+            or only the status. Defaults to ```minimal```.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
 
     Returns:
-        UpdateArticle: The status of the update.
+        Union[ArticleDB, ArticleUpdated]: The updated article or the status of the update.
     """
-    article = await articles_service.update_article(article_id, article, db_session)
+    article = await articles_service.update_article(
+        article_id,
+        article,
+        db_session,
+        return_representation=return_preference == ReturnPreference.REPRESENTATION,
+    )
     return article
 
 
@@ -1,17 +1,23 @@
 """All authentication related endpoints."""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.base import get_session
-from src.schemas.auth_schema import AuthSchema, AuthTokenSchema, RefreshSchema
+from src.db.base import SessionReleasingRoute, get_session
+from src.schemas.auth_schema import (
+    AuthSchema,
+    AuthTokenSchema,
+    RefreshSchema,
+    RevokeSchema,
+)
 from src.services.auth_service import auth_service
+from src.util.rate_limiter import login_rate_limiter
 
 TAG_INFORMATION = {
     "name": "auth",
     "description": "This endpoint can be used to perform the authentication",
 }
 
-router = APIRouter(tags=[TAG_INFORMATION["name"]])
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
 
 
 @router.post(
@@ -20,14 +26,20 @@ router = APIRouter(tags=[TAG_INFORMATION["name"]])
     description="Provide your email and password to obtain a token that can be used for secured endpoints.",
     status_code=status.HTTP_200_OK,
     response_model=AuthTokenSchema,
+    responses={status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Too many login attempts"}},
 )
 async def authentication(
+    request: Request,
     auth_data: AuthSchema,
     db_session: AsyncSession = Depends(get_session),
 ) -> AuthTokenSchema:
     """Endpoint for conducting the authentication.
 
+    The rate limits are checked before the database is accessed, so that rejected attempts
+    are answered without any query or password hashing.
+
     Args:
+        request (Request): The current request object, used for identifying the client.
         auth_data (AuthSchema): JSON that contains the mail address and password of the user.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
@@ -35,6 +47,8 @@ async def authentication(
     Returns:
         AuthTokenSchema: The new issued access and refresh tokens
     """
+    await login_rate_limiter.check(request, auth_data.email)
+
     auth_tokens = await auth_service.authenticate_user(auth_data.email, auth_data.password, db_session)
 
     return auth_tokens
@@ -61,3 +75,26 @@ async def refresh_token(
     auth_tokens = await auth_service.refresh_token(refresh_token.refresh_token)
 
     return auth_tokens
+
+
+@router.post(
+    "/revoke",
+    summary="Revoke a token",
+    description="Provide an access or refresh token to reject it from now on, e.g. on logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+)
+async def revoke_token(revoke_data: RevokeSchema) -> Response:
+    """Endpoint for revoking a token before it expires.
+
+    Possessing the token is sufficient for revoking it.
+
+    Args:
+        revoke_data (RevokeSchema): JSON that contains the token and its type.
+
+    Returns:
+        Response: An empty response.
+    """
+    await auth_service.revoke_token(revoke_data.token, revoke_data.token_type)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
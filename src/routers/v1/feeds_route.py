@@ -0,0 +1,107 @@
+"""All feed related endpoints."""
+from typing import Dict
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.db.base import SessionReleasingRoute, get_session
+from src.services.feeds_service import feeds_service
+from src.util.http_cache import is_not_modified
+
+TAG_INFORMATION = {
+    "name": "feeds",
+    "description": "This endpoint provides the feeds and the sitemap for feed readers and crawlers",
+}
+
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """Get the headers, that allow caching and revalidating the document.
+
+    Args:
+        etag (str): The entity tag of the document.
+
+    Returns:
+        Dict[str, str]: The headers for the response.
+    """
+    return {"ETag": etag, "Cache-Control": f"public, max-age={settings.FEEDS_MAX_AGE_SECONDS}"}
+
+
+@router.get(
+    "/feed.xml",
+    summary="Get the RSS feed",
+    description="Get the RSS feed of the latest articles",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"content": {"application/rss+xml": {}}}},
+)
+async def get_rss(request: Request, db_session: AsyncSession = Depends(get_session)) -> Response:
+    """Endpoint for obtaining the RSS feed of the latest articles.
+
+    Args:
+        request (Request): The request, used for checking whether the feed has been modified.
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        Response: The feed, or an empty response in case the client has the current version.
+    """
+    feed = await feeds_service.get_rss(db_session)
+    if is_not_modified(request, feed.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(feed.etag))
+    return Response(feed.body, media_type="application/rss+xml", headers=cache_headers(feed.etag))
+
+
+@router.get(
+    "/atom.xml",
+    summary="Get the Atom feed",
+    description="Get the Atom feed of the latest articles",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"content": {"application/atom+xml": {}}}},
+)
+async def get_atom(request: Request, db_session: AsyncSession = Depends(get_session)) -> Response:
+    """Endpoint for obtaining the Atom feed of the latest articles.
+
+    Args:
+        request (Request): The request, used for checking whether the feed has been modified.
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        Response: The feed, or an empty response in case the client has the current version.
+    """
+    feed = await feeds_service.get_atom(db_session)
+    if is_not_modified(request, feed.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(feed.etag))
+    return Response(feed.body, media_type="application/atom+xml", headers=cache_headers(feed.etag))
+
+
+@router.get(
+    "/sitemap.xml",
+    summary="Get the sitemap",
+    description="Get the sitemap containing the pages of all articles and projects",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"application/xml": {}}}},
+)
+async def get_sitemap(request: Request, db_session: AsyncSession = Depends(get_session)) -> Response:
+    """Endpoint for obtaining the sitemap, which is streamed in chunks.
+
+    Args:
+        request (Request): The request, used for checking whether the sitemap has been modified.
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        Response: The sitemap, or an empty response in case the client has the current version.
+    """
+    sitemap = await feeds_service.get_sitemap(db_session)
+    if is_not_modified(request, sitemap.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(sitemap.etag))
+    return StreamingResponse(
+        sitemap.chunks, media_type="application/xml", headers=cache_headers(sitemap.etag)
+    )
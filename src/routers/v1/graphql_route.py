@@ -0,0 +1,35 @@
+"""The GraphQL endpoint, only available in case the ```graphql``` extra is installed."""
+from fastapi import Depends
+from fastapi.routing import APIWebSocketRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.fastapi import GraphQLRouter
+
+from src.db.base import get_session
+from src.graphql_api.context import GraphQLContext
+from src.graphql_api.schema import schema
+
+TAG_INFORMATION = {
+    "name": "graphql",
+    "description": "This endpoint provides read access to articles, projects and skills using GraphQL",
+}
+
+
+async def get_context(db_session: AsyncSession = Depends(get_session)) -> GraphQLContext:
+    """Create the context for the GraphQL request.
+
+    Args:
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        GraphQLContext: The context containing the data loaders of the request.
+    """
+    return GraphQLContext(db_session)
+
+
+router: GraphQLRouter = GraphQLRouter(
+    schema, context_getter=get_context, graphiql=False, subscription_protocols=()
+)
+# The schema has no subscriptions. The websocket route is registered regardless of the protocols,
+# but would bypass the authentication, since including the router drops its dependencies
+router.routes = [route for route in router.routes if not isinstance(route, APIWebSocketRoute)]
@@ -0,0 +1,28 @@
+"""All metric related endpoints."""
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from src.util.metrics import metrics
+
+TAG_INFORMATION = {
+    "name": "metrics",
+    "description": "This endpoint provides the metrics of the API in the Prometheus text format",
+}
+
+router = APIRouter(tags=[TAG_INFORMATION["name"]])
+
+
+@router.get(
+    "/",
+    summary="Get the metrics",
+    description="Get the metrics of this worker in the Prometheus text format",
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+)
+async def get_metrics() -> PlainTextResponse:
+    """Endpoint for obtaining the metrics of the worker handling the request.
+
+    Returns:
+        PlainTextResponse: The metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
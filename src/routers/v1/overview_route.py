@@ -0,0 +1,45 @@
+"""All overview related endpoints."""
+from fastapi import APIRouter, Query, Request, status
+
+from src.db.base import SessionReleasingRoute
+from src.schemas.overview_schema import Overview
+from src.services.overview_service import overview_service
+
+TAG_INFORMATION = {
+    "name": "overview",
+    "description": "This endpoint provides the aggregated content for the landing page",
+}
+
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
+
+
+@router.get(
+    "/",
+    summary="Get the overview",
+    description="Get the latest articles, projects and the skills grouped by category in one response",
+    status_code=status.HTTP_200_OK,
+    response_model=Overview,
+)
+async def get_overview(
+    request: Request,
+    articles_limit: int = Query(
+        default=5, ge=1, le=50, description="The maximum number of articles to return"
+    ),
+    projects_limit: int = Query(
+        default=6, ge=1, le=50, description="The maximum number of projects to return"
+    ),
+) -> Overview:
+    """Endpoint for obtaining the aggregated content for the landing page.
+
+    Args:
+        request (Request): The current request, carrying the deadline for the queries.
+        articles_limit (int, optional): The maximum number of articles to return. Defaults to 5.
+        projects_limit (int, optional): The maximum number of projects to return. Defaults to 6.
+
+    Returns:
+        Overview: The latest articles, projects and the skills grouped by category.
+    """
+    overview = await overview_service.get_overview(
+        articles_limit, projects_limit, getattr(request.state, "deadline", None)
+    )
+    return overview
@@ -1,10 +1,10 @@
 """All projects related endpoints."""
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.base import get_session
+from src.db.base import SessionReleasingRoute, get_session
 from src.schemas.projects_schema import (
     Project,
     ProjectCreated,
@@ -13,17 +13,22 @@ from src.schemas.projects_schema import (
     ProjectUpdated,
     UpdateProject,
 )
+from src.schemas.return_schema import ReturnPreference
+from src.services.count_service import count_service
 from src.services.projects_service import projects_service
+from src.util.batch_ids import parse_ids, report_missing_ids
 
 TAG_INFORMATION = {
     "name": "projects",
     "description": "This endpoint can be used to manage projects",
 }
 
-router = APIRouter(tags=[TAG_INFORMATION["name"]])
+# The reads are public, the writes are included with the authentication
+public_router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
 
 
-@router.get(
+@public_router.get(
     "/{project_id}",
     summary="Get the specified project",
     description="Get the specified project from the database",
@@ -48,7 +53,7 @@ async def get_project(
     return project
 
 
-@router.get(
+@public_router.get(
     "/",
     summary="Get all articles",
     description="Get all articles stored in the database",
@@ -56,22 +61,44 @@ async def get_project(
     response_model=List[ProjectDB],
 )
 async def get_projects(
+    response: Response,
     db_session: AsyncSession = Depends(get_session),
-    skip: int = Query(default=0, description="The number of items to skip in the project table"),
-    limit: int = Query(default=100, description="The maximum number to return from the project table"),
+    skip: int = Query(default=0, ge=0, description="The number of items to skip in the project table"),
+    limit: int = Query(
+        default=100, ge=1, le=100, description="The maximum number to return from the project table"
+    ),
+    project_ids: Optional[List[int]] = Depends(parse_ids),
+    total: bool = Query(
+        default=False, description="Whether to return the total number in ```X-Total-Count```"
+    ),
 ) -> List[ProjectDB]:
     """Endpoint to obtain all projects in the database.
 
     Args:
+        response (Response): The response, used for reporting missing IDs and the total count.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
         skip (int, optional): The number of items to skip. Defaults to 0.
         limit (int, optional): The maximum number of items to return. Defaults to 100.
+        project_ids (Optional[List[int]], optional): The IDs of the projects to obtain. In case they are
+            provided, only these projects are returned in the requested order, ```skip``` and ```limit```
+            are ignored and the IDs that were not found are reported in the ```X-Missing-IDs``` header.
+        total (bool, optional): Whether to add the total number of projects in the ```X-Total-Count```
+            header. It is estimated for large tables, which is indicated by ```X-Total-Count-Type```.
+            Defaults to ```False```.
 
     Returns:
         List[ProjectDB]: The list of articles obtained from the DB.
     """
+    if project_ids is not None:
+        projects = await projects_service.get_projects_by_ids(project_ids, db_session)
+        report_missing_ids(response, project_ids, (project.id for project in projects))
+        return projects  # type: ignore[return-value]
+
     projects = await projects_service.get_projects(skip, limit, db_session)
+    if total:
+        total_count = await projects_service.count_projects(db_session)
+        count_service.add_total_count_headers(response, total_count)
     return projects  # type: ignore[no-any-return]
 
 
@@ -102,25 +129,37 @@ async def add_project(project: Project, db_session: AsyncSession = Depends(get_s
     summary="Updates an project",
     description="Updated the specified project with the information provided",
     status_code=status.HTTP_200_OK,
-    response_model=ProjectUpdated,
+    response_model=Union[ProjectDB, ProjectUpdated],
 )
 async def update_project(
     project: UpdateProject,
     project_id: int = Path(description="The ID of the project to update."),
+    return_preference: ReturnPreference = Query(
+        default=ReturnPreference.MINIMAL,
+        alias="return",
+        description="Use ```representation``` to obtain the updated project instead of the status.",
+    ),
     db_session: AsyncSession = Depends(get_session),
-) -> ProjectUpdated:
+) -> Union[ProjectDB, ProjectUpdated]:
     """Endpoint to update a project in the database.
 
     Args:
         project (UpdateProject): The information to update on the specified project.
         project_id (int): The id of the project to update.
+        return_preference (ReturnPreference, optional): Whether to return the updated project
+            or only the status. Defaults to ```minimal```.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
 
     Returns:
-        UpdateProject: The status of the update.
+        Union[ProjectDB, ProjectUpdated]: The updated project or the status of the update.
     """
-    project = await projects_service.update_project(project_id, project, db_session)
+    project = await projects_service.update_project(
+        project_id,
+        project,
+        db_session,
+        return_representation=return_preference == ReturnPreference.REPRESENTATION,
+    )
     return project
 
 
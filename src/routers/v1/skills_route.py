@@ -1,22 +1,50 @@
 """All skill related endpoints."""
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.base import get_session
+from src.db.base import SessionReleasingRoute, get_session
+from src.schemas.return_schema import ReturnPreference
 from src.schemas.skills_schema import SkillAdjusted, SkillDB, SkillSchema, UpdateSkill
+from src.services.count_service import count_service
 from src.services.skills_service import skills_service
+from src.util.batch_ids import parse_ids, report_missing_ids
 
 TAG_INFORMATION = {
     "name": "skills",
     "description": "This endpoint can be used to manage skills",
 }
 
-router = APIRouter(tags=[TAG_INFORMATION["name"]])
+# The reads are public, the writes are included with the authentication
+public_router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
 
 
-@router.get(
+@public_router.get(
+    "/by-category",
+    summary="Get all skills grouped by category",
+    description="Get all skills grouped by their category and ordered by their experience",
+    status_code=status.HTTP_200_OK,
+    response_model=Dict[str, List[SkillDB]],
+)
+async def get_skills_by_category(
+    db_session: AsyncSession = Depends(get_session),
+) -> Dict[str, List[SkillDB]]:
+    """Endpoint for obtaining all the skills grouped by their category.
+
+    Args:
+        db_session (AsyncSession, optional): The session for the DB that will
+            automatically injected using the ```Depends```functionality of FastAPI.
+
+    Returns:
+        Dict[str, List[SkillDB]]: The skills per category, ordered by their experience.
+    """
+    skills = await skills_service.get_skills_by_category(db_session)
+    return skills  # type: ignore[return-value]
+
+
+@public_router.get(
     "/{skill_id}",
     summary="Get the specified skill",
     description="Get the specified skill from the database",
@@ -41,7 +69,7 @@ async def get_skill(
     return skill
 
 
-@router.get(
+@public_router.get(
     "/",
     summary="Get all skills",
     description="Get all skills stored in the database",
@@ -49,22 +77,44 @@ async def get_skill(
     response_model=List[SkillDB],
 )
 async def get_skills(
+    response: Response,
     db_session: AsyncSession = Depends(get_session),
-    skip: int = Query(default=0, description="The number of items to skip in the skill table"),
-    limit: int = Query(default=100, description="The maximum number to return from the skill table"),
+    skip: int = Query(default=0, ge=0, description="The number of items to skip in the skill table"),
+    limit: int = Query(
+        default=100, ge=1, le=100, description="The maximum number to return from the skill table"
+    ),
+    skill_ids: Optional[List[int]] = Depends(parse_ids),
+    total: bool = Query(
+        default=False, description="Whether to return the total number in ```X-Total-Count```"
+    ),
 ) -> Union[List[SkillDB], None]:
     """Endpoint for obtaining all the skills in the database.
 
     Args:
+        response (Response): The response, used for reporting missing IDs and the total count.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
         skip (int, optional): The number of items to skip. Defaults to 0.
         limit (int, optional): The maximum number of items to return. Defaults to 100.
+        skill_ids (Optional[List[int]], optional): The IDs of the skills to obtain. In case they are
+            provided, only these skills are returned in the requested order, ```skip``` and ```limit```
+            are ignored and the IDs that were not found are reported in the ```X-Missing-IDs``` header.
+        total (bool, optional): Whether to add the total number of skills in the ```X-Total-Count```
+            header. It is estimated for large tables, which is indicated by ```X-Total-Count-Type```.
+            Defaults to ```False```.
 
     Returns:
         List[SkillDB]: The list of skills obtained from the DB.
     """
+    if skill_ids is not None:
+        skills = await skills_service.get_skills_by_ids(skill_ids, db_session)
+        report_missing_ids(response, skill_ids, (skill.id for skill in skills))
+        return skills  # type: ignore[return-value]
+
     skills = await skills_service.get_skills(skip, limit, db_session)
+    if total:
+        total_count = await skills_service.count_skills(db_session)
+        count_service.add_total_count_headers(response, total_count)
     return skills  # type: ignore[no-any-return]
 
 
@@ -95,25 +145,37 @@ async def add_skill(skill: SkillSchema, db_session: AsyncSession = Depends(get_s
     summary="Updates an skill",
     description="Updated the specified skills with the information provided",
     status_code=status.HTTP_200_OK,
-    response_model=SkillAdjusted,
+    response_model=Union[SkillDB, SkillAdjusted],
 )
 async def update_skill(
     skill: UpdateSkill,
     skill_id: int = Path(description="The ID of the skill to update."),
+    return_preference: ReturnPreference = Query(
+        default=ReturnPreference.MINIMAL,
+        alias="return",
+        description="Use ```representation``` to obtain the updated skill instead of the status.",
+    ),
     db_session: AsyncSession = Depends(get_session),
-) -> SkillAdjusted:
+) -> Union[SkillDB, SkillAdjusted]:
     """Endpoint to update an skill in the database.
 
     Args:
         skill (UpdateSkill): The information to update on the specified skill.
         skill_id (int): The id of the skill to update.
+        return_preference (ReturnPreference, optional): Whether to return the updated skill
+            or only the status. Defaults to ```minimal```.
         db_session (AsyncSession, optional): The session for the DB that will
             automatically injected using the ```Depends```functionality of FastAPI.
 
     Returns:
-        SkillAdjusted: The status of the update.
+        Union[SkillDB, SkillAdjusted]: The updated skill or the status of the update.
     """
-    skill = await skills_service.update_skill(skill_id, skill, db_session)
+    skill = await skills_service.update_skill(
+        skill_id,
+        skill,
+        db_session,
+        return_representation=return_preference == ReturnPreference.REPRESENTATION,
+    )
     return skill
 
 
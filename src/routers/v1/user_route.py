@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.base import get_session
+from src.db.base import SessionReleasingRoute, get_session
 from src.schemas.user_schema import CreateUser, UserCreated, UserDeleted, UserSchema
 from src.services.user_service import user_service
 
@@ -11,7 +11,7 @@ TAG_INFORMATION = {
     "description": "This endpoint is for managing users of the API",
 }
 
-router = APIRouter(tags=[TAG_INFORMATION["name"]])
+router = APIRouter(tags=[TAG_INFORMATION["name"]], route_class=SessionReleasingRoute)
 
 
 @router.post(
@@ -0,0 +1,40 @@
+"""All endpoints at the well-known locations of the host."""
+from fastapi import APIRouter, Request, Response, status
+
+from src.config.settings import settings
+from src.services.token_service import token_service
+from src.util.http_cache import is_not_modified
+
+TAG_INFORMATION = {
+    "name": "well-known",
+    "description": "This endpoint provides the public keys for verifying the issued tokens",
+}
+
+router = APIRouter(tags=[TAG_INFORMATION["name"]])
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    summary="Get the public signing keys",
+    description="Get the JSON Web Key Set, containing the public keys the tokens are signed with",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"content": {"application/jwk-set+json": {}}}},
+)
+async def get_jwks(request: Request) -> Response:
+    """Endpoint for obtaining the public keys for verifying the tokens.
+
+    Verifiers should cache the keys and only fetch them again, in case a token with an
+    unknown ```kid``` is presented. New keys are published before they sign any token.
+
+    Args:
+        request (Request): The request, used for checking whether the keys have been modified.
+
+    Returns:
+        Response: The JWKS, or an empty response in case the client has the current version.
+    """
+    jwks = token_service.get_jwks()
+    headers = {"ETag": jwks.etag, "Cache-Control": f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}"}
+    if is_not_modified(request, jwks.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(jwks.body, media_type="application/jwk-set+json", headers=headers)
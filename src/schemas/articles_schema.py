@@ -72,3 +72,15 @@ class ArticleDB(Article):
     id: int
     created_at: date
     updated_at: Optional[date]
+
+
+class RelatedArticle(ArticleDB):
+    """Schema for an article related to another article."""
+
+    score: float = Field(example=0.5, description="The share of common tags, between 0 and 1")
+
+
+class PopularArticle(ArticleDB):
+    """Schema for a popular article."""
+
+    views: int = Field(example=128, description="The total number of views")
@@ -1,7 +1,7 @@
 """Auth schemas."""
 from pydantic import BaseModel, EmailStr
 
-from src.schemas.token_schema import Token
+from src.schemas.token_schema import Token, TokenTypes
 
 
 class AuthSchema(BaseModel):
@@ -17,6 +17,13 @@ class RefreshSchema(BaseModel):
     refresh_token: str
 
 
+class RevokeSchema(BaseModel):
+    """Model for revoking a token."""
+
+    token: str
+    token_type: TokenTypes = TokenTypes.REFRESH_TOKEN
+
+
 class AuthTokenSchema(BaseModel):
     """Model representing the access tokens."""
 
@@ -0,0 +1,18 @@
+"""Count schemas."""
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class CountTypes(str, Enum):
+    """The ways a total count can be determined."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+class TotalCount(BaseModel):
+    """The total number of rows in a table."""
+
+    total: int
+    type: CountTypes
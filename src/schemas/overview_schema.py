@@ -0,0 +1,18 @@
+"""Overview schemas."""
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+from src.schemas.articles_schema import ArticleDB
+from src.schemas.projects_schema import ProjectDB
+from src.schemas.skills_schema import SkillDB
+
+
+class Overview(BaseModel):
+    """Schema for the aggregated content of the landing page."""
+
+    articles: List[ArticleDB] = Field(description="The latest articles without their content.")
+    projects: List[ProjectDB] = Field(description="The latest projects.")
+    skills: Dict[str, List[SkillDB]] = Field(
+        description="The skills grouped by their category and ordered by experience."
+    )
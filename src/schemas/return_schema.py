@@ -0,0 +1,9 @@
+"""Return preference schemas."""
+from enum import Enum
+
+
+class ReturnPreference(str, Enum):
+    """The content that should be returned by modifying endpoints."""
+
+    MINIMAL = "minimal"
+    REPRESENTATION = "representation"
@@ -1,7 +1,7 @@
 """Token schemas."""
 from datetime import datetime
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
 
 from pydantic import BaseModel
 
@@ -38,3 +38,5 @@ class TokenPayload(BaseModel):
     iat: int
     exp: int
     type: TokenTypes
+    # Tokens issued before the revocation was introduced do not have an ID
+    jti: Optional[str] = None
@@ -0,0 +1,162 @@
+"""Article views service."""
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import BigInteger, Float, Integer, bindparam, func
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.future import select
+
+from src.config.settings import settings
+from src.db.base import async_session
+from src.models.article_model import Article
+from src.models.article_view_model import ArticleView
+from src.schemas.articles_schema import ArticleDB, PopularArticle
+from src.util.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# The decay is relative to a fixed point in time, which keeps the popularity of all
+# articles comparable. It only grows linearly with the time, since it is stored as logarithm.
+POPULARITY_EPOCH = 1577836800.0  # 2020-01-01T00:00:00Z
+
+
+@traced
+class ArticleViewsService:
+    """Counts the views of articles and provides the most popular articles.
+
+    Views are counted in memory and written behind in a single batched upsert,
+    so that reading an article does not require a write to the database. The
+    views that have not been flushed yet are lost in case the worker crashes,
+    which are at most the views of ```ARTICLE_VIEWS_FLUSH_SECONDS```.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.__pending: "Counter[int]" = Counter()
+        self.__flusher: Optional["asyncio.Task[None]"] = None
+        self.__flush_requested: Optional[asyncio.Event] = None
+
+    def count_view(self, article_id: int) -> None:
+        """Count a view of the article.
+
+        Requests an early flush, in case ```ARTICLE_VIEWS_MAX_PENDING``` articles
+        have pending views.
+
+        Args:
+            article_id (int): The ID of the viewed article.
+        """
+        self.__pending[article_id] += 1
+        if len(self.__pending) >= settings.ARTICLE_VIEWS_MAX_PENDING and self.__flush_requested is not None:
+            self.__flush_requested.set()
+
+    async def flush(self) -> None:
+        """Write the pending views to the database using a single upsert.
+
+        Views of articles deleted in the meantime are skipped. In case the upsert
+        fails, the views are dropped to keep the memory bounded.
+        """
+        if not self.__pending:
+            return
+
+        pending, self.__pending = self.__pending, Counter()
+        decay_rate = math.log(2) / (settings.ARTICLE_VIEWS_HALF_LIFE_HOURS * 3600)
+        decayed_time = decay_rate * (time.time() - POPULARITY_EPOCH)
+
+        views = func.unnest(
+            bindparam("article_ids", list(pending), type_=ARRAY(Integer)),
+            bindparam("views", list(pending.values()), type_=ARRAY(BigInteger)),
+            bindparam(
+                "popularities",
+                [math.log(count) + decayed_time for count in pending.values()],
+                type_=ARRAY(Float),
+            ),
+        ).table_valued("article_id", "views", "popularity")
+        statement = insert(ArticleView).from_select(
+            ["article_id", "views", "popularity"],
+            select(views.c.article_id, views.c.views, views.c.popularity).where(
+                views.c.article_id.in_(select(Article.id))
+            ),
+        )
+        # Adds the decayed views in the logarithmic space, without overflowing
+        current, added = ArticleView.popularity, statement.excluded.popularity
+        popularity = func.greatest(current, added) + func.ln(1 + func.exp(-func.abs(current - added)))
+        statement = statement.on_conflict_do_update(
+            index_elements=[ArticleView.article_id],
+            set_={"views": ArticleView.views + statement.excluded.views, "popularity": popularity},
+        )
+
+        try:
+            async with async_session() as db_session:
+                await db_session.execute(statement)
+                await db_session.commit()
+        except Exception:
+            logger.exception("Error flushing the views of %d articles", len(pending))
+
+    async def start(self) -> None:
+        """Start flushing the pending views periodically."""
+        if self.__flusher is None:
+            self.__flush_requested = asyncio.Event()
+            self.__flusher = asyncio.create_task(self.__flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop flushing periodically and flush the remaining views."""
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            try:
+                await self.__flusher
+            except asyncio.CancelledError:
+                pass
+            self.__flusher, self.__flush_requested = None, None
+        await self.flush()
+
+    async def __flush_periodically(self) -> None:
+        """Flush the pending views after each interval or as soon as it is requested."""
+        while True:
+            try:
+                await asyncio.wait_for(self.__flush_requested.wait(), settings.ARTICLE_VIEWS_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self.__flush_requested.clear()
+            await self.flush()
+
+    async def get_popular_articles(self, limit: int, db_session: AsyncSession) -> List[PopularArticle]:
+        """Get the articles with the most time-decayed views.
+
+        The content of the articles is not loaded, use ```get_article``` to obtain it.
+
+        Args:
+            limit (int): Maximum number of articles to return.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the articles.
+
+        Returns:
+            List[PopularArticle]: The most popular articles with their total views, most popular first.
+        """
+        try:
+            res: AsyncResult = await db_session.execute(
+                select(Article, ArticleView.views)
+                .join(ArticleView, ArticleView.article_id == Article.id)
+                .order_by(ArticleView.popularity.desc())
+                .limit(limit)
+            )
+            popular_articles = [
+                PopularArticle(**ArticleDB.from_orm(article).dict(), views=views)
+                for article, views in res.all()
+            ]
+            return popular_articles  # noqa: TC300
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the popular articles",
+            ) from BaseException
+
+
+article_views_service = ArticleViewsService()
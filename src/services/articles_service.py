@@ -1,12 +1,16 @@
 """Articles service."""
 from datetime import datetime
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, update
+from sqlalchemy import Integer, any_, bindparam, delete, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 
+from src.db.columns import load_columns
+from src.models.article_content_model import ArticleContent
 from src.models.article_model import Article
 from src.schemas.articles_schema import (
     ArticleCreated,
@@ -15,14 +19,23 @@ from src.schemas.articles_schema import (
     ArticleUpdated,
     UpdateArticle,
 )
+from src.schemas.count_schema import TotalCount
+from src.services.count_service import count_service
+from src.util.single_flight import coalesced
+from src.util.tracing import traced
+from src.util.write_events import WriteTopics, write_events
 
 
+@traced
 class ArticlesService:
     """Provides all services to manage articles in the database."""
 
+    @coalesced(WriteTopics.ARTICLES)
     async def get_article(self, article_id: int, db_session: AsyncSession) -> Union[ArticleDB, None]:
         """Get the specified article from the database.
 
+        In contrast to the listing, the content of the article is loaded as well.
+
         Args:
             article_id: The ID of the article to obtain from the database.
             db_session: The session for the database.
@@ -35,7 +48,9 @@ class ArticlesService:
             HTTPException: Is being thrown as soon as an error occurs when obtaining the article.
         """
         try:
-            res: AsyncResult = await db_session.execute(select(Article).filter(Article.id == article_id))
+            res: AsyncResult = await db_session.execute(
+                select(Article).options(joinedload(Article.article_content)).filter(Article.id == article_id)
+            )
             article: ArticleDB = res.scalars().first()
 
             if article is not None:
@@ -48,15 +63,19 @@ class ArticlesService:
                 "Error obtaining the article",
             ) from BaseException
 
+    @coalesced(WriteTopics.ARTICLES)
     async def get_articles(
-        self, skip: int, limit: int, db_session: AsyncSession
+        self, skip: int, limit: int, db_session: AsyncSession, columns: Optional[List[str]] = None
     ) -> Union[List[Article], None]:
         """Get all articles from the database.
 
+        The content of the articles is not loaded, use ```get_article``` to obtain it.
+
         Args:
             skip: Number of elements to skip from the result set.
             limit: Maximum number of elements to return.
             db_session: The session for the database.
+            columns: The names of the columns to load, all columns in case of ``None``.
 
         Returns:
             The result of the database. Can be either of type ``List[Article]`` or ``None``, in
@@ -67,16 +86,121 @@ class ArticlesService:
 
         """
         try:
-            res: AsyncResult = await db_session.scalars(select(Article))
+            res: AsyncResult = await db_session.scalars(
+                select(Article)
+                .options(*load_columns(Article, columns))
+                .order_by(Article.id)
+                .offset(skip)
+                .limit(limit)
+            )
             articles_list: List[Article] = res.all()
             if articles_list is not None:
-                return articles_list[skip : skip + limit]
+                return articles_list
         except BaseException:
             raise HTTPException(
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
                 "Error obtaining all articles",
             ) from BaseException
 
+    @coalesced(WriteTopics.ARTICLES)
+    async def get_latest_articles(self, limit: int, db_session: AsyncSession) -> List[Article]:
+        """Get the most recently created articles from the database.
+
+        The content of the articles is not loaded, use ```get_article``` to obtain it.
+
+        Args:
+            limit (int): Maximum number of articles to return.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the articles.
+
+        Returns:
+            List[Article]: The articles ordered by their creation date, newest first.
+        """
+        try:
+            res: AsyncResult = await db_session.scalars(
+                select(Article).order_by(Article.created_at.desc(), Article.id.desc()).limit(limit)
+            )
+            return res.all()  # noqa: TC300
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the latest articles",
+            ) from BaseException
+
+    async def count_articles(self, db_session: AsyncSession) -> TotalCount:
+        """Count the articles in the database.
+
+        The number is estimated for large tables, see ```CountService.count```.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            TotalCount: The number of articles and whether it is exact or estimated.
+        """
+        return await count_service.count(Article, db_session)
+
+    async def get_articles_by_ids(
+        self, article_ids: List[int], db_session: AsyncSession, columns: Optional[List[str]] = None
+    ) -> List[Article]:
+        """Get the specified articles from the database using a single query.
+
+        The content of the articles is not loaded, use ```get_article``` to obtain it.
+
+        Args:
+            article_ids (List[int]): The IDs of the articles to obtain.
+            db_session (AsyncSession): The session for the database.
+            columns (Optional[List[str]], optional): The names of the columns to load, all columns
+                in case of ```None```. Defaults to ```None```.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the articles.
+
+        Returns:
+            List[Article]: The found articles in the order of the requested IDs.
+        """
+        try:
+            res: AsyncResult = await db_session.scalars(
+                select(Article)
+                .options(*load_columns(Article, columns))
+                .where(Article.id == any_(bindparam("ids", article_ids, type_=ARRAY(Integer))))
+            )
+            articles_by_id = {article.id: article for article in res.all()}
+            return [articles_by_id[article_id] for article_id in article_ids if article_id in articles_by_id]
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the articles",
+            ) from BaseException
+
+    async def get_article_contents(self, article_ids: List[int], db_session: AsyncSession) -> Dict[int, str]:
+        """Get the contents of the specified articles using a single query.
+
+        Args:
+            article_ids (List[int]): The IDs of the articles, whose content should be obtained.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the contents.
+
+        Returns:
+            Dict[int, str]: The contents by the ID of the article.
+        """
+        try:
+            res: AsyncResult = await db_session.execute(
+                select(ArticleContent.article_id, ArticleContent.content).where(
+                    ArticleContent.article_id == any_(bindparam("ids", article_ids, type_=ARRAY(Integer)))
+                )
+            )
+            return dict(res.all())  # noqa: TC300
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the article contents",
+            ) from BaseException
+
     async def delete_article(self, article_id: int, db_session: AsyncSession) -> ArticleDeleted:
         """Delete the specified article from the database.
 
@@ -91,9 +215,12 @@ class ArticlesService:
             ArticleDeleted: The information, whether the specified article was successfully deleted.
         """
         try:
-            res: AsyncSession = await db_session.execute(delete(Article).where(Article.id == article_id))
-            if res.rowcount != 0:
+            res: AsyncResult = await db_session.execute(
+                delete(Article).where(Article.id == article_id).returning(Article.id)
+            )
+            if res.scalar() is not None:
                 await db_session.commit()
+                write_events.publish(WriteTopics.ARTICLES, article_id)
                 return {"article_id": article_id, "status": "Article deleted"}
             else:
                 return {"article_id": article_id, "status": "Article not found"}
@@ -125,6 +252,7 @@ class ArticlesService:
             db_session.add(new_article)
 
             await db_session.commit()
+            write_events.publish(WriteTopics.ARTICLES, new_article.id)
 
             return new_article  # noqa: TC300
         except BaseException:
@@ -134,35 +262,70 @@ class ArticlesService:
             ) from BaseException
 
     async def update_article(
-        self, article_id: int, article: UpdateArticle, db_session: AsyncSession
-    ) -> ArticleUpdated:
+        self,
+        article_id: int,
+        article: UpdateArticle,
+        db_session: AsyncSession,
+        return_representation: bool = False,
+    ) -> Union[ArticleDB, ArticleUpdated]:
         """Update the specified article in the database.
 
+        The update and the obtaining of the result are conducted in a single
+        ```UPDATE ... RETURNING``` statement. The content is stored separately and
+        only written, in case it is updated. In case the article is requested without
+        updating the content, the content is read by a subquery of the same statement.
+
         Args:
             article_id (int): The ID of the article to update.
             article (UpdateArticle): The information that shall be updated in the article.
             db_session (AsyncSession):The session for the DB.
+            return_representation (bool, optional): Flag indicating, whether to return the updated
+                article instead of the status. Defaults to ```False```.
 
         Raises:
             HTTPException: Is being thrown as soon as an error occurs when updating the article.
 
         Returns:
-            ArticleUpdated: The status that indicates, whether the update was successful.
+            Union[ArticleDB, ArticleUpdated]: The updated article, in case it was requested and the
+                article exists. Otherwise the status that indicates, whether the update was successful.
         """
         try:
             update_article = article.dict(exclude_unset=True)
+            update_content = "content" in update_article
+            content = update_article.pop("content", None)
+            returning: List[Any] = list(Article.__table__.columns) if return_representation else [Article.id]
+            if return_representation and not update_content:
+                returning.append(
+                    select(ArticleContent.content)
+                    .where(ArticleContent.article_id == Article.id)
+                    .scalar_subquery()
+                    .label("content")
+                )
 
-            res: AsyncSession = await db_session.execute(
+            res: AsyncResult = await db_session.execute(
                 update(Article)
                 .where(Article.id == article_id)
                 .values(
                     **update_article,
                     updated_at=datetime.now(),
                 )
+                .returning(*returning)
             )
-
-            if res.rowcount != 0:
+            updated_article = res.mappings().first()
+
+            if updated_article is not None:
+                if update_content:
+                    await db_session.execute(
+                        insert(ArticleContent)
+                        .values(article_id=article_id, content=content)
+                        .on_conflict_do_update(
+                            index_elements=[ArticleContent.article_id], set_={"content": content}
+                        )
+                    )
                 await db_session.commit()
+                write_events.publish(WriteTopics.ARTICLES, article_id)
+                if return_representation:
+                    return ArticleDB(**{"content": content, **updated_article})
                 return ArticleUpdated(article_id=article_id, status="Article updated")
             else:
                 return ArticleUpdated(article_id=article_id, status="Article not found")
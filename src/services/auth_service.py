@@ -1,12 +1,19 @@
 """Auth services."""
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
+from src.models.user_model import User
 from src.schemas.auth_schema import AuthTokenSchema
+from src.schemas.token_schema import TokenTypes
+from src.services.token_revocation_service import token_revocation_service
 from src.services.token_service import token_service
 from src.services.user_service import user_service
+from src.util.rate_limiter import login_rate_limiter
+from src.util.tracing import traced
 
 
+@traced
 class AuthService:
     """Provides services for the authentication against the API."""
 
@@ -14,7 +21,8 @@ class AuthService:
         """Authenticate the user.
 
         Conducts the authentication and provide the access tokens, in case the mail
-        and password is correct.
+        and password is correct. Only ```LOGIN_MAX_CONCURRENT_HASHES``` passwords are
+        verified at the same time, further attempts wait for a free slot.
 
         Args:
             mail (str): The mail address of the user.
@@ -31,7 +39,7 @@ class AuthService:
         try:
             user = await user_service.get_user(db_session, mail)
 
-            if user is None or not user.verify_password(password):
+            if user is None or not await self.__verify_password(user, password):
                 raise HTTPException(  # noqa: TC301
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Invalid email and / or password",
@@ -58,15 +66,15 @@ class AuthService:
             token (str): The refresh token to validate.
 
         Raises:
-            HTTPException: The provided token is not valid.
+            HTTPException: The provided token is not valid or has been revoked.
             HTTPException: The refresh token expired.
 
         Returns:
             AuthTokenSchema: The ```Access``` and ```Refresh``` tokens.
         """
         try:
-            decoded_token = token_service.decode_token(token)
-            if decoded_token is None:
+            decoded_token = token_service.decode_token(token, TokenTypes.REFRESH_TOKEN)
+            if decoded_token is None or token_revocation_service.is_revoked(decoded_token):
                 raise HTTPException(  # noqa: TC301
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid refresh token",
@@ -83,5 +91,38 @@ class AuthService:
                 detail="Refresh token expired",
             ) from BaseException
 
+    async def revoke_token(self, token: str, token_type: TokenTypes) -> None:
+        """Revoke the token, so that it is rejected from now on.
+
+        Args:
+            token (str): The token to revoke.
+            token_type (TokenTypes): The type of the token.
+
+        Raises:
+            HTTPException: The provided token is not valid or expired.
+        """
+        try:
+            decoded_token = token_service.decode_token(token, token_type)
+        except BaseException:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+            ) from BaseException
+
+        await token_revocation_service.revoke(decoded_token)
+
+    async def __verify_password(self, user: User, password: str) -> bool:
+        """Verify the password in a thread, once a hashing slot is available.
+
+        Args:
+            user (User): The user, whose password hash is compared.
+            password (str): The provided password.
+
+        Returns:
+            bool: ```True``` in case the password is correct.
+        """
+        async with login_rate_limiter.hashing_slot():
+            return await run_in_threadpool(user.verify_password, password)
+
 
 auth_service = AuthService()
@@ -0,0 +1,65 @@
+"""Count services."""
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.schemas.count_schema import CountTypes, TotalCount
+from src.util.tracing import traced
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_TYPE_HEADER = "X-Total-Count-Type"
+
+
+@traced
+class CountService:
+    """Provides the total number of rows in the tables."""
+
+    async def count(self, model: Any, db_session: AsyncSession) -> TotalCount:
+        """Count the rows of the table of the model.
+
+        Uses the planner statistics (```pg_class.reltuples```) as an estimate. Only in
+        case the estimate is below ```COUNT_ESTIMATE_THRESHOLD```, the rows are counted
+        exactly, so that counting never results in a full scan of a large table.
+
+        Args:
+            model (Any): The model of the table to count.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when counting the rows.
+
+        Returns:
+            TotalCount: The number of rows and whether it is exact or estimated.
+        """
+        try:
+            estimate = await db_session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                {"table_name": model.__tablename__},
+            )
+            # Tables that were never analyzed report -1 (or 0 prior to PostgreSQL 14)
+            if estimate is not None and estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+                return TotalCount(total=estimate, type=CountTypes.ESTIMATED)
+
+            total = await db_session.scalar(select(func.count()).select_from(model))
+            return TotalCount(total=total, type=CountTypes.EXACT)  # noqa: TC300
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error counting the rows",
+            ) from BaseException
+
+    def add_total_count_headers(self, response: Response, total_count: TotalCount) -> None:
+        """Add the total count to the response headers.
+
+        Args:
+            response (Response): The response to add the headers to.
+            total_count (TotalCount): The total count to add.
+        """
+        response.headers[TOTAL_COUNT_HEADER] = str(total_count.total)
+        response.headers[TOTAL_COUNT_TYPE_HEADER] = total_count.type.value
+
+
+count_service = CountService()
@@ -0,0 +1,420 @@
+"""Feeds service."""
+import asyncio
+import hashlib
+import time
+from datetime import date, datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.future import select
+
+from src.config.settings import settings
+from src.models.article_model import Article
+from src.models.project_model import Project
+from src.services.articles_service import articles_service
+from src.util.tracing import traced
+from src.util.write_events import WriteTopics, write_events
+
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_FOOTER = "</urlset>\n"
+SITEMAP_CHUNK_SIZE = 1000
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+
+
+class Document(NamedTuple):
+    """A rendered document with its entity tag."""
+
+    body: bytes
+    etag: str
+
+
+class Sitemap(NamedTuple):
+    """The chunks of a sitemap, that can be streamed, with its entity tag."""
+
+    chunks: Iterator[bytes]
+    etag: str
+
+
+def to_datetime(day: date) -> datetime:
+    """Convert the date to the start of the day in UTC.
+
+    Args:
+        day (date): The date to convert.
+
+    Returns:
+        datetime: The start of the day in UTC.
+    """
+    return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+
+
+@traced
+class FeedsService:
+    """Provides the RSS and Atom feeds of the articles and the sitemap of the blog.
+
+    The documents are rendered once and only regenerated after articles or projects
+    have been written. The feeds only contain the latest articles and are rendered
+    again as a whole, whereas the sitemap keeps one rendered entry per article and
+    project, of which only the written ones are rendered again. Everything is rebuilt
+    after ```FEEDS_REBUILD_SECONDS```, to pick up writes of other workers.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance.
+
+        Subscribes to the writes of articles and projects, for regenerating the documents.
+        """
+        self.__rss: Optional[Document] = None
+        self.__atom: Optional[Document] = None
+        self.__sitemap_entries: Dict[Tuple[WriteTopics, int], str] = {}
+        self.__sitemap_hash = 0
+        self.__built_at = 0.0
+        self.__rebuild = True
+        self.__pending_ids: Dict[WriteTopics, Set[int]] = {
+            WriteTopics.ARTICLES: set(),
+            WriteTopics.PROJECTS: set(),
+        }
+        self.__lock: Optional[asyncio.Lock] = None
+        write_events.subscribe(WriteTopics.ARTICLES, self.mark_article_changed)
+        write_events.subscribe(WriteTopics.PROJECTS, self.mark_project_changed)
+
+    def mark_article_changed(self, article_id: Optional[int] = None) -> None:
+        """Mark the article as changed, for regenerating the documents on the next request.
+
+        Args:
+            article_id (Optional[int], optional): The ID of the created, updated or deleted
+                article. All documents are rebuilt in case of ```None```. Defaults to ```None```.
+        """
+        self.__mark_changed(WriteTopics.ARTICLES, article_id)
+
+    def mark_project_changed(self, project_id: Optional[int] = None) -> None:
+        """Mark the project as changed, for regenerating the sitemap on the next request.
+
+        Args:
+            project_id (Optional[int], optional): The ID of the created, updated or deleted
+                project. All documents are rebuilt in case of ```None```. Defaults to ```None```.
+        """
+        self.__mark_changed(WriteTopics.PROJECTS, project_id)
+
+    def __mark_changed(self, topic: WriteTopics, resource_id: Optional[int]) -> None:
+        """Mark the resource as changed.
+
+        Args:
+            topic (WriteTopics): The type of the resource.
+            resource_id (Optional[int]): The ID of the resource, everything is rebuilt in case of ```None```.
+        """
+        if resource_id is None:
+            self.__rebuild = True
+        else:
+            self.__pending_ids[topic].add(resource_id)
+
+    async def get_rss(self, db_session: AsyncSession) -> Document:
+        """Get the RSS feed of the latest articles.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            Document: The rendered feed.
+        """
+        await self.__refresh(db_session)
+        return self.__rss  # type: ignore[return-value]
+
+    async def get_atom(self, db_session: AsyncSession) -> Document:
+        """Get the Atom feed of the latest articles.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            Document: The rendered feed.
+        """
+        await self.__refresh(db_session)
+        return self.__atom  # type: ignore[return-value]
+
+    async def get_sitemap(self, db_session: AsyncSession) -> Sitemap:
+        """Get the sitemap containing the pages of all articles and projects.
+
+        The sitemap is not joined into a single document, but returned in chunks
+        of the rendered entries, that can be streamed.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            Sitemap: The chunks of the sitemap with its entity tag.
+        """
+        await self.__refresh(db_session)
+        entries = list(self.__sitemap_entries.values())
+
+        def chunks() -> Iterator[bytes]:
+            yield SITEMAP_HEADER.encode()
+            for start in range(0, len(entries), SITEMAP_CHUNK_SIZE):
+                yield "".join(entries[start : start + SITEMAP_CHUNK_SIZE]).encode()
+            yield SITEMAP_FOOTER.encode()
+
+        # The order of the entries is not relevant, the tag is therefore weak
+        return Sitemap(chunks(), f'W/"{self.__sitemap_hash:040x}"')
+
+    async def __refresh(self, db_session: AsyncSession) -> None:
+        """Build or regenerate the documents, if required.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+        """
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+
+        async with self.__lock:
+            expired = time.monotonic() - self.__built_at >= settings.FEEDS_REBUILD_SECONDS
+            if self.__rss is None or self.__rebuild or expired:
+                await self.__build(db_session)
+            else:
+                await self.__apply_pending(db_session)
+
+    async def __build(self, db_session: AsyncSession) -> None:
+        """Render all documents from scratch.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+        """
+        self.__rebuild = False
+        for pending_ids in self.__pending_ids.values():
+            pending_ids.clear()
+
+        built_at = time.monotonic()
+        try:
+            await self.__render_feeds(db_session)
+            await self.__render_sitemap(None, None, db_session)
+        except BaseException:
+            self.__rebuild = True
+            raise
+        self.__built_at = built_at
+
+    async def __apply_pending(self, db_session: AsyncSession) -> None:
+        """Regenerate the parts of the documents affected by the pending writes.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+        """
+        article_ids = list(self.__pending_ids[WriteTopics.ARTICLES])
+        project_ids = list(self.__pending_ids[WriteTopics.PROJECTS])
+        if not article_ids and not project_ids:
+            return
+
+        for pending_ids in self.__pending_ids.values():
+            pending_ids.clear()
+        try:
+            if article_ids:
+                await self.__render_feeds(db_session)
+            await self.__render_sitemap(article_ids, project_ids, db_session)
+        except BaseException:
+            self.__pending_ids[WriteTopics.ARTICLES].update(article_ids)
+            self.__pending_ids[WriteTopics.PROJECTS].update(project_ids)
+            raise
+
+    async def __render_feeds(self, db_session: AsyncSession) -> None:
+        """Render the RSS and Atom feeds of the latest articles.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+        """
+        articles = await articles_service.get_latest_articles(settings.FEEDS_MAX_ITEMS, db_session)
+        self.__rss = self.__document(self.__render_rss(articles))
+        self.__atom = self.__document(self.__render_atom(articles))
+
+    def __render_rss(self, articles: List[Article]) -> ElementTree.Element:
+        """Render the RSS feed.
+
+        Args:
+            articles (List[Article]): The articles to include, newest first.
+
+        Returns:
+            ElementTree.Element: The root of the feed.
+        """
+        rss = ElementTree.Element("rss", version="2.0")
+        channel = ElementTree.SubElement(rss, "channel")
+        ElementTree.SubElement(channel, "title").text = settings.FEEDS_TITLE
+        ElementTree.SubElement(channel, "link").text = settings.FEEDS_SITE_URL
+        ElementTree.SubElement(channel, "description").text = settings.FEEDS_DESCRIPTION
+        if articles:
+            ElementTree.SubElement(channel, "lastBuildDate").text = format_datetime(
+                to_datetime(max(article.updated_at or article.created_at for article in articles))
+            )
+
+        for article in articles:
+            link = self.__article_url(article.id)
+            item = ElementTree.SubElement(channel, "item")
+            ElementTree.SubElement(item, "title").text = article.title
+            ElementTree.SubElement(item, "link").text = link
+            ElementTree.SubElement(item, "guid", isPermaLink="true").text = link
+            ElementTree.SubElement(item, "description").text = article.description
+            ElementTree.SubElement(item, "pubDate").text = format_datetime(to_datetime(article.created_at))
+            for tag in article.tags or []:
+                ElementTree.SubElement(item, "category").text = tag["name"]
+        return rss
+
+    def __render_atom(self, articles: List[Article]) -> ElementTree.Element:
+        """Render the Atom feed.
+
+        Args:
+            articles (List[Article]): The articles to include, newest first.
+
+        Returns:
+            ElementTree.Element: The root of the feed.
+        """
+        feed = ElementTree.Element("feed", xmlns=ATOM_NAMESPACE)
+        ElementTree.SubElement(feed, "id").text = f"{settings.FEEDS_SITE_URL}/"
+        ElementTree.SubElement(feed, "title").text = settings.FEEDS_TITLE
+        ElementTree.SubElement(feed, "subtitle").text = settings.FEEDS_DESCRIPTION
+        ElementTree.SubElement(feed, "link", href=f"{settings.FEEDS_SITE_URL}/")
+        ElementTree.SubElement(feed, "updated").text = (
+            to_datetime(max(article.updated_at or article.created_at for article in articles))
+            if articles
+            else datetime(2020, 1, 1, tzinfo=timezone.utc)
+        ).isoformat()
+
+        for article in articles:
+            link = self.__article_url(article.id)
+            entry = ElementTree.SubElement(feed, "entry")
+            ElementTree.SubElement(entry, "id").text = link
+            ElementTree.SubElement(entry, "title").text = article.title
+            ElementTree.SubElement(entry, "link", href=link)
+            ElementTree.SubElement(entry, "summary").text = article.description
+            ElementTree.SubElement(ElementTree.SubElement(entry, "author"), "name").text = article.author
+            ElementTree.SubElement(entry, "published").text = to_datetime(article.created_at).isoformat()
+            ElementTree.SubElement(entry, "updated").text = to_datetime(
+                article.updated_at or article.created_at
+            ).isoformat()
+            for tag in article.tags or []:
+                ElementTree.SubElement(entry, "category", term=tag["name"])
+        return feed
+
+    async def __render_sitemap(
+        self, article_ids: Optional[List[int]], project_ids: Optional[List[int]], db_session: AsyncSession
+    ) -> None:
+        """Render the sitemap entries of the articles and projects.
+
+        Args:
+            article_ids (Optional[List[int]]): The IDs of the written articles, all articles are
+                rendered in case of ```None```.
+            project_ids (Optional[List[int]]): The IDs of the written projects, all projects are
+                rendered in case of ```None```.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the articles or projects.
+        """
+        articles_statement = select(Article.id, Article.created_at, Article.updated_at)
+        if article_ids is not None:
+            articles_statement = articles_statement.where(
+                Article.id == any_(bindparam("ids", article_ids, type_=ARRAY(Integer)))
+            )
+        projects_statement = select(Project.id)
+        if project_ids is not None:
+            projects_statement = projects_statement.where(
+                Project.id == any_(bindparam("ids", project_ids, type_=ARRAY(Integer)))
+            )
+
+        try:
+            articles: AsyncResult = await db_session.execute(articles_statement)
+            entries = {
+                (WriteTopics.ARTICLES, article_id): self.__sitemap_entry(
+                    self.__article_url(article_id), updated_at or created_at
+                )
+                for article_id, created_at, updated_at in articles.all()
+            }
+            projects: AsyncResult = await db_session.execute(projects_statement)
+            entries.update(
+                {
+                    (WriteTopics.PROJECTS, project_id): self.__sitemap_entry(
+                        settings.FEEDS_SITE_URL + settings.FEEDS_PROJECT_PATH.format(project_id=project_id)
+                    )
+                    for project_id in projects.scalars().all()
+                }
+            )
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the sitemap entries",
+            ) from BaseException
+
+        if article_ids is None and project_ids is None:
+            self.__sitemap_entries, self.__sitemap_hash = {}, 0
+            written = list(entries)
+        else:
+            written = [(WriteTopics.ARTICLES, article_id) for article_id in article_ids or []]
+            written.extend((WriteTopics.PROJECTS, project_id) for project_id in project_ids or [])
+
+        # The hash of the sitemap combines the hashes of its entries, so that it can be updated incrementally
+        for key in written:
+            previous = self.__sitemap_entries.pop(key, None)
+            if previous is not None:
+                self.__sitemap_hash ^= self.__hash(previous)
+            entry = entries.get(key)
+            if entry is not None:
+                self.__sitemap_entries[key] = entry
+                self.__sitemap_hash ^= self.__hash(entry)
+
+    @staticmethod
+    def __sitemap_entry(url: str, last_modified: Optional[date] = None) -> str:
+        """Render the entry of the sitemap.
+
+        Args:
+            url (str): The URL of the page.
+            last_modified (Optional[date], optional): The date, the page has been modified
+                the last time. Defaults to ```None```.
+
+        Returns:
+            str: The rendered entry.
+        """
+        if last_modified is None:
+            return f"<url><loc>{escape(url)}</loc></url>\n"
+        return f"<url><loc>{escape(url)}</loc><lastmod>{last_modified.isoformat()}</lastmod></url>\n"
+
+    @staticmethod
+    def __article_url(article_id: int) -> str:
+        """Get the URL of the page of the article.
+
+        Args:
+            article_id (int): The ID of the article.
+
+        Returns:
+            str: The URL of the article.
+        """
+        return settings.FEEDS_SITE_URL + settings.FEEDS_ARTICLE_PATH.format(article_id=article_id)
+
+    @staticmethod
+    def __hash(entry: str) -> int:
+        """Hash the sitemap entry.
+
+        Args:
+            entry (str): The rendered entry.
+
+        Returns:
+            int: The hash of the entry.
+        """
+        return int.from_bytes(hashlib.sha1(entry.encode()).digest(), "big")
+
+    @staticmethod
+    def __document(root: ElementTree.Element) -> Document:
+        """Serialize the document and compute its entity tag.
+
+        Args:
+            root (ElementTree.Element): The root of the document.
+
+        Returns:
+            Document: The serialized document.
+        """
+        body = ElementTree.tostring(root, encoding="utf-8", xml_declaration=True)
+        return Document(body, f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+feeds_service = FeedsService()
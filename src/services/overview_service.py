@@ -0,0 +1,140 @@
+"""Overview service."""
+import asyncio
+from typing import Dict, List, Optional, Tuple, cast
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.db.base import LazySession
+from src.schemas.articles_schema import ArticleDB
+from src.schemas.overview_schema import Overview
+from src.schemas.projects_schema import ProjectDB
+from src.schemas.skills_schema import SkillDB
+from src.services.articles_service import articles_service
+from src.services.projects_service import projects_service
+from src.services.skills_service import skills_service
+from src.util.tracing import traced
+from src.util.ttl_cache import TTLCache
+from src.util.write_events import WriteTopics, write_events
+
+
+@traced
+class OverviewService:
+    """Provides the aggregated content for the landing page."""
+
+    def __init__(self) -> None:
+        """Initiate a new instance.
+
+        Creates the cache for the overview, that is cleared as soon as
+        articles, projects or skills are written.
+        """
+        self.overview_cache: TTLCache[Overview] = TTLCache(settings.OVERVIEW_CACHE_TTL_SECONDS, 16)
+        self.__generation = 0
+        for topic in WriteTopics:
+            write_events.subscribe(topic, self.invalidate)
+
+    def invalidate(self, resource_id: Optional[int] = None) -> None:
+        """Remove all cached overviews.
+
+        The generation is advanced as well, so that overviews fetched before the
+        write are not stored once their queries complete.
+
+        Args:
+            resource_id (Optional[int], optional): The ID of the written resource, not
+                required since the whole cache is cleared. Defaults to ```None```.
+        """
+        self.__generation += 1
+        self.overview_cache.clear()
+
+    async def get_overview(
+        self, articles_limit: int, projects_limit: int, deadline: Optional[float] = None
+    ) -> Overview:
+        """Get the latest articles, projects and the skills grouped by category.
+
+        The three queries are executed concurrently, each on its own session and
+        therefore on its own pooled connection. The result is cached as a whole.
+
+        Args:
+            articles_limit (int): The maximum number of articles to return.
+            projects_limit (int): The maximum number of projects to return.
+            deadline (Optional[float], optional): The ```time.monotonic``` timestamp, until which
+                the queries need to be finished. Defaults to ```None```, meaning no timeout.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the content.
+
+        Returns:
+            Overview: The aggregated content.
+        """
+        cache_key: Tuple[int, int] = (articles_limit, projects_limit)
+        overview = self.overview_cache.get(cache_key)
+        if overview is not None:
+            return overview
+
+        generation = self.__generation
+        try:
+            articles, projects, skills = await asyncio.gather(
+                self.__get_articles(articles_limit, deadline),
+                self.__get_projects(projects_limit, deadline),
+                self.__get_skills(deadline),
+            )
+        except HTTPException:
+            raise
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the overview",
+            ) from BaseException
+
+        overview = Overview(articles=articles, projects=projects, skills=skills)
+        if generation == self.__generation:
+            self.overview_cache.set(cache_key, overview)
+        return overview
+
+    async def __get_articles(self, limit: int, deadline: Optional[float]) -> List[ArticleDB]:
+        """Get the latest articles using a dedicated session.
+
+        Args:
+            limit (int): The maximum number of articles to return.
+            deadline (Optional[float]): The deadline of the queries.
+
+        Returns:
+            List[ArticleDB]: The latest articles.
+        """
+        async with LazySession(deadline=deadline) as db_session:
+            articles = await articles_service.get_latest_articles(limit, cast(AsyncSession, db_session))
+            return [ArticleDB.from_orm(article) for article in articles]
+
+    async def __get_projects(self, limit: int, deadline: Optional[float]) -> List[ProjectDB]:
+        """Get the latest projects using a dedicated session.
+
+        Args:
+            limit (int): The maximum number of projects to return.
+            deadline (Optional[float]): The deadline of the queries.
+
+        Returns:
+            List[ProjectDB]: The latest projects.
+        """
+        async with LazySession(deadline=deadline) as db_session:
+            projects = await projects_service.get_latest_projects(limit, cast(AsyncSession, db_session))
+            return [ProjectDB.from_orm(project) for project in projects]
+
+    async def __get_skills(self, deadline: Optional[float]) -> Dict[str, List[SkillDB]]:
+        """Get the skills grouped by category using a dedicated session.
+
+        Args:
+            deadline (Optional[float]): The deadline of the queries.
+
+        Returns:
+            Dict[str, List[SkillDB]]: The skills per category.
+        """
+        async with LazySession(deadline=deadline) as db_session:
+            skills_by_category = await skills_service.get_skills_by_category(cast(AsyncSession, db_session))
+            return {
+                category: [SkillDB(**skill) for skill in skills]
+                for category, skills in skills_by_category.items()
+            }
+
+
+overview_service = OverviewService()
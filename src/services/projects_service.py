@@ -1,23 +1,33 @@
 """Project services."""
-from typing import List, Union
+from typing import List, Optional, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, update
+from sqlalchemy import Integer, any_, bindparam, delete, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.future import select
 
+from src.db.columns import load_columns
 from src.models.project_model import Project
+from src.schemas.count_schema import TotalCount
 from src.schemas.projects_schema import (
     ProjectCreated,
+    ProjectDB,
     ProjectDeleted,
     ProjectUpdated,
     UpdateProject,
 )
+from src.services.count_service import count_service
+from src.util.single_flight import coalesced
+from src.util.tracing import traced
+from src.util.write_events import WriteTopics, write_events
 
 
+@traced
 class ProjectsService:
     """Provides all services to manage projects in the database."""
 
+    @coalesced(WriteTopics.PROJECTS)
     async def get_project(self, project_id: int, db_session: AsyncSession) -> Union[Project, None]:
         """Get the specified project from the database.
 
@@ -46,8 +56,9 @@ class ProjectsService:
                 "Error obtaining the project",
             ) from BaseException
 
+    @coalesced(WriteTopics.PROJECTS)
     async def get_projects(
-        self, skip: int, limit: int, db_session: AsyncSession
+        self, skip: int, limit: int, db_session: AsyncSession, columns: Optional[List[str]] = None
     ) -> Union[List[Project], None]:
         """Get all projects from the database.
 
@@ -55,6 +66,7 @@ class ProjectsService:
             skip: Number of elements to skip from the result set.
             limit: Maximum number of elements to return.
             db_session: The session for the database.
+            columns: The names of the columns to load, all columns in case of ``None``.
 
         Returns:
             The result of the database. Can be either of type ``List[Project]`` or ``None``, in
@@ -65,16 +77,91 @@ class ProjectsService:
 
         """
         try:
-            res: AsyncResult = await db_session.scalars(select(Project))
+            res: AsyncResult = await db_session.scalars(
+                select(Project)
+                .options(*load_columns(Project, columns))
+                .order_by(Project.id)
+                .offset(skip)
+                .limit(limit)
+            )
             projects_list: List[Project] = res.all()
             if projects_list is not None:
-                return projects_list[skip : skip + limit]
+                return projects_list
         except BaseException:
             raise HTTPException(
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
                 "Error obtaining all projects",
             ) from BaseException
 
+    @coalesced(WriteTopics.PROJECTS)
+    async def get_latest_projects(self, limit: int, db_session: AsyncSession) -> List[Project]:
+        """Get the most recently created projects from the database.
+
+        Args:
+            limit (int): Maximum number of projects to return.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the projects.
+
+        Returns:
+            List[Project]: The projects ordered by their ID, newest first.
+        """
+        try:
+            res: AsyncResult = await db_session.scalars(
+                select(Project).order_by(Project.id.desc()).limit(limit)
+            )
+            return res.all()  # noqa: TC300
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the latest projects",
+            ) from BaseException
+
+    async def count_projects(self, db_session: AsyncSession) -> TotalCount:
+        """Count the projects in the database.
+
+        The number is estimated for large tables, see ```CountService.count```.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            TotalCount: The number of projects and whether it is exact or estimated.
+        """
+        return await count_service.count(Project, db_session)
+
+    async def get_projects_by_ids(
+        self, project_ids: List[int], db_session: AsyncSession, columns: Optional[List[str]] = None
+    ) -> List[Project]:
+        """Get the specified projects from the database using a single query.
+
+        Args:
+            project_ids (List[int]): The IDs of the projects to obtain.
+            db_session (AsyncSession): The session for the database.
+            columns (Optional[List[str]], optional): The names of the columns to load, all columns
+                in case of ```None```. Defaults to ```None```.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the projects.
+
+        Returns:
+            List[Project]: The found projects in the order of the requested IDs.
+        """
+        try:
+            res: AsyncResult = await db_session.scalars(
+                select(Project)
+                .options(*load_columns(Project, columns))
+                .where(Project.id == any_(bindparam("ids", project_ids, type_=ARRAY(Integer))))
+            )
+            projects_by_id = {project.id: project for project in res.all()}
+            return [projects_by_id[project_id] for project_id in project_ids if project_id in projects_by_id]
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the projects",
+            ) from BaseException
+
     async def delete_project(self, project_id: int, db_session: AsyncSession) -> ProjectDeleted:
         """Delete the specified project from the database.
 
@@ -89,9 +176,12 @@ class ProjectsService:
             ProjectDeleted: The information, whether the specified project was successfully deleted.
         """
         try:
-            res: AsyncSession = await db_session.execute(delete(Project).where(Project.id == project_id))
-            if res.rowcount != 0:
+            res: AsyncResult = await db_session.execute(
+                delete(Project).where(Project.id == project_id).returning(Project.id)
+            )
+            if res.scalar() is not None:
                 await db_session.commit()
+                write_events.publish(WriteTopics.PROJECTS, project_id)
                 return {"project_id": project_id, "status": "Project deleted"}
             else:
                 return {"project_id": project_id, "status": "Project not found"}
@@ -121,6 +211,7 @@ class ProjectsService:
             db_session.add(new_project)
 
             await db_session.commit()
+            write_events.publish(WriteTopics.PROJECTS, new_project.id)
 
             return new_project  # noqa: TC300
         except BaseException:
@@ -130,33 +221,49 @@ class ProjectsService:
             ) from BaseException
 
     async def update_project(
-        self, project_id: int, project: UpdateProject, db_session: AsyncSession
-    ) -> ProjectUpdated:
+        self,
+        project_id: int,
+        project: UpdateProject,
+        db_session: AsyncSession,
+        return_representation: bool = False,
+    ) -> Union[ProjectDB, ProjectUpdated]:
         """Update the specified project in the database.
 
+        The update and the obtaining of the result are conducted in a single
+        ```UPDATE ... RETURNING``` statement.
+
         Args:
             project_id (int): The ID of the project to update.
             project (UpdateProject): The information that shall be updated in the project.
             db_session (AsyncSession):The session for the DB.
+            return_representation (bool, optional): Flag indicating, whether to return the updated
+                project instead of the status. Defaults to ```False```.
 
         Raises:
             HTTPException: Is being thrown as soon as an error occurs when updating the project.
 
         Returns:
-            ProjectUpdated: The status that indicates, whether the update was successful.
+            Union[ProjectDB, ProjectUpdated]: The updated project, in case it was requested and the
+                project exists. Otherwise the status that indicates, whether the update was successful.
         """
         try:
             update_project = project.dict(exclude_unset=True)
-            res: AsyncSession = await db_session.execute(
+            returning = Project.__table__.columns if return_representation else [Project.id]
+            res: AsyncResult = await db_session.execute(
                 update(Project)
                 .where(Project.id == project_id)
                 .values(
                     **update_project,
                 )
+                .returning(*returning)
             )
+            updated_project = res.mappings().first()
 
-            if res.rowcount != 0:
+            if updated_project is not None:
                 await db_session.commit()
+                write_events.publish(WriteTopics.PROJECTS, project_id)
+                if return_representation:
+                    return ProjectDB(**updated_project)
                 return {"project_id": project_id, "status": "Project updated"}
             else:
                 return {"project_id": project_id, "status": "Project not found"}
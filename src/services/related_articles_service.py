@@ -0,0 +1,157 @@
+"""Related articles service."""
+import asyncio
+import time
+from typing import Dict, List, Optional, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.future import select
+from starlette.concurrency import run_in_threadpool
+
+from src.config.settings import settings
+from src.models.article_model import Article
+from src.schemas.articles_schema import ArticleDB, RelatedArticle
+from src.services.articles_service import articles_service
+from src.util.similarity_index import SimilarityIndex
+from src.util.tracing import traced
+from src.util.write_events import WriteTopics, write_events
+
+
+@traced
+class RelatedArticlesService:
+    """Provides the articles, that share the most tags with an article.
+
+    The similarities are precomputed in a ```SimilarityIndex```, which is built on
+    first use and rebuilt after ```RELATED_ARTICLES_REBUILD_SECONDS```, to pick up
+    writes of other workers. Writes of this worker are applied incrementally on the
+    next request.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance.
+
+        Subscribes to the writes of articles, for updating the index.
+        """
+        self.__index: Optional[SimilarityIndex] = None
+        self.__built_at = 0.0
+        self.__rebuild = True
+        self.__pending_ids: Set[int] = set()
+        self.__lock: Optional[asyncio.Lock] = None
+        write_events.subscribe(WriteTopics.ARTICLES, self.mark_changed)
+
+    def mark_changed(self, article_id: Optional[int] = None) -> None:
+        """Mark the article as changed, for updating the index on the next request.
+
+        Args:
+            article_id (Optional[int], optional): The ID of the created, updated or deleted
+                article. The whole index is rebuilt in case of ```None```. Defaults to ```None```.
+        """
+        if article_id is None:
+            self.__rebuild = True
+        else:
+            self.__pending_ids.add(article_id)
+
+    async def get_related_articles(
+        self, article_id: int, limit: int, db_session: AsyncSession
+    ) -> List[RelatedArticle]:
+        """Get the articles sharing the most tags with the specified article.
+
+        The content of the articles is not loaded, use ```get_article``` to obtain it.
+
+        Args:
+            article_id (int): The ID of the article.
+            limit (int): The maximum number of articles to return, bounded by ```RELATED_ARTICLES_TOP_K```.
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            List[RelatedArticle]: The related articles, most similar first. Empty in case the article
+                does not exist or has no tag in common with any other article.
+        """
+        index = await self.__get_index(db_session)
+        neighbors = dict(index.neighbors(article_id)[:limit])
+        if not neighbors:
+            return []
+
+        articles = await articles_service.get_articles_by_ids(list(neighbors), db_session)
+        return [
+            RelatedArticle(**ArticleDB.from_orm(article).dict(), score=neighbors[article.id])
+            for article in articles
+        ]
+
+    async def __get_index(self, db_session: AsyncSession) -> SimilarityIndex:
+        """Get the index, after building or updating it if required.
+
+        The computation is conducted in the threadpool, to not block the event loop.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            SimilarityIndex: The up to date index.
+        """
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+
+        async with self.__lock:
+            expired = time.monotonic() - self.__built_at >= settings.RELATED_ARTICLES_REBUILD_SECONDS
+            if self.__index is None or self.__rebuild or expired:
+                self.__rebuild = False
+                self.__pending_ids.clear()
+                built_at = time.monotonic()
+                index = SimilarityIndex(settings.RELATED_ARTICLES_TOP_K)
+                try:
+                    await run_in_threadpool(index.build, await self.__get_tag_names(None, db_session))
+                except BaseException:
+                    self.__rebuild = True
+                    raise
+                self.__index, self.__built_at = index, built_at
+            elif self.__pending_ids:
+                article_ids = list(self.__pending_ids)
+                self.__pending_ids.clear()
+                try:
+                    changed = await self.__get_tag_names(article_ids, db_session)
+                except BaseException:
+                    self.__pending_ids.update(article_ids)
+                    raise
+                removed = [article_id for article_id in article_ids if article_id not in changed]
+                await run_in_threadpool(self.__index.update, changed, removed)
+            return self.__index
+
+    async def __get_tag_names(
+        self, article_ids: Optional[List[int]], db_session: AsyncSession
+    ) -> Dict[int, List[str]]:
+        """Get the normalized tag names of the articles.
+
+        Args:
+            article_ids (Optional[List[int]]): The IDs of the articles, all articles in case of ```None```.
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the tags.
+
+        Returns:
+            Dict[int, List[str]]: The tag names by the ID of the article.
+        """
+        statement = select(Article.id, Article.tags)
+        if article_ids is not None:
+            statement = statement.where(
+                Article.id == any_(bindparam("ids", article_ids, type_=ARRAY(Integer)))
+            )
+
+        try:
+            res: AsyncResult = await db_session.execute(statement)
+            tag_names = {
+                article_id: [tag["name"].strip().lower() for tag in tags or []]
+                for article_id, tags in res.all()
+            }
+            return tag_names  # noqa: TC300
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the article tags",
+            ) from BaseException
+
+
+related_articles_service = RelatedArticlesService()
@@ -1,18 +1,49 @@
 """Skills service."""
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, update
+from sqlalchemy import (
+    JSON,
+    Integer,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal_column,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.future import select
 
+from src.config.settings import settings
+from src.db.columns import load_columns
 from src.models.skill_model import Skill
+from src.schemas.count_schema import TotalCount
 from src.schemas.skills_schema import SkillAdjusted, SkillDB, SkillSchema
+from src.services.count_service import count_service
+from src.util.single_flight import coalesced
+from src.util.tracing import traced
+from src.util.ttl_cache import TTLCache
+from src.util.write_events import WriteTopics, write_events
 
 
+@traced
 class SkillsService:
     """Provides all services to manage skills in the database."""
 
+    def __init__(self) -> None:
+        """Initiate a new instance.
+
+        Creates the cache for the skills grouped by category, that is cleared
+        as soon as a skill is written.
+        """
+        self.skills_by_category_cache: TTLCache[Dict[str, List[Dict[str, Any]]]] = TTLCache(
+            settings.SKILLS_CACHE_TTL_SECONDS, 1
+        )
+        write_events.subscribe(WriteTopics.SKILLS, lambda _: self.skills_by_category_cache.clear())
+
+    @coalesced(WriteTopics.SKILLS)
     async def get_skill(self, skill_id: int, db_session: AsyncSession) -> SkillDB:
         """Get the specified skill from the database.
 
@@ -41,13 +72,17 @@ class SkillsService:
                 "Error obtaining the skill",
             ) from BaseException
 
-    async def get_skills(self, skip: int, limit: int, db_session: AsyncSession) -> List[Skill]:
+    @coalesced(WriteTopics.SKILLS)
+    async def get_skills(
+        self, skip: int, limit: int, db_session: AsyncSession, columns: Optional[List[str]] = None
+    ) -> List[Skill]:
         """Get all skills from the database.
 
         Args:
             skip: Number of elements to skip from the result set.
             limit: Maximum number of elements to return.
             db_session: The session for the database.
+            columns: The names of the columns to load, all columns in case of ``None``.
 
         Returns:
             List[Skill]: The result of the database.
@@ -57,16 +92,118 @@ class SkillsService:
 
         """
         try:
-            res: AsyncResult = await db_session.scalars(select(Skill))
+            res: AsyncResult = await db_session.scalars(
+                select(Skill)
+                .options(*load_columns(Skill, columns))
+                .order_by(Skill.id)
+                .offset(skip)
+                .limit(limit)
+            )
             skill_list: List[Skill] = res.all()
             if skill_list is not None:
-                return skill_list[skip : skip + limit]
+                return skill_list
         except BaseException:
             raise HTTPException(
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
                 "Error obtaining all skills",
             ) from BaseException
 
+    async def get_skills_by_category(self, db_session: AsyncSession) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all skills grouped by their category.
+
+        The grouping and ordering is conducted by the database using a single
+        aggregated query. The result is cached until the skills are written.
+        Skills without a category are not part of any group and therefore omitted.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the skills.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The skills per category, ordered by their experience.
+        """
+        skills_by_category = self.skills_by_category_cache.get(None)
+        if skills_by_category is not None:
+            return skills_by_category
+
+        try:
+            # The keys are rendered as literals, since asyncpg is not able to
+            # determine the type of bound parameters passed to json_build_object
+            skill_object = func.json_build_object(
+                *(
+                    argument
+                    for column in Skill.__table__.columns
+                    for argument in (literal_column(f"'{column.name}'"), column)
+                )
+            )
+            res: AsyncResult = await db_session.execute(
+                select(
+                    Skill.category,
+                    func.json_agg(
+                        aggregate_order_by(skill_object, Skill.experience.desc(), Skill.name),
+                        type_=JSON,
+                    ),
+                )
+                .where(Skill.category.isnot(None))
+                .group_by(Skill.category)
+                .order_by(Skill.category)
+            )
+            skills_by_category = dict(res.all())
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the skills by category",
+            ) from BaseException
+
+        self.skills_by_category_cache.set(None, skills_by_category)
+        return skills_by_category
+
+    async def count_skills(self, db_session: AsyncSession) -> TotalCount:
+        """Count the skills in the database.
+
+        The number is estimated for large tables, see ```CountService.count```.
+
+        Args:
+            db_session (AsyncSession): The session for the database.
+
+        Returns:
+            TotalCount: The number of skills and whether it is exact or estimated.
+        """
+        return await count_service.count(Skill, db_session)
+
+    async def get_skills_by_ids(
+        self, skill_ids: List[int], db_session: AsyncSession, columns: Optional[List[str]] = None
+    ) -> List[Skill]:
+        """Get the specified skills from the database using a single query.
+
+        Args:
+            skill_ids (List[int]): The IDs of the skills to obtain.
+            db_session (AsyncSession): The session for the database.
+            columns (Optional[List[str]], optional): The names of the columns to load, all columns
+                in case of ```None```. Defaults to ```None```.
+
+        Raises:
+            HTTPException: Is being thrown as soon as an error occurs when obtaining the skills.
+
+        Returns:
+            List[Skill]: The found skills in the order of the requested IDs.
+        """
+        try:
+            res: AsyncResult = await db_session.scalars(
+                select(Skill)
+                .options(*load_columns(Skill, columns))
+                .where(Skill.id == any_(bindparam("ids", skill_ids, type_=ARRAY(Integer))))
+            )
+            skills_by_id = {skill.id: skill for skill in res.all()}
+            return [skills_by_id[skill_id] for skill_id in skill_ids if skill_id in skills_by_id]
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error obtaining the skills",
+            ) from BaseException
+
     async def delete_skill(self, skill_id: int, db_session: AsyncSession) -> SkillAdjusted:
         """Delete the specified skill from the database.
 
@@ -81,9 +218,12 @@ class SkillsService:
             SkillDeleted: The information, whether the specified skill was successfully deleted.
         """
         try:
-            res: AsyncSession = await db_session.execute(delete(Skill).where(Skill.id == skill_id))
-            if res.rowcount != 0:
+            res: AsyncResult = await db_session.execute(
+                delete(Skill).where(Skill.id == skill_id).returning(Skill.id)
+            )
+            if res.scalar() is not None:
                 await db_session.commit()
+                write_events.publish(WriteTopics.SKILLS, skill_id)
                 return {"skill_id": skill_id, "status": "Skill deleted"}
             else:
                 return {"skill_id": skill_id, "status": "Skill not found"}
@@ -114,6 +254,7 @@ class SkillsService:
             db_session.add(new_skill)
 
             await db_session.commit()
+            write_events.publish(WriteTopics.SKILLS, new_skill.id)
 
             return new_skill  # noqa: TC300
         except BaseException:
@@ -123,33 +264,49 @@ class SkillsService:
             ) from BaseException
 
     async def update_skill(
-        self, skill_id: int, skill: SkillSchema, db_session: AsyncSession
-    ) -> SkillAdjusted:
+        self,
+        skill_id: int,
+        skill: SkillSchema,
+        db_session: AsyncSession,
+        return_representation: bool = False,
+    ) -> Union[SkillDB, SkillAdjusted]:
         """Update the specified skill in the database.
 
+        The update and the obtaining of the result are conducted in a single
+        ```UPDATE ... RETURNING``` statement.
+
         Args:
             skill_id (int): The ID of the skill to update.
             skill (SkillSchema): The information that shall be updated in the skill.
             db_session (AsyncSession):The session for the DB.
+            return_representation (bool, optional): Flag indicating, whether to return the updated
+                skill instead of the status. Defaults to ```False```.
 
         Raises:
             HTTPException: Is being thrown as soon as an error occurs when updating the skill.
 
         Returns:
-            SkillUpdated: The status that indicates, whether the update was successful.
+            Union[SkillDB, SkillAdjusted]: The updated skill, in case it was requested and the
+                skill exists. Otherwise the status that indicates, whether the update was successful.
         """
         try:
             update_skill = skill.dict(exclude_unset=True)
-            res: AsyncSession = await db_session.execute(
+            returning = Skill.__table__.columns if return_representation else [Skill.id]
+            res: AsyncResult = await db_session.execute(
                 update(Skill)
                 .where(Skill.id == skill_id)
                 .values(
                     **update_skill,
                 )
+                .returning(*returning)
             )
+            updated_skill = res.mappings().first()
 
-            if res.rowcount != 0:
+            if updated_skill is not None:
                 await db_session.commit()
+                write_events.publish(WriteTopics.SKILLS, skill_id)
+                if return_representation:
+                    return SkillDB(**updated_skill)
                 return SkillAdjusted(skill_id=skill_id, status="Skill updated")
             else:
                 return SkillAdjusted(skill_id=skill_id, status="Skill not found")
@@ -0,0 +1,142 @@
+"""Token revocation service."""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+
+from src.config.settings import settings
+from src.db.base import async_session
+from src.models.revoked_token_model import RevokedToken
+from src.schemas.token_schema import TokenPayload
+from src.util.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# Revocations committed by concurrent transactions can carry an earlier timestamp than
+# the latest loaded one, they are covered by loading the recent revocations again
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+
+@traced
+class TokenRevocationService:
+    """Revokes tokens and checks, whether a token has been revoked.
+
+    The revocations are stored in the database and mirrored in memory, so that
+    checking a token is a single set lookup without accessing the database. The
+    mirror loads the revocations of other workers every ```TOKEN_REVOCATION_REFRESH_SECONDS```
+    and only holds the IDs of the revoked tokens, that have not expired yet.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.__revoked: Dict[str, float] = {}
+        self.__loaded_until: Optional[datetime] = None
+        self.__refresher: Optional["asyncio.Task[None]"] = None
+
+    def is_revoked(self, token_payload: TokenPayload) -> bool:
+        """Check whether the token has been revoked.
+
+        Args:
+            token_payload (TokenPayload): The decoded token.
+
+        Returns:
+            bool: ```True``` in case the token has been revoked.
+        """
+        return token_payload.jti is not None and token_payload.jti in self.__revoked
+
+    async def revoke(self, token_payload: TokenPayload) -> None:
+        """Revoke the token.
+
+        The token is rejected by this worker immediately and by the other workers
+        as soon as they refreshed their revocations.
+
+        Args:
+            token_payload (TokenPayload): The decoded token to revoke.
+
+        Raises:
+            HTTPException: The token does not have an ID and can not be revoked.
+            HTTPException: Is being thrown as soon as an error occurs when storing the revocation.
+        """
+        if token_payload.jti is None:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, "The token can not be revoked")
+
+        try:
+            async with async_session() as db_session:
+                await db_session.execute(
+                    insert(RevokedToken)
+                    .values(
+                        jti=token_payload.jti,
+                        expires_at=datetime.fromtimestamp(token_payload.exp, timezone.utc),
+                    )
+                    .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+                )
+                await db_session.commit()
+        except BaseException:
+            raise HTTPException(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Error revoking the token",
+            ) from BaseException
+
+        self.__revoked[token_payload.jti] = token_payload.exp
+
+    async def refresh(self) -> None:
+        """Load the revocations added since the last refresh and drop the expired ones.
+
+        All revocations are loaded on the first refresh. The expired revocations are
+        deleted from the database as well, since the expired tokens are rejected anyway.
+        """
+        now = time.time()
+        self.__revoked = {jti: expires_at for jti, expires_at in self.__revoked.items() if expires_at > now}
+
+        statement = select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at).where(
+            RevokedToken.expires_at > func.now()
+        )
+        if self.__loaded_until is not None:
+            statement = statement.where(RevokedToken.revoked_at >= self.__loaded_until - REFRESH_OVERLAP)
+
+        try:
+            async with async_session() as db_session:
+                rows = (await db_session.execute(statement)).all()
+                await db_session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= func.now()))
+                await db_session.commit()
+        except Exception:
+            logger.exception("Error refreshing the revoked tokens")
+            return
+
+        for jti, expires_at, revoked_at in rows:
+            self.__revoked[jti] = expires_at.timestamp()
+            if self.__loaded_until is None or revoked_at > self.__loaded_until:
+                self.__loaded_until = revoked_at
+        if self.__loaded_until is None:
+            self.__loaded_until = datetime.now(timezone.utc)
+
+    async def start(self) -> None:
+        """Load the revocations and start refreshing them periodically."""
+        if self.__refresher is None:
+            await self.refresh()
+            self.__refresher = asyncio.create_task(self.__refresh_periodically())
+
+    async def stop(self) -> None:
+        """Stop refreshing the revocations."""
+        if self.__refresher is not None:
+            self.__refresher.cancel()
+            try:
+                await self.__refresher
+            except asyncio.CancelledError:
+                pass
+            self.__refresher = None
+
+    async def __refresh_periodically(self) -> None:
+        """Refresh the revocations after each interval."""
+        while True:
+            await asyncio.sleep(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+            await self.refresh()
+
+
+token_revocation_service = TokenRevocationService()
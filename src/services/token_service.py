@@ -1,16 +1,36 @@
 """Token services."""
+import uuid
 from datetime import datetime, timedelta
+from typing import Optional, Union
 from zoneinfo import ZoneInfo
 
 from jose import jwt
-from jose.exceptions import ExpiredSignatureError
+from jose.backends.base import Key
+from jose.exceptions import ExpiredSignatureError, JWTError
 
 from src.config.settings import settings
 from src.schemas.token_schema import AuthToken, Token, TokenPayload, TokenTypes
+from src.util.jwt_keyset import JWKSDocument, JWTKeyset
+
+# Loaded once, since the lookup reads the time zone database from the disk
+TOKEN_TIME_ZONE = ZoneInfo("Europe/Amsterdam")
+
+EMPTY_JWKS = JWKSDocument(b'{"keys": []}', '"empty"')
 
 
 class TokenService:
-    """Provides services for generating the auth tokens."""
+    """Provides services for generating the auth tokens.
+
+    Tokens are signed with the shared secrets for the HMAC algorithms. For asymmetric
+    algorithms, they are signed with the current key of the keyset and carry its ```kid```,
+    so that anyone can verify them using the public keys from the JWKS.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.keyset: Optional[JWTKeyset] = None
+        if not settings.ALGORITHM.startswith("HS"):
+            self.keyset = JWTKeyset(settings.JWT_KEYS_DIR, settings.ALGORITHM)
 
     def __generate_token(
         self,
@@ -32,12 +52,19 @@ class TokenService:
         """
         payload = {
             "sub": user_id,
-            "iat": int(datetime.now(ZoneInfo("Europe/Amsterdam")).timestamp()),
+            "iat": int(datetime.now(TOKEN_TIME_ZONE).timestamp()),
             "exp": expires_in,
             "type": type,
+            "jti": uuid.uuid4().hex,
         }
 
-        return jwt.encode(payload, secret, algorithm=settings.ALGORITHM)  # type: ignore[no-any-return]
+        if self.keyset is None:
+            return jwt.encode(payload, secret, algorithm=settings.ALGORITHM)  # type: ignore[no-any-return]
+
+        signing_key = self.keyset.signing_key
+        return jwt.encode(  # type: ignore[no-any-return]
+            payload, signing_key.private_key, algorithm=settings.ALGORITHM, headers={"kid": signing_key.kid}
+        )
 
     def generate_auth_tokens(self, user_id: str) -> AuthToken:
         """Generate the access and refresh tokens.
@@ -70,11 +97,13 @@ class TokenService:
 
         return auth_token.dict()["__root__"]
 
-    def decode_token(self, token: str) -> TokenPayload:
+    def decode_token(self, token: str, token_type: TokenTypes = TokenTypes.ACCESS_TOKEN) -> TokenPayload:
         """Decode the provided JWT token and returns it.
 
         Args:
             token (str): The JWT token that shall be validated and encoded.
+            token_type (TokenTypes, optional): The expected type of the token, since both types
+                are signed with the same key for asymmetric algorithms. Defaults to ```ACCESS_TOKEN```.
 
         Raises:
             Exception: General exception that needs to be handled from the calling function.
@@ -83,11 +112,48 @@ class TokenService:
             TokenPayload: The decoded JWT token.
         """
         try:
-            token_payload = jwt.decode(token, settings.JWT_SECRET_KEY, settings.ALGORITHM)
+            token_payload = TokenPayload(
+                **jwt.decode(token, self.__verification_key(token, token_type), settings.ALGORITHM)
+            )
+            if token_payload.type != token_type:
+                raise JWTError("Unexpected token type")
 
-            return TokenPayload(**token_payload)  # noqa: TC300
+            return token_payload  # noqa: TC300
         except ExpiredSignatureError:
             raise Exception() from ExpiredSignatureError  # noqa: TC002
 
+    def get_jwks(self) -> JWKSDocument:
+        """Get the public keys for verifying the tokens.
+
+        Returns:
+            JWKSDocument: The JSON Web Key Set, which is empty for the HMAC algorithms.
+        """
+        if self.keyset is None:
+            return EMPTY_JWKS
+        return self.keyset.jwks
+
+    def __verification_key(self, token: str, token_type: TokenTypes) -> Union[str, Key]:
+        """Get the key for verifying the token.
+
+        Args:
+            token (str): The token to verify.
+            token_type (TokenTypes): The expected type of the token.
+
+        Raises:
+            JWTError: The token was signed with an unknown or expired key.
+
+        Returns:
+            Union[str, Key]: The shared secret or the public key identified by the ```kid```.
+        """
+        if self.keyset is None:
+            if token_type == TokenTypes.REFRESH_TOKEN:
+                return settings.JWT_REFRESH_SECRET_KEY
+            return settings.JWT_SECRET_KEY
+
+        key = self.keyset.verification_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise JWTError("Unknown signing key")
+        return key
+
 
 token_service = TokenService()
@@ -2,21 +2,53 @@
 from typing import Union
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncResult
 from sqlalchemy.future import select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from src.config.settings import settings
 from src.models.user_model import User
 from src.schemas.user_schema import UserCreated, UserDeleted
+from src.util.tracing import traced
+from src.util.ttl_cache import TTLCache
 
 
+@traced
 class UserService:
     """Provides all user related services."""
 
+    def __init__(self) -> None:
+        """Initiate a new instance.
+
+        Creates the cache for the users, that is keyed by the normalized mail address.
+        """
+        self.user_cache: TTLCache[User] = TTLCache(
+            settings.USER_CACHE_TTL_SECONDS,
+            settings.USER_CACHE_MAX_SIZE,
+        )
+
+    @staticmethod
+    def __normalize_mail(mail: str) -> str:
+        """Normalize the mail address for using it as a cache key.
+
+        Args:
+            mail (str): The mail address to normalize.
+
+        Returns:
+            str: The normalized mail address.
+        """
+        return mail.strip().lower()
+
     async def create_new_user(self, db_session: Session, mail: str, password: str) -> UserCreated:
         """Create a new user in the database.
 
+        The password is hashed in the threadpool before the user is inserted using a single
+        ```INSERT ... ON CONFLICT DO NOTHING``` statement, that relies on the unique index
+        on the lower case mail address.
+
         Args:
             db_session (Session): The session for the DB.
             mail (str): The mail address of the new user.
@@ -30,12 +62,16 @@ class UserService:
             UserCreated: The status, that the user has been successfully created.
         """
         try:
-            user_in_db = await self.get_user(db_session, mail)
-            if user_in_db is None:
-                new_user = User(email=mail, hash_password=password)
-                db_session.add(new_user)
-
+            password_hash = await run_in_threadpool(User.generate_password_hash, password)
+            res: AsyncResult = await db_session.execute(
+                insert(User)
+                .values(email=mail, password=password_hash)
+                .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+                .returning(User.id)
+            )
+            if res.scalar() is not None:
                 await db_session.commit()  # type: ignore[func-returns-value]
+                self.user_cache.invalidate(self.__normalize_mail(mail))
 
                 return {"email": mail, "status": "User successfully created"}
             raise HTTPException(  # noqa: TC301
@@ -53,7 +89,9 @@ class UserService:
     async def get_user(self, db_session: Session, mail: str) -> Union[User, None]:
         """Get the user from the DB.
 
-        Returns the matched user based on the provided ID.
+        Returns the matched user based on the provided mail address, that is compared
+        case-insensitive. Found users are cached
+        for ```USER_CACHE_TTL_SECONDS```, so repeated lookups do not query the DB.
 
         Args:
             db_session (Session): The session for the DB.
@@ -66,11 +104,20 @@ class UserService:
             Union[User, None]: Can be either the user information ```User``` in case it is
             available or ```None```.
         """
+        cache_key = self.__normalize_mail(mail)
+        cached_user = self.user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+
         try:
-            res: AsyncResult = await db_session.execute(select(User).where(User.email == mail))
+            res: AsyncResult = await db_session.execute(
+                select(User).where(func.lower(User.email) == cache_key)
+            )
             user: User = res.scalars().first()
 
             if user is not None:
+                # Store a detached copy, so that the cache does not keep the session alive
+                self.user_cache.set(cache_key, User(id=user.id, email=user.email, password=user.password))
                 return user
             else:
                 return None
@@ -93,10 +140,15 @@ class UserService:
         Returns:
             UserDeleted: The status indicating, whether the deletion was successful.
         """
+        normalized_mail = self.__normalize_mail(mail)
+
         try:
-            res: AsyncResult = await db_session.execute(delete(User).where(User.email == mail))
+            res: AsyncResult = await db_session.execute(
+                delete(User).where(func.lower(User.email) == normalized_mail)
+            )
             if res.rowcount != 0:
                 await db_session.commit()  # type: ignore[func-returns-value]
+                self.user_cache.invalidate(normalized_mail)
                 return {"email": mail, "status": "User deleted"}
             else:
                 return {"email": mail, "status": "User not found"}
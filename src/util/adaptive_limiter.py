@@ -0,0 +1,131 @@
+"""Provides a concurrency limit, that adapts to the observed latency."""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from src.config.settings import settings
+
+# Weight of a new latency sample in the recent latency
+LATENCY_ADAPTATION = 0.1
+# Weight of the recent latency in the baseline, so that the baseline follows changes of the workload slowly
+BASELINE_ADAPTATION = 0.01
+
+
+class AdaptiveLimiter:
+    """Limits the number of concurrent operations using AIMD.
+
+    The limit is increased by one per window of ```limit``` operations, as long as the
+    recent latency stays within ```CONCURRENCY_LATENCY_TOLERANCE``` times the baseline latency.
+    As soon as it exceeds it or an operation failed due to overload, the limit is
+    multiplied by ```CONCURRENCY_BACKOFF_RATIO```, at most once per latency interval.
+
+    The recent latency and the baseline are moving averages of the latency, that adapt
+    quickly and slowly. In contrast to the minimum latency, the averages stay comparable
+    in case fast and slow operations are mixed, e.g. cached and uncached reads.
+
+    Operations exceeding the limit wait in a bounded FIFO queue for at most
+    ```CONCURRENCY_QUEUE_TIMEOUT_SECONDS```, before they are rejected.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.limit = float(settings.CONCURRENCY_INITIAL_LIMIT)
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self.__last_decrease = 0.0
+        self.__waiters: Deque["asyncio.Future[bool]"] = deque()
+
+    @property
+    def queued(self) -> int:
+        """The number of operations waiting for a slot.
+
+        Returns:
+            int: The length of the queue.
+        """
+        return len(self.__waiters)
+
+    async def acquire(self) -> bool:
+        """Acquire a slot for an operation.
+
+        Returns:
+            bool: ```True``` in case a slot has been acquired, which needs to be released
+                afterwards. ```False``` in case the queue is full or the timeout passed.
+        """
+        if not self.__waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return True
+        if len(self.__waiters) >= settings.CONCURRENCY_QUEUE_SIZE:
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter: "asyncio.Future[bool]" = loop.create_future()
+        self.__waiters.append(waiter)
+        expiration = loop.call_later(settings.CONCURRENCY_QUEUE_TIMEOUT_SECONDS, self.__expire, waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self.release()
+            elif waiter in self.__waiters:
+                self.__waiters.remove(waiter)
+            raise
+        finally:
+            expiration.cancel()
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """Release the slot of a finished operation and adapt the limit.
+
+        Args:
+            latency (Optional[float], optional): The latency of the operation in seconds.
+                Defaults to ```None```, meaning the limit is not adapted.
+            overloaded (bool, optional): Flag indicating, whether the operation failed due to
+                overload, e.g. because of a timeout. Defaults to ```False```.
+        """
+        self.in_flight -= 1
+        if latency is not None:
+            self.__adapt(latency, overloaded)
+        self.__admit()
+
+    def __adapt(self, latency: float, overloaded: bool) -> None:
+        """Adapt the limit to the latency of a finished operation.
+
+        Args:
+            latency (float): The latency of the operation in seconds.
+            overloaded (bool): Flag indicating, whether the operation failed due to overload.
+        """
+        if self.latency is None or self.baseline is None:
+            self.latency = self.baseline = latency
+        else:
+            self.latency += (latency - self.latency) * LATENCY_ADAPTATION
+            self.baseline += (self.latency - self.baseline) * BASELINE_ADAPTATION
+
+        if overloaded or self.latency > self.baseline * settings.CONCURRENCY_LATENCY_TOLERANCE:
+            now = time.monotonic()
+            # Operations started before the last decrease do not reflect it yet
+            if now - self.__last_decrease >= latency:
+                self.__last_decrease = now
+                self.limit = max(
+                    float(settings.CONCURRENCY_MIN_LIMIT), self.limit * settings.CONCURRENCY_BACKOFF_RATIO
+                )
+        else:
+            self.limit = min(float(settings.CONCURRENCY_MAX_LIMIT), self.limit + 1 / self.limit)
+
+    def __admit(self) -> None:
+        """Pass free slots to the waiting operations."""
+        while self.__waiters and self.in_flight < int(self.limit):
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+    def __expire(self, waiter: "asyncio.Future[bool]") -> None:
+        """Reject the waiting operation, since it waited too long.
+
+        Args:
+            waiter (asyncio.Future[bool]): The future of the waiting operation.
+        """
+        if not waiter.done():
+            self.__waiters.remove(waiter)
+            waiter.set_result(False)
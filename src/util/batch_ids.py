@@ -0,0 +1,61 @@
+"""Functions for handling requests of several resources by their IDs."""
+from typing import Iterable, List, Optional
+
+from fastapi import HTTPException, Query, Response, status
+
+from src.config.settings import settings
+
+MISSING_IDS_HEADER = "X-Missing-IDs"
+
+
+def parse_ids(
+    ids: Optional[str] = Query(
+        default=None,
+        description="Comma separated IDs of the items to obtain, e.g. ```1,5,9```",
+        example="1,5,9",
+    )
+) -> Optional[List[int]]:
+    """Parse the comma separated IDs of the query.
+
+    Duplicated IDs are removed while keeping the requested order.
+
+    Args:
+        ids (Optional[str], optional): The comma separated IDs. Defaults to ```None```.
+
+    Raises:
+        HTTPException: The IDs are not valid integers.
+        HTTPException: More IDs than ```BATCH_MAX_IDS``` were requested.
+
+    Returns:
+        Optional[List[int]]: The parsed IDs or ```None```, in case no IDs were provided.
+    """
+    if ids is None:
+        return None
+
+    try:
+        parsed_ids = list(dict.fromkeys(int(id) for id in ids.split(",") if id.strip()))
+    except ValueError:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, "IDs must be comma separated integers"
+        ) from ValueError
+
+    if len(parsed_ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            f"At most {settings.BATCH_MAX_IDS} IDs can be requested at once",
+        )
+    return parsed_ids
+
+
+def report_missing_ids(response: Response, requested_ids: Iterable[int], found_ids: Iterable[int]) -> None:
+    """Add the IDs that were requested but not found to the response headers.
+
+    Args:
+        response (Response): The response to add the header to.
+        requested_ids (Iterable[int]): The requested IDs.
+        found_ids (Iterable[int]): The IDs that were found.
+    """
+    found = set(found_ids)
+    missing_ids = [str(id) for id in requested_ids if id not in found]
+    if missing_ids:
+        response.headers[MISSING_IDS_HEADER] = ",".join(missing_ids)
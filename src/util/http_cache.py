@@ -0,0 +1,20 @@
+"""Functions for the conditional requests of cacheable documents."""
+from fastapi import Request
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client already has the current version of the document.
+
+    Args:
+        request (Request): The request, containing the ```If-None-Match``` header.
+        etag (str): The entity tag of the current version.
+
+    Returns:
+        bool: ```True``` in case one of the requested tags matches, using the weak comparison.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+
+    requested_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in requested_tags or etag.removeprefix("W/") in requested_tags
@@ -5,9 +5,13 @@ from typing import Optional
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from src.schemas.token_schema import TokenPayload
+from src.services.token_revocation_service import token_revocation_service
 from src.services.token_service import token_service
+from src.util.tracing import traced
 
 
+@traced
 class JWTAuthentication(HTTPBearer):
     """Provides the logic to extract and validate a JWT token."""
 
@@ -23,7 +27,8 @@ class JWTAuthentication(HTTPBearer):
     async def __call__(self, request: Request) -> HTTPAuthorizationCredentials:
         """Validate the credentials in the request.
 
-        Checks, whether a valid bearer token was provided in the request.
+        Checks, whether a valid bearer token was provided in the request. The subject
+        of a valid token is stored as ```user``` in the state of the request.
 
         Args:
             request (Request): The current request object, containing all client related information.
@@ -41,29 +46,33 @@ class JWTAuthentication(HTTPBearer):
         if token:
             if token.scheme != "Bearer":
                 raise HTTPException(status.HTTP_403_FORBIDDEN, "Not supported authentication scheme")
-            if not self.__verify_token(token.credentials):
+            token_payload = self.__verify_token(token.credentials)
+            if token_payload is None:
                 raise HTTPException(status.HTTP_403_FORBIDDEN, "Invalid bearer token")
+            request.state.user = token_payload.sub
             return token
         else:
             raise HTTPException(status.HTTP_403_FORBIDDEN, "No credentials provided")
 
-    def __verify_token(self, token: str) -> bool:
+    def __verify_token(self, token: str) -> Optional[TokenPayload]:
         """Verify the provided token.
 
         Verifies the token and checks, whether the decoded token
-            is still valid.
+            is still valid and has not been revoked.
 
         Args:
             token (str): The token that should be validated.
 
         Returns:
-            bool: The result, whether the provided token is valid.
+            Optional[TokenPayload]: The decoded token or ```None```, in case the token is not valid.
         """
         try:
             token_payload = token_service.decode_token(token)
+            if token_revocation_service.is_revoked(token_payload):
+                return None
             if datetime.fromtimestamp(token_payload.exp) > datetime.now():
-                return True
+                return token_payload
             else:
-                return False
+                return None
         except BaseException:
-            return False
+            return None
@@ -0,0 +1,184 @@
+"""Provides the asymmetric keys for signing and verifying the JWT tokens."""
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional, cast
+
+from jose import jwk
+from jose.backends.base import Key
+
+from src.config.settings import settings
+
+# Other workers may sign with a key before this one rescanned the directory, therefore an
+# unknown kid triggers a rescan, which is throttled since the kid is chosen by the client
+UNKNOWN_KID_RELOAD_SECONDS = 5.0
+
+
+class KeyEntry(NamedTuple):
+    """A key of the keyset."""
+
+    kid: str
+    created_at: float
+    published_at: float
+    private_key: Key
+    public_key: Key
+
+
+class JWKSDocument(NamedTuple):
+    """The public keys as JSON Web Key Set and its entity tag."""
+
+    body: bytes
+    etag: str
+
+
+class JWTKeyset:
+    """Holds the keys for signing and verifying the tokens.
+
+    The private keys are read from the PEM files ```<kid>.pem``` in ```JWT_KEYS_DIR```.
+    A new key is published in the JWKS as soon as it is loaded, but only signs tokens
+    ```JWKS_MAX_AGE_SECONDS``` after this process published it, so that the caches of
+    the verifiers know it by then. The previous keys verify the tokens they signed, until
+    ```JWT_KEY_GRACE_MINUTES``` after the rotation passed.
+
+    On startup, the keys modified more than ```JWKS_MAX_AGE_SECONDS + JWT_KEYS_RELOAD_SECONDS```
+    ago are considered as published by the other processes already. In case no key is
+    active, the oldest key signs the tokens.
+
+    The directory is scanned again every ```JWT_KEYS_RELOAD_SECONDS```, so that keys
+    can be rotated by adding a new file, without restarting the app.
+    """
+
+    def __init__(self, directory: str, algorithm: str):
+        """Initiate a new instance.
+
+        The keys are loaded on first use.
+
+        Args:
+            directory (str): The directory containing the private keys.
+            algorithm (str): The signing algorithm, e.g. ```RS256``` or ```ES256```.
+        """
+        self.directory = directory
+        self.algorithm = algorithm
+        self.__keys: Dict[str, KeyEntry] = {}
+        self.__signing_key: Optional[KeyEntry] = None
+        self.__jwks = JWKSDocument(b"", "")
+        self.__reload_at = 0.0
+        self.__unknown_kid_reload_at = 0.0
+
+    @property
+    def signing_key(self) -> KeyEntry:
+        """The key for signing new tokens.
+
+        Returns:
+            KeyEntry: The key, whose ```kid``` needs to be set in the header of the token.
+        """
+        self.__reload_if_due()
+        return cast(KeyEntry, self.__signing_key)
+
+    @property
+    def jwks(self) -> JWKSDocument:
+        """The public keys, including the not yet active ones.
+
+        Returns:
+            JWKSDocument: The JWKS serialized as JSON.
+        """
+        self.__reload_if_due()
+        return self.__jwks
+
+    def verification_key(self, kid: Optional[str]) -> Optional[Key]:
+        """Get the public key for verifying a token.
+
+        The directory is scanned again for an unknown key, which another worker might
+        sign with already, at most every ```UNKNOWN_KID_RELOAD_SECONDS```.
+
+        Args:
+            kid (Optional[str]): The ID of the key from the header of the token.
+
+        Returns:
+            Optional[Key]: The public key, ```None``` in case the key is unknown or expired.
+        """
+        self.__reload_if_due()
+        if kid is None:
+            return None
+        entry = self.__keys.get(kid)
+        now = time.monotonic()
+        if entry is None and now >= self.__unknown_kid_reload_at:
+            self.__unknown_kid_reload_at = now + UNKNOWN_KID_RELOAD_SECONDS
+            self.__load()
+            entry = self.__keys.get(kid)
+        return entry.public_key if entry is not None else None
+
+    def __reload_if_due(self) -> None:
+        """Load the keys, in case the reload interval passed or a key needs to be activated."""
+        if time.monotonic() >= self.__reload_at:
+            self.__load()
+
+    def __load(self) -> None:
+        """Read the keys from the directory and determine the signing key.
+
+        The timestamps of the publication are taken from ```time.monotonic```, since
+        the modification times of the files differ between the copies of the directory.
+
+        Raises:
+            ValueError: The directory does not contain any key.
+        """
+        now = time.monotonic()
+        # Keys of an older age have been published by the processes running before this one
+        published_before = time.time() - settings.JWKS_MAX_AGE_SECONDS - settings.JWT_KEYS_RELOAD_SECONDS
+        starting = self.__signing_key is None
+        entries: List[KeyEntry] = []
+        for file_name in sorted(os.listdir(self.directory)):
+            kid, extension = os.path.splitext(file_name)
+            if extension != ".pem":
+                continue
+            path = os.path.join(self.directory, file_name)
+            created_at = os.stat(path).st_mtime
+            entry = self.__keys.get(kid)
+            if entry is None or entry.created_at != created_at:
+                with open(path, encoding="utf-8") as key_file:
+                    private_key = jwk.construct(key_file.read(), self.algorithm)
+                published_at = now
+                if starting and created_at <= published_before:
+                    published_at -= settings.JWKS_MAX_AGE_SECONDS
+                entry = KeyEntry(kid, created_at, published_at, private_key, private_key.public_key())
+            entries.append(entry)
+
+        if not entries:
+            raise ValueError(f"No signing keys found in {self.directory}")
+
+        entries.sort(key=lambda entry: entry.created_at)
+        active = [entry for entry in entries if entry.published_at + settings.JWKS_MAX_AGE_SECONDS <= now]
+        signing_key = active[-1] if active else entries[0]
+        activated_at = min(signing_key.published_at + settings.JWKS_MAX_AGE_SECONDS, now)
+        grace_ends_at = activated_at + (settings.JWT_KEY_GRACE_MINUTES or 0) * 60
+
+        self.__keys = {
+            entry.kid: entry
+            for entry in entries
+            if entry.created_at >= signing_key.created_at or now < grace_ends_at
+        }
+        self.__signing_key = signing_key
+        self.__jwks = self.__serialize()
+
+        # Reload early for activating a pending key or dropping the keys whose grace ended
+        due_at = [
+            entry.published_at + settings.JWKS_MAX_AGE_SECONDS
+            for entry in entries
+            if entry.created_at > signing_key.created_at
+        ]
+        if any(entry.created_at < signing_key.created_at for entry in self.__keys.values()):
+            due_at.append(grace_ends_at)
+        self.__reload_at = min([now + settings.JWT_KEYS_RELOAD_SECONDS, *due_at])
+
+    def __serialize(self) -> JWKSDocument:
+        """Serialize the public keys as JWKS.
+
+        Returns:
+            JWKSDocument: The serialized JWKS.
+        """
+        keys = [
+            {**entry.public_key.to_dict(), "kid": entry.kid, "use": "sig"} for entry in self.__keys.values()
+        ]
+        body = json.dumps({"keys": keys}, sort_keys=True).encode()
+        return JWKSDocument(body, f'"{hashlib.sha1(body).hexdigest()}"')
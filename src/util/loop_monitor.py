@@ -0,0 +1,109 @@
+"""Provides the monitoring of the responsiveness of the event loop."""
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from typing import Optional
+
+from src.config.settings import settings
+from src.util.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopMonitor:
+    """Measures how late the event loop runs scheduled callbacks.
+
+    A background task sleeps for ```LOOP_MONITOR_INTERVAL_SECONDS``` and measures
+    how much later than expected it is woken up. The lag is exported as metric.
+
+    In debug mode, a watchdog thread additionally schedules a callback on the loop
+    and logs the stack of the loop thread, in case the callback is not run within
+    ```LOOP_BLOCKING_THRESHOLD_SECONDS```. The stack shows the code holding the loop.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.lag_histogram = metrics.histogram(
+            "event_loop_lag_seconds", "Delay of the event loop in running scheduled callbacks"
+        )
+        self.blocked_counter = metrics.counter(
+            "event_loop_blocked_total", "Number of times the event loop was blocked longer than the threshold"
+        )
+        self.__monitor: Optional["asyncio.Task[None]"] = None
+        self.__watchdog: Optional[threading.Thread] = None
+        self.__stopped = threading.Event()
+
+    async def start(self) -> None:
+        """Start monitoring the running event loop."""
+        if self.__monitor is not None:
+            return
+
+        self.__monitor = asyncio.create_task(self.__measure_lag())
+        if settings.DEBUG:
+            self.__stopped.clear()
+            self.__watchdog = threading.Thread(
+                target=self.__watch,
+                args=(asyncio.get_running_loop(), threading.get_ident()),
+                name="event-loop-watchdog",
+                daemon=True,
+            )
+            self.__watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring the event loop."""
+        if self.__monitor is not None:
+            self.__monitor.cancel()
+            try:
+                await self.__monitor
+            except asyncio.CancelledError:
+                pass
+            self.__monitor = None
+
+        if self.__watchdog is not None:
+            self.__stopped.set()
+            self.__watchdog = None
+
+    async def __measure_lag(self) -> None:
+        """Measure the lag of the event loop periodically."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + settings.LOOP_MONITOR_INTERVAL_SECONDS
+            await asyncio.sleep(settings.LOOP_MONITOR_INTERVAL_SECONDS)
+            self.lag_histogram.observe(max(0.0, loop.time() - expected))
+
+    def __watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        """Log the stack of the loop thread, whenever the loop is blocked.
+
+        Runs in its own thread, since it needs to observe the loop while it is blocked.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The monitored loop.
+            loop_thread_id (int): The ID of the thread running the loop.
+        """
+        threshold = settings.LOOP_BLOCKING_THRESHOLD_SECONDS
+        while not self.__stopped.wait(threshold):
+            responded = threading.Event()
+            try:
+                loop.call_soon_threadsafe(responded.set)
+            except RuntimeError:
+                # The loop has been closed
+                return
+
+            if responded.wait(threshold):
+                continue
+
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "unknown"
+            self.blocked_counter.inc()
+            logger.warning(
+                "Event loop blocked for more than %.3fs, currently executing:\n%s", threshold, stack
+            )
+
+            # Only report every blocking once
+            while not responded.wait(threshold) and not self.__stopped.is_set():
+                pass
+
+
+event_loop_monitor = EventLoopMonitor()
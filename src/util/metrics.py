@@ -0,0 +1,256 @@
+"""Provides in-memory metrics, that can be exported in the Prometheus text format."""
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Tuple, TypeVar
+
+LabelValues = Tuple[str, ...]
+
+M = TypeVar("M", bound="Metric")
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format the labels of a sample.
+
+    Args:
+        names (Sequence[str]): The names of the labels.
+        values (Sequence[str]): The values of the labels.
+
+    Returns:
+        str: The formatted labels, empty in case there are none.
+    """
+    if not names:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+class Metric(ABC):
+    """Base class of a metric with optional labels."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        """Initiate a new instance.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Sequence[str], optional): The names of the labels. Defaults to ```()```.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format.
+
+        Returns:
+            List[str]: The lines of the metric.
+        """
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type}", *self.samples()]
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Render the samples of the metric.
+
+        Returns:
+            List[str]: The lines of the samples.
+        """
+
+
+class Counter(Metric):
+    """Metric, whose value only increases."""
+
+    type = "counter"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        """Initiate a new instance.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Sequence[str], optional): The names of the labels. Defaults to ```()```.
+        """
+        super().__init__(name, description, label_names)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Increase the value.
+
+        Args:
+            *label_values (str): The values of the labels, in the order of their names.
+            amount (float, optional): The amount to add. Defaults to ```1```.
+        """
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def samples(self) -> List[str]:
+        """Render the samples of the metric.
+
+        Returns:
+            List[str]: The lines of the samples.
+        """
+        return [
+            f"{self.name}{format_labels(self.label_names, label_values)} {value}"
+            for label_values, value in self.values.items()
+        ]
+
+
+class Gauge(Counter):
+    """Metric, whose value can be set arbitrarily."""
+
+    type = "gauge"
+
+    def set(self, value: float, *label_values: str) -> None:
+        """Set the value.
+
+        Args:
+            value (float): The new value.
+            *label_values (str): The values of the labels, in the order of their names.
+        """
+        self.values[label_values] = value
+
+
+class Histogram(Metric):
+    """Metric, that counts the observed values in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initiate a new instance.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Sequence[str], optional): The names of the labels. Defaults to ```()```.
+            buckets (Sequence[float], optional): The upper bounds of the buckets.
+                Defaults to ```DEFAULT_BUCKETS```.
+        """
+        super().__init__(name, description, label_names)
+        self.buckets = (*sorted(buckets), math.inf)
+        self.counts: Dict[LabelValues, List[int]] = {}
+        self.sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Count the observed value.
+
+        Args:
+            value (float): The observed value.
+            *label_values (str): The values of the labels, in the order of their names.
+        """
+        counts = self.counts.setdefault(label_values, [0] * len(self.buckets))
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        self.sums[label_values] = self.sums.get(label_values, 0) + value
+
+    def samples(self) -> List[str]:
+        """Render the samples of the metric.
+
+        Returns:
+            List[str]: The lines of the samples.
+        """
+        lines = []
+        for label_values, counts in self.counts.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = format_labels(
+                    (*self.label_names, "le"), (*label_values, "+Inf" if math.isinf(bound) else str(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {self.sums[label_values]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds all metrics of the app, for exporting them at once."""
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.__metrics: Dict[str, Metric] = {}
+
+    def counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> Counter:
+        """Register a new counter.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Sequence[str], optional): The names of the labels. Defaults to ```()```.
+
+        Returns:
+            Counter: The registered counter.
+        """
+        return self.__register(Counter(name, description, label_names))
+
+    def gauge(self, name: str, description: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Register a new gauge.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Sequence[str], optional): The names of the labels. Defaults to ```()```.
+
+        Returns:
+            Gauge: The registered gauge.
+        """
+        return self.__register(Gauge(name, description, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Register a new histogram.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The description of the metric.
+            label_names (Sequence[str], optional): The names of the labels. Defaults to ```()```.
+            buckets (Sequence[float], optional): The upper bounds of the buckets.
+                Defaults to ```DEFAULT_BUCKETS```.
+
+        Returns:
+            Histogram: The registered histogram.
+        """
+        return self.__register(Histogram(name, description, label_names, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Returns:
+            str: The rendered metrics.
+        """
+        return "".join(line + "\n" for metric in self.__metrics.values() for line in metric.render())
+
+    def __register(self, metric: M) -> M:
+        """Register the metric, in case no metric with the same name exists.
+
+        Args:
+            metric (Metric): The metric to register.
+
+        Raises:
+            ValueError: A different metric with the same name has already been registered.
+
+        Returns:
+            M: The registered metric.
+        """
+        if metric.name in self.__metrics:
+            raise ValueError(f"Metric {metric.name} has already been registered")
+        self.__metrics[metric.name] = metric
+        return metric
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,159 @@
+"""Functions for limiting the login attempts against the API."""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from src.config.settings import settings
+
+
+class RateLimiterBackend(ABC):
+    """Storage for the token buckets of the rate limiter.
+
+    The in-memory implementation is sufficient for a single worker. In case the API is
+    running with multiple workers, a shared implementation (e.g. Redis) can be provided.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take a token from the bucket identified by the key.
+
+        Args:
+            key (str): The identifier of the bucket.
+            capacity (int): The maximum number of tokens the bucket can hold.
+            refill_per_second (float): The number of tokens that are added per second.
+
+        Returns:
+            float: ```0``` in case a token was available, otherwise the seconds until the next
+                token becomes available.
+        """
+
+
+class InMemoryRateLimiterBackend(RateLimiterBackend):
+    """Keeps the token buckets in the memory of the current worker."""
+
+    def __init__(self, max_keys: int = 10000):
+        """Initiate a new instance.
+
+        Args:
+            max_keys (int, optional): The maximum number of buckets to keep. As soon as the
+                limit is reached, all refilled buckets are dropped. Defaults to ```10000```.
+        """
+        self.__max_keys = max_keys
+        self.__buckets: Dict[str, Tuple[float, float]] = {}
+
+    async def consume(self, key: str, capacity: int, refill_per_second: float) -> float:
+        """Take a token from the bucket identified by the key.
+
+        Args:
+            key (str): The identifier of the bucket.
+            capacity (int): The maximum number of tokens the bucket can hold.
+            refill_per_second (float): The number of tokens that are added per second.
+
+        Returns:
+            float: ```0``` in case a token was available, otherwise the seconds until the next
+                token becomes available.
+        """
+        now = time.monotonic()
+        tokens, last_refill = self.__buckets.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - last_refill) * refill_per_second)
+
+        if tokens < 1:
+            self.__buckets[key] = (tokens, now)
+            return (1 - tokens) / refill_per_second
+
+        if key not in self.__buckets and len(self.__buckets) >= self.__max_keys:
+            self.__prune(now, capacity, refill_per_second)
+        self.__buckets[key] = (tokens - 1, now)
+        return 0
+
+    def __prune(self, now: float, capacity: int, refill_per_second: float) -> None:
+        """Remove all buckets that are completely refilled.
+
+        Args:
+            now (float): The current monotonic timestamp.
+            capacity (int): The maximum number of tokens a bucket can hold.
+            refill_per_second (float): The number of tokens that are added per second.
+        """
+        self.__buckets = {
+            key: (tokens, last_refill)
+            for key, (tokens, last_refill) in self.__buckets.items()
+            if tokens + (now - last_refill) * refill_per_second < capacity
+        }
+
+
+class LoginRateLimiter:
+    """Limits the login attempts per client IP and account and caps the concurrent hashing."""
+
+    def __init__(self, backend: RateLimiterBackend):
+        """Initiate a new instance.
+
+        Args:
+            backend (RateLimiterBackend): The storage for the token buckets.
+        """
+        self.backend = backend
+        self.__hashing_slots: Optional[asyncio.Semaphore] = None
+
+    async def check(self, request: Request, mail: str) -> None:
+        """Check, whether the client and the account are allowed to attempt a login.
+
+        Args:
+            request (Request): The current request object, containing all client related information.
+            mail (str): The mail address the client tries to log in with.
+
+        Raises:
+            HTTPException: Too many login attempts for the client IP or the account.
+        """
+        client_ip = request.client.host if request.client else "unknown"
+
+        retry_after = await self.backend.consume(
+            f"login:ip:{client_ip}",
+            settings.LOGIN_IP_BUCKET_SIZE,
+            settings.LOGIN_IP_REFILL_PER_MINUTE / 60,
+        )
+        if not retry_after:
+            retry_after = await self.backend.consume(
+                f"login:account:{mail.strip().lower()}",
+                settings.LOGIN_ACCOUNT_BUCKET_SIZE,
+                settings.LOGIN_ACCOUNT_REFILL_PER_MINUTE / 60,
+            )
+        if retry_after:
+            self.__raise_too_many_requests(retry_after)
+
+    @asynccontextmanager
+    async def hashing_slot(self) -> AsyncIterator[None]:
+        """Wait for one of the available slots for verifying a password.
+
+        Waiting attempts are queued instead of rejected, they are bounded by the
+        deadline of the request.
+
+        Yields:
+            Iterator[None]: Nothing, the slot is released as soon as the context is left.
+        """
+        # Created on first use, so that the semaphore belongs to the running event loop
+        if self.__hashing_slots is None:
+            self.__hashing_slots = asyncio.Semaphore(settings.LOGIN_MAX_CONCURRENT_HASHES)
+
+        async with self.__hashing_slots:
+            yield
+
+    def __raise_too_many_requests(self, retry_after: float) -> None:
+        """Raise the exception for rejecting the login attempt.
+
+        Args:
+            retry_after (float): The seconds the client should wait before trying again.
+
+        Raises:
+            HTTPException: Too many login attempts.
+        """
+        raise HTTPException(
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            "Too many login attempts. Please try again later",
+            headers={"Retry-After": str(max(1, round(retry_after)))},
+        )
+
+
+login_rate_limiter = LoginRateLimiter(InMemoryRateLimiterBackend())
@@ -0,0 +1,204 @@
+"""Provides an index of the most similar items based on their features."""
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+Neighbor = Tuple[int, float]
+
+
+class SimilarityIndex:
+    """In-memory index of the top-k most similar items by the Jaccard similarity of their features.
+
+    Every item is encoded as a bit vector over all known features. The similarities
+    are computed in blocks of items using a single matrix product per block, so that
+    the pairwise similarities never have to be materialized at once. Only the ```top_k```
+    neighbors per item are stored, which are updated incrementally on changes.
+    """
+
+    def __init__(self, top_k: int, block_size: int = 1024):
+        """Initiate a new instance.
+
+        Args:
+            top_k (int): The number of neighbors to store per item.
+            block_size (int, optional): The number of items, whose similarities are computed
+                at once. Bounds the memory to ```block_size``` times the number of items.
+                Defaults to ```1024```.
+        """
+        self.top_k = top_k
+        self.block_size = block_size
+        self.__features: Dict[str, int] = {}
+        self.__rows: Dict[int, int] = {}
+        self.__ids = np.zeros(0, dtype=np.int64)
+        self.__vectors = np.zeros((0, 0), dtype=np.uint8)
+        self.__neighbors: Dict[int, List[Neighbor]] = {}
+
+    def __contains__(self, item_id: int) -> bool:
+        """Check whether the item is part of the index.
+
+        Args:
+            item_id (int): The ID of the item.
+
+        Returns:
+            bool: ```True``` in case the item is indexed.
+        """
+        return item_id in self.__rows
+
+    def neighbors(self, item_id: int) -> List[Neighbor]:
+        """Get the most similar items.
+
+        Args:
+            item_id (int): The ID of the item.
+
+        Returns:
+            List[Neighbor]: The IDs of the most similar items with their similarity,
+                most similar first. Items without any common feature are not included.
+        """
+        return list(self.__neighbors.get(item_id, []))
+
+    def build(self, items: Dict[int, Iterable[str]]) -> None:
+        """Replace the indexed items and compute the neighbors of all of them.
+
+        Args:
+            items (Dict[int, Iterable[str]]): The features by the ID of the item.
+        """
+        self.__features = {}
+        encoded = {
+            item_id: [self.__features.setdefault(feature, len(self.__features)) for feature in set(features)]
+            for item_id, features in items.items()
+        }
+        self.__rows = {item_id: row for row, item_id in enumerate(encoded)}
+        self.__ids = np.fromiter(encoded, dtype=np.int64, count=len(encoded))
+        self.__vectors = np.zeros((len(encoded), len(self.__features)), dtype=np.uint8)
+        self.__neighbors = {}
+
+        for row, columns in enumerate(encoded.values()):
+            self.__vectors[row, columns] = 1
+        self.__compute_neighbors(list(self.__rows))
+
+    def update(self, changed: Dict[int, Iterable[str]], removed: Iterable[int] = ()) -> None:
+        """Incrementally update the index after items have been created, updated or removed.
+
+        Only the neighbors of the changed items and of the items that referenced a changed
+        or removed item are recomputed. All other items only need to check, whether a
+        changed item is now more similar than their least similar neighbor.
+
+        Args:
+            changed (Dict[int, Iterable[str]]): The features of the created or updated items.
+            removed (Iterable[int], optional): The IDs of the removed items. Defaults to ```()```.
+        """
+        removed_ids = {item_id for item_id in removed if item_id not in changed}
+        for item_id in removed_ids:
+            row = self.__rows.pop(item_id, None)
+            if row is not None:
+                self.__vectors[row] = 0
+                self.__ids[row] = -1
+            self.__neighbors.pop(item_id, None)
+
+        for item_id, features in changed.items():
+            self.__set_vector(item_id, features)
+
+        dirty: Set[int] = removed_ids | set(changed)
+        affected = set(changed) | {
+            item_id
+            for item_id, neighbors in self.__neighbors.items()
+            if any(neighbor_id in dirty for neighbor_id, _ in neighbors)
+        }
+        self.__compute_neighbors(list(affected))
+
+        if not changed:
+            return
+
+        matrix = self.__vectors.astype(np.float32)
+        changed_ids = list(changed)
+        similarities = self.__similarities(
+            matrix, np.array([self.__rows[item_id] for item_id in changed_ids])
+        )
+        for changed_id, row_similarities in zip(changed_ids, similarities):
+            for column in np.flatnonzero(row_similarities > 0):
+                other_id = int(self.__ids[column])
+                if other_id in affected or other_id < 0:
+                    continue
+                self.__offer(other_id, (changed_id, float(row_similarities[column])))
+
+    def __set_vector(self, item_id: int, features: Iterable[str]) -> None:
+        """Encode the features of the item as bit vector and store it.
+
+        Args:
+            item_id (int): The ID of the item.
+            features (Iterable[str]): The features of the item.
+        """
+        columns = [self.__features.setdefault(feature, len(self.__features)) for feature in set(features)]
+        if len(self.__features) > self.__vectors.shape[1]:
+            self.__vectors = np.pad(
+                self.__vectors, ((0, 0), (0, len(self.__features) - self.__vectors.shape[1]))
+            )
+
+        row = self.__rows.get(item_id)
+        if row is None:
+            row = len(self.__ids)
+            self.__rows[item_id] = row
+            self.__ids = np.append(self.__ids, item_id)
+            self.__vectors = np.pad(self.__vectors, ((0, 1), (0, 0)))
+
+        self.__vectors[row] = 0
+        self.__vectors[row, columns] = 1
+
+    def __similarities(self, matrix: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Compute the Jaccard similarities of the rows to all items.
+
+        Args:
+            matrix (np.ndarray): The bit vectors of all items as floats.
+            rows (np.ndarray): The rows of the items to compute the similarities for.
+
+        Returns:
+            np.ndarray: The similarities with one row per requested item and one column per item.
+        """
+        block = matrix[rows]
+        intersections = block @ matrix.T
+        sizes = matrix.sum(axis=1)
+        unions = sizes[rows][:, np.newaxis] + sizes[np.newaxis, :] - intersections
+        similarities = np.divide(intersections, unions, out=np.zeros_like(intersections), where=unions > 0)
+        similarities[np.arange(len(rows)), rows] = 0
+        return similarities
+
+    def __compute_neighbors(self, item_ids: List[int]) -> None:
+        """Compute and store the neighbors of the items, block by block.
+
+        Args:
+            item_ids (List[int]): The IDs of the items.
+        """
+        if not item_ids:
+            return
+
+        matrix = self.__vectors.astype(np.float32)
+        k = min(self.top_k, len(self.__ids))
+        for start in range(0, len(item_ids), self.block_size):
+            block_ids = item_ids[start : start + self.block_size]
+            similarities = self.__similarities(
+                matrix, np.array([self.__rows[item_id] for item_id in block_ids])
+            )
+            candidates = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+
+            for item_id, row_similarities, row_candidates in zip(block_ids, similarities, candidates):
+                scores = row_similarities[row_candidates]
+                order = np.argsort(-scores, kind="stable")
+                self.__neighbors[item_id] = [
+                    (int(self.__ids[column]), float(score))
+                    for column, score in zip(row_candidates[order], scores[order])
+                    if score > 0
+                ]
+
+    def __offer(self, item_id: int, candidate: Neighbor) -> None:
+        """Add the candidate to the neighbors of the item, in case it is similar enough.
+
+        Args:
+            item_id (int): The ID of the item.
+            candidate (Neighbor): The ID of the candidate and its similarity to the item.
+        """
+        neighbors = self.__neighbors.setdefault(item_id, [])
+        if len(neighbors) >= self.top_k and candidate[1] <= neighbors[-1][1]:
+            return
+
+        neighbors.append(candidate)
+        neighbors.sort(key=lambda neighbor: neighbor[1], reverse=True)
+        del neighbors[self.top_k :]
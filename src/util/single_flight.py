@@ -0,0 +1,209 @@
+"""Provides the coalescing of identical concurrent calls."""
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.db.base import LazySession
+from src.util.metrics import metrics
+from src.util.write_events import WriteTopics, write_events
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+FAN_OUT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Flight:
+    """A call in progress, that is shared by all its callers."""
+
+    def __init__(self, task: "asyncio.Task[Any]", topic: WriteTopics, db_session: LazySession):
+        """Initiate a new instance.
+
+        Args:
+            task (asyncio.Task[Any]): The task executing the call.
+            topic (WriteTopics): The resource read by the call.
+            db_session (LazySession): The session used by the call.
+        """
+        self.task = task
+        self.topic = topic
+        self.db_session = db_session
+        self.callers = 0
+        self.waiting = 0
+
+    def join(self, deadline: Optional[float]) -> None:
+        """Shorten the deadline of the call to the deadline of the joining caller.
+
+        Args:
+            deadline (Optional[float]): The deadline of the caller, ```None``` in case it has none.
+        """
+        if deadline is not None and (self.db_session.deadline is None or deadline < self.db_session.deadline):
+            self.db_session.deadline = deadline
+
+
+class SingleFlight:
+    """Executes identical concurrent calls only once and shares their result.
+
+    The first caller starts the call in a separate task, all callers with the same key
+    joining before it finished wait for that task. The result, as well as any raised
+    exception, is passed to all of them. The call is only cancelled, in case all of its
+    callers have been cancelled.
+
+    The call uses its own session, since it must not depend on the request that started
+    it. Its statements are limited to the earliest deadline of the callers. As soon as
+    the resource read by the call is written, later callers start a new call, so that
+    they observe the write.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.__flights: Dict[Hashable, Flight] = {}
+        self.fan_out_histogram = metrics.histogram(
+            "single_flight_fan_out", "Number of callers sharing a single call", ("method",), FAN_OUT_BUCKETS
+        )
+        self.coalesced_counter = metrics.counter(
+            "single_flight_coalesced_total", "Number of calls served by a call in progress", ("method",)
+        )
+        for topic in WriteTopics:
+            write_events.subscribe(topic, functools.partial(self.forget, topic))
+
+    async def do(
+        self,
+        name: str,
+        key: Hashable,
+        topic: WriteTopics,
+        function: Callable[[LazySession], Awaitable[T]],
+        deadline: Optional[float] = None,
+    ) -> T:
+        """Call the function or join the call in progress with the same key.
+
+        Args:
+            name (str): The name of the called method, used as label of the metrics.
+            key (Hashable): The key identifying identical calls.
+            topic (WriteTopics): The resource read by the function.
+            function (Callable[[LazySession], Awaitable[T]]): The function to call with the session to use.
+            deadline (Optional[float], optional): The ```time.monotonic``` timestamp, until which the
+                caller waits for the result. Defaults to ```None```, meaning no deadline.
+
+        Returns:
+            T: The result of the call.
+        """
+        flight = self.__flights.get(key)
+        if flight is None:
+            db_session = LazySession(deadline=deadline)
+            flight = Flight(asyncio.ensure_future(function(db_session)), topic, db_session)
+            self.__flights[key] = flight
+            flight.task.add_done_callback(functools.partial(self.__land, name, key, flight))
+        else:
+            flight.join(deadline)
+            self.coalesced_counter.inc(name)
+
+        flight.callers += 1
+        flight.waiting += 1
+        try:
+            return await asyncio.shield(flight.task)  # noqa: TC300
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiting == 1:
+                flight.task.cancel()
+                self.__remove(key, flight)
+            raise
+        finally:
+            flight.waiting -= 1
+
+    def forget(self, topic: WriteTopics, resource_id: Optional[int] = None) -> None:
+        """Remove the calls in progress reading the written resource.
+
+        The calls keep running for their current callers, but new callers do not join them,
+        since they might have started before the write was committed.
+
+        Args:
+            topic (WriteTopics): The written resource.
+            resource_id (Optional[int], optional): The ID of the written resource, not
+                required since all calls reading the resource are removed. Defaults to ```None```.
+        """
+        self.__flights = {key: flight for key, flight in self.__flights.items() if flight.topic != topic}
+
+    def __remove(self, key: Hashable, flight: Flight) -> None:
+        """Remove the call, unless it has already been replaced by a later call.
+
+        Args:
+            key (Hashable): The key of the call.
+            flight (Flight): The call to remove.
+        """
+        if self.__flights.get(key) is flight:
+            del self.__flights[key]
+
+    def __land(self, name: str, key: Hashable, flight: Flight, task: "asyncio.Task[Any]") -> None:
+        """Remove the finished call, so that later calls are executed again.
+
+        Args:
+            name (str): The name of the called method.
+            key (Hashable): The key of the call.
+            flight (Flight): The finished call.
+            task (asyncio.Task[Any]): The finished task.
+        """
+        self.__remove(key, flight)
+        self.fan_out_histogram.observe(flight.callers, name)
+        # Avoid warnings about unretrieved exceptions, in case all callers have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+single_flight = SingleFlight()
+
+
+def make_hashable(value: Any) -> Hashable:
+    """Convert lists, which are passed e.g. as column names, to tuples.
+
+    Args:
+        value (Any): The value of an argument.
+
+    Returns:
+        Hashable: The value usable as part of a key.
+    """
+    return tuple(make_hashable(item) for item in value) if isinstance(value, list) else value
+
+
+def coalesced(topic: WriteTopics) -> Callable[[F], F]:
+    """Coalesce identical concurrent calls of a service method reading from the database.
+
+    Calls are identical, in case all of their arguments except the ```db_session``` are
+    equal. The shared call uses its own session, limited to the earliest deadline of the
+    callers' sessions. The result is shared between the callers and must not be modified.
+
+    Args:
+        topic (WriteTopics): The resource read by the method, a write of it ends the coalescing
+            of the calls in progress.
+
+    Returns:
+        Callable[[F], F]: The decorator for the method, having a ```db_session``` parameter.
+    """
+
+    def decorator(method: F) -> F:
+        signature = inspect.signature(method)
+        name = method.__qualname__
+
+        @functools.wraps(method)
+        async def coalescing_method(*args: Any, **kwargs: Any) -> Any:
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = (
+                name,
+                *(
+                    make_hashable(value)
+                    for param, value in arguments.arguments.items()
+                    if param != "db_session"
+                ),
+            )
+            deadline = getattr(arguments.arguments.get("db_session"), "deadline", None)
+
+            async def call(db_session: LazySession) -> Any:
+                async with db_session:
+                    arguments.arguments["db_session"] = db_session
+                    return await method(*arguments.args, **arguments.kwargs)
+
+            return await single_flight.do(name, key, topic, call, deadline)
+
+        return coalescing_method  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,89 @@
+"""Provides the OpenTelemetry tracing of the app, which requires the tracing extra."""
+import functools
+import inspect
+import os
+from importlib.util import find_spec
+from typing import Any, Callable, Coroutine, TypeVar
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config.settings import settings
+
+T = TypeVar("T", bound=type)
+
+TRACING_MODULES = (
+    "opentelemetry.sdk",
+    "opentelemetry.instrumentation.asgi",
+    "opentelemetry.instrumentation.sqlalchemy",
+)
+TRACING_AVAILABLE = settings.TRACING_ENABLED and all(
+    find_spec(module) is not None for module in TRACING_MODULES
+)
+
+
+def traced(cls: T) -> T:
+    """Record a span for every call of the public coroutine methods of the class.
+
+    The class is returned unchanged in case tracing is not available, so that
+    the methods do not have any overhead.
+
+    Args:
+        cls (T): The class to trace.
+
+    Returns:
+        T: The class with traced methods.
+    """
+    if not TRACING_AVAILABLE:
+        return cls
+
+    from opentelemetry import trace
+
+    tracer = trace.get_tracer(cls.__module__)
+
+    def trace_method(name: str, method: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+        span_name = f"{cls.__name__}.{name}"
+
+        @functools.wraps(method)
+        async def traced_method(*args: Any, **kwargs: Any) -> Any:
+            with tracer.start_as_current_span(span_name):
+                return await method(*args, **kwargs)
+
+        return traced_method
+
+    for name, method in list(vars(cls).items()):
+        if inspect.iscoroutinefunction(method) and (not name.startswith("_") or name == "__call__"):
+            setattr(cls, name, trace_method(name, method))
+    return cls
+
+
+def configure_tracing(app: FastAPI, engine: AsyncEngine) -> None:
+    """Instrument the ASGI app and the SQLAlchemy engine and configure the exporter.
+
+    The context is propagated from the ```traceparent``` header of incoming requests.
+    Finished spans are exported in batches as JSON lines to ```TRACING_EXPORT_FILE```.
+
+    Args:
+        app (FastAPI): The app to instrument.
+        engine (AsyncEngine): The engine, whose statements are traced.
+    """
+    from opentelemetry import trace
+    from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    def format_span(span: ReadableSpan) -> str:
+        return span.to_json(indent=None) + os.linesep
+
+    # The file stays open for the lifetime of the process, the exporter writes to it in its own thread
+    export_file = open(settings.TRACING_EXPORT_FILE, "a", encoding="utf-8")
+    provider = TracerProvider(resource=Resource.create({SERVICE_NAME: settings.API_NAME}))
+    provider.add_span_processor(
+        BatchSpanProcessor(ConsoleSpanExporter(out=export_file, formatter=format_span))
+    )
+    trace.set_tracer_provider(provider)
+
+    SQLAlchemyInstrumentor().instrument(engine=engine.sync_engine, tracer_provider=provider)
+    app.add_middleware(OpenTelemetryMiddleware, tracer_provider=provider)
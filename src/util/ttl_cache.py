@@ -0,0 +1,82 @@
+"""Provides a simple in-memory cache with expiring entries."""
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """In-memory cache, whose entries expire after a fixed time.
+
+    The cache is bounded and drops the least recently used entry as soon as the
+    maximum size is reached. A ```ttl_seconds``` of ```0``` disables the cache.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1024):
+        """Initiate a new instance.
+
+        Args:
+            ttl_seconds (float): The number of seconds an entry stays valid.
+            max_size (int, optional): The maximum number of entries. Defaults to ```1024```.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.__entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Flag indicating, whether entries are stored at all.
+
+        Returns:
+            bool: ```True``` in case the cache is enabled.
+        """
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Get the entry stored for the key.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Optional[V]: The stored value or ```None```, in case there is no valid entry.
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.__entries[key]
+            return None
+
+        self.__entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store the value for the key.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (V): The value to store.
+        """
+        if not self.enabled:
+            return
+
+        self.__entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the entry for the key.
+
+        Args:
+            key (Hashable): The key of the entry to remove.
+        """
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.__entries.clear()
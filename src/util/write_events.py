@@ -0,0 +1,49 @@
+"""Provides notifications about writes conducted by the services."""
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+WriteListener = Callable[[Optional[int]], None]
+
+
+class WriteTopics(str, Enum):
+    """The resources, whose writes can be subscribed to."""
+
+    ARTICLES = "articles"
+    PROJECTS = "projects"
+    SKILLS = "skills"
+
+
+class WriteEvents:
+    """Notifies the subscribed listeners about created, updated or deleted resources.
+
+    Used for keeping caches and derived data up to date, without the services
+    having to know about them. Listeners are called synchronously and should
+    therefore only conduct cheap operations or schedule the actual work.
+    """
+
+    def __init__(self) -> None:
+        """Initiate a new instance."""
+        self.__listeners: Dict[WriteTopics, List[WriteListener]] = {}
+
+    def subscribe(self, topic: WriteTopics, listener: WriteListener) -> None:
+        """Subscribe the listener to the writes of the topic.
+
+        Args:
+            topic (WriteTopics): The resource to subscribe to.
+            listener (WriteListener): The function that is called with the ID of the written
+                resource, or ```None``` in case the ID is not known.
+        """
+        self.__listeners.setdefault(topic, []).append(listener)
+
+    def publish(self, topic: WriteTopics, resource_id: Optional[int] = None) -> None:
+        """Notify the listeners of the topic about a write.
+
+        Args:
+            topic (WriteTopics): The resource that has been written.
+            resource_id (Optional[int], optional): The ID of the written resource. Defaults to ```None```.
+        """
+        for listener in self.__listeners.get(topic, []):
+            listener(resource_id)
+
+
+write_events = WriteEvents()
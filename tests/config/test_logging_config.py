@@ -0,0 +1,63 @@
+import json
+import logging
+import queue
+import sys
+
+from src.config.logging_config import DeferredQueueHandler, JSONFormatter
+
+
+def create_record(**extra) -> logging.LogRecord:
+    record = logging.LogRecord("src.access", logging.INFO, __file__, 1, "%s %s %d", ("GET", "/", 200), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_extra_fields() -> None:
+    # Arrange
+    record = create_record(route="/", status=200, user=None)
+    # Act
+    entry = json.loads(JSONFormatter().format(record))
+    # Assert
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "src.access"
+    assert entry["message"] == "GET / 200"
+    assert entry["route"] == "/"
+    assert entry["status"] == 200
+    assert entry["user"] is None
+    assert "args" not in entry
+    assert "timestamp" in entry
+
+
+def test_json_formatter_includes_exception() -> None:
+    # Arrange
+    try:
+        raise ValueError("Failed")
+    except ValueError:
+        record = create_record(exc_info=sys.exc_info())
+    # Act
+    entry = json.loads(JSONFormatter().format(record))
+    # Assert
+    assert "ValueError: Failed" in entry["exception"]
+
+
+def test_json_formatter_serializes_unknown_types() -> None:
+    # Arrange
+    record = create_record(latency=object())
+    # Act
+    entry = json.loads(JSONFormatter().format(record))
+    # Assert
+    assert entry["latency"].startswith("<object object")
+
+
+def test_deferred_queue_handler_enqueues_unformatted_record() -> None:
+    # Arrange
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = DeferredQueueHandler(log_queue)
+    record = create_record()
+    # Act
+    handler.handle(record)
+    # Assert
+    queued_record = log_queue.get_nowait()
+    assert queued_record is record
+    assert queued_record.msg == "%s %s %d"
+    assert queued_record.args == ("GET", "/", 200)
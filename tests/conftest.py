@@ -5,6 +5,8 @@ from httpx import AsyncClient
 
 from src.db.base import async_session
 from src.main import app
+from src.services.user_service import user_service
+from src.util.rate_limiter import InMemoryRateLimiterBackend, login_rate_limiter
 from tests.utils.utils import get_auth_token_header
 
 pytest_plugins = "pytest_asyncio"
@@ -24,6 +26,25 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def disable_user_cache():
+    """
+    Disables the user cache for the test session, so that every test
+    observes the current state of the users table.
+    """
+    user_service.user_cache.ttl_seconds = 0
+    user_service.user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_login_rate_limiter():
+    """
+    Resets the login rate limits before every test, since all requests of the
+    test client originate from the same IP and would share a single bucket.
+    """
+    login_rate_limiter.backend = InMemoryRateLimiterBackend()
+
+
 @pytest.fixture(scope="session")
 async def db_session():
     """
@@ -0,0 +1,77 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from src.db.base import LazySession
+
+
+class FakeSession:
+    """Stands in for an ```AsyncSession```, recording whether it was closed."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.sync_session = Session()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def create_factory(sessions: List[FakeSession]):
+    def session_factory() -> FakeSession:
+        session = FakeSession()
+        sessions.append(session)
+        return session
+
+    return session_factory
+
+
+async def test_session_is_created_on_first_use() -> None:
+    # Arrange
+    sessions: List[FakeSession] = []
+    lazy_session = LazySession(create_factory(sessions))
+    # Act
+    started_before_use = lazy_session.started
+    closed = lazy_session.closed
+    # Assert
+    assert started_before_use is False
+    assert lazy_session.started is True
+    assert len(sessions) == 1
+    assert closed is False
+
+
+async def test_release_without_use_does_not_create_a_session() -> None:
+    # Arrange
+    sessions: List[FakeSession] = []
+    lazy_session = LazySession(create_factory(sessions))
+    # Act
+    await lazy_session.release()
+    # Assert
+    assert lazy_session.started is False
+    assert sessions == []
+
+
+async def test_released_session_is_recreated_on_reuse() -> None:
+    # Arrange
+    sessions: List[FakeSession] = []
+    lazy_session = LazySession(create_factory(sessions))
+    lazy_session.closed
+    # Act
+    await lazy_session.release()
+    released = lazy_session.started
+    lazy_session.closed
+    # Assert
+    assert released is False
+    assert len(sessions) == 2
+    assert sessions[0].closed is True
+    assert sessions[1].closed is False
+
+
+async def test_context_manager_releases_the_session() -> None:
+    # Arrange
+    sessions: List[FakeSession] = []
+    # Act
+    async with LazySession(create_factory(sessions)) as lazy_session:
+        lazy_session.closed
+    # Assert
+    assert lazy_session.started is False
+    assert sessions[0].closed is True
@@ -0,0 +1,142 @@
+import logging
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from fastapi import FastAPI, HTTPException, status
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine
+
+from src.config.settings import settings
+from src.middlewares.access_log_middleware import (
+    AccessLogMiddleware,
+    db_durations,
+    track_db_time,
+)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        durations = db_durations.get()
+        if durations is not None:
+            durations[0] += 0.25
+        return {"id": item_id}
+
+    @app.post("/items/")
+    async def create_item() -> dict:
+        return {"id": 1}
+
+    @app.get("/unavailable")
+    async def get_unavailable() -> None:
+        raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "Unavailable")
+
+    @app.get("/failing")
+    async def get_failing() -> None:
+        raise ValueError("Failed")
+
+    app.add_middleware(AccessLogMiddleware)
+    return app
+
+
+@pytest.fixture()
+async def access_log_client():
+    transport = ASGITransport(app=create_app(), raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def get_access_records(caplog: pytest.LogCaptureFixture) -> List[logging.LogRecord]:
+    return [record for record in caplog.records if record.name == "src.access"]
+
+
+async def test_successful_reads_are_sampled(
+    access_log_client: AsyncClient, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0)
+    caplog.set_level(logging.INFO, logger="src.access")
+    # Act
+    await access_log_client.get("/items/1")
+    await access_log_client.post("/items/")
+    # Assert
+    records = get_access_records(caplog)
+    assert [record.method for record in records] == ["POST"]
+    assert records[0].sample_rate == 1
+
+
+async def test_sampled_read_contains_route_and_db_time(
+    access_log_client: AsyncClient, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 1)
+    caplog.set_level(logging.INFO, logger="src.access")
+    # Act
+    response = await access_log_client.get("/items/42")
+    # Assert
+    record = get_access_records(caplog)[0]
+    assert record.levelno == logging.INFO
+    assert record.route == "/items/{item_id}"
+    assert record.status == status.HTTP_200_OK
+    assert record.db_ms == 250
+    assert record.latency_ms > 0
+    assert record.bytes == len(response.content)
+    assert record.sample_rate == 1
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_status"),
+    [
+        ("/unavailable", status.HTTP_503_SERVICE_UNAVAILABLE),
+        ("/failing", status.HTTP_500_INTERNAL_SERVER_ERROR),
+    ],
+)
+async def test_errors_are_always_logged(
+    access_log_client: AsyncClient,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    path: str,
+    expected_status: int,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0)
+    caplog.set_level(logging.INFO, logger="src.access")
+    # Act
+    await access_log_client.get(path)
+    # Assert
+    record = get_access_records(caplog)[0]
+    assert record.levelno == logging.ERROR
+    assert record.status == expected_status
+    assert record.route == path
+
+
+async def test_unmatched_route_is_logged_without_template(
+    access_log_client: AsyncClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    # Arrange
+    caplog.set_level(logging.INFO, logger="src.access")
+    # Act
+    await access_log_client.get("/unknown")
+    # Assert
+    record = get_access_records(caplog)[0]
+    assert record.status == status.HTTP_404_NOT_FOUND
+    assert record.route is None
+
+
+def test_track_db_time_accumulates_statement_durations() -> None:
+    # Arrange
+    engine = create_engine("sqlite://")
+    track_db_time(SimpleNamespace(sync_engine=engine))
+    durations = [0.0]
+    token = db_durations.set(durations)
+    # Act
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SELECT 1")
+        first_duration = durations[0]
+        connection.exec_driver_sql("SELECT 1")
+    db_durations.reset(token)
+    # Assert
+    assert first_duration > 0
+    assert durations[0] > first_duration
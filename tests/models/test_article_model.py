@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.models.article_content_model import ArticleContent
+from src.models.article_model import Article
+
+
+def test_set_content_of_new_article() -> None:
+    # Arrange
+    article = Article(title="Title")
+    # Act
+    article.content = "Content"
+    # Assert
+    assert article.article_content.content == "Content"
+
+
+def test_set_content_of_loaded_content() -> None:
+    # Arrange
+    article = Article(id=1, article_content=ArticleContent(article_id=1, content="Content"))
+    make_transient_to_detached(article)
+    # Act
+    article.content = "Updated content"
+    # Assert
+    assert article.content == "Updated content"
+
+
+def test_set_content_without_loaded_content() -> None:
+    # Arrange
+    article = Article(id=1)
+    make_transient_to_detached(article)
+    # Act & Assert
+    with pytest.raises(ValueError):
+        article.content = "Content"
@@ -0,0 +1,20 @@
+from fastapi import status
+from httpx import AsyncClient
+
+
+async def test_get_jwks(client: AsyncClient) -> None:
+    # Act
+    response = await client.get("/.well-known/jwks.json")
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.json()["keys"], list)
+    assert "max-age" in response.headers["Cache-Control"]
+
+
+async def test_get_jwks_not_modified(client: AsyncClient) -> None:
+    # Arrange
+    etag = (await client.get("/.well-known/jwks.json")).headers["ETag"]
+    # Act
+    response = await client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
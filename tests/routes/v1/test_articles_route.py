@@ -1,11 +1,15 @@
+import asyncio
 from typing import Dict, List
 
+import pytest
 from fastapi import status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.settings import settings
 from src.schemas.articles_schema import ArticleDB
+from src.services.article_views_service import article_views_service
+from src.util.single_flight import single_flight
 from tests.utils.article import (
     create_article_in_db,
     get_fake_article,
@@ -45,6 +49,24 @@ async def test_get_article(
     await remove_article_in_db(article.id, db_session)
 
 
+async def test_get_article_concurrently(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    coalesced_before = single_flight.coalesced_counter.values.get(("ArticlesService.get_article",), 0)
+    # Act
+    responses = await asyncio.gather(
+        *(client.get(f"{settings.API_PATH}/articles/{article.id}", headers=auth_header) for _ in range(10))
+    )
+    # Assert
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+    assert all(response.json() == responses[0].json() for response in responses)
+    assert single_flight.coalesced_counter.values[("ArticlesService.get_article",)] > coalesced_before
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
+
+
 async def test_get_articles(
     client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
 ) -> None:
@@ -60,6 +82,42 @@ async def test_get_articles(
     await remove_article_in_db(article.id, db_session)
 
 
+async def test_get_articles_total(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    # Act
+    response = await client.get(
+        f"{settings.API_PATH}/articles/", headers=auth_header, params={"total": True, "limit": 1}
+    )
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    assert int(response.headers["X-Total-Count"]) >= 1
+    assert response.headers["X-Total-Count-Type"] in ("exact", "estimated")
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
+
+
+async def test_get_articles_without_total(client: AsyncClient, auth_header: Dict[str, str]) -> None:
+    # Act
+    response = await client.get(f"{settings.API_PATH}/articles/", headers=auth_header)
+    # Assert
+    assert "X-Total-Count" not in response.headers
+    assert "X-Total-Count-Type" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "params", [{"skip": -1}, {"limit": 0}, {"limit": -1}, {"limit": 101}, {"limit": 100000000, "total": True}]
+)
+async def test_get_articles_invalid_pagination(client: AsyncClient, params: Dict[str, int]) -> None:
+    # Act
+    response = await client.get(f"{settings.API_PATH}/articles/", params=params)
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_update_article(
     client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
 ) -> None:
@@ -91,3 +149,88 @@ async def test_delete_article(
     # Assert
     assert json_response["article_id"]
     assert json_response["status"] == "Article deleted"
+
+
+async def test_update_article_return_representation(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    update_article = get_fake_article()
+    # Act
+    response = await client.put(
+        f"{settings.API_PATH}/articles/{article.id}",
+        headers=auth_header,
+        params={"return": "representation"},
+        json=update_article,
+    )
+    json_response = response.json()
+    # Assert
+    assert json_response["id"] == article.id
+    assert json_response["author"] == update_article["author"]
+    assert json_response["updated_at"]
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
+
+
+async def test_get_articles_by_ids(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    first_article = await create_article_in_db(db_session)
+    second_article = await create_article_in_db(db_session)
+    missing_id = second_article.id + 1000
+    # Act
+    response = await client.get(
+        f"{settings.API_PATH}/articles/",
+        headers=auth_header,
+        params={"ids": f"{second_article.id},{missing_id},{first_article.id}"},
+    )
+    json_response = response.json()
+    # Assert
+    assert [article["id"] for article in json_response] == [second_article.id, first_article.id]
+    assert response.headers["X-Missing-IDs"] == str(missing_id)
+    # Cleanup
+    await remove_article_in_db(first_article.id, db_session)
+    await remove_article_in_db(second_article.id, db_session)
+
+
+async def test_get_related_articles(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    related_article = get_fake_article()
+    related_article["tags"] = article.tags[:2] + related_article["tags"][:1]
+    response = await client.post(f"{settings.API_PATH}/articles/", headers=auth_header, json=related_article)
+    related_article_id = response.json()["id"]
+    # Act
+    response = await client.get(f"{settings.API_PATH}/articles/{article.id}/related", headers=auth_header)
+    json_response = response.json()
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert json_response[0]["id"] == related_article_id
+    assert json_response[0]["score"] == 0.5
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
+    await remove_article_in_db(related_article_id, db_session)
+
+
+async def test_get_popular_articles(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    for _ in range(3):
+        await client.get(f"{settings.API_PATH}/articles/{article.id}", headers=auth_header)
+    await article_views_service.flush()
+    # Act
+    response = await client.get(
+        f"{settings.API_PATH}/articles/popular", headers=auth_header, params={"limit": 100}
+    )
+    json_response = response.json()
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert next(popular for popular in json_response if popular["id"] == article.id)["views"] == 3
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
@@ -0,0 +1,34 @@
+from fastapi import status
+from httpx import AsyncClient
+
+from src.config.settings import settings
+from src.services.token_service import token_service
+
+
+async def test_login_rate_limited_per_account(client: AsyncClient) -> None:
+    # Arrange
+    credentials = {"email": "rate-limited@example.com", "password": "invalid"}
+    for _ in range(settings.LOGIN_ACCOUNT_BUCKET_SIZE):
+        await client.post(f"{settings.API_PATH}/auth/login", json=credentials)
+    # Act
+    response = await client.post(f"{settings.API_PATH}/auth/login", json=credentials)
+    # Assert
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+async def test_revoked_token_is_rejected(client: AsyncClient) -> None:
+    # Arrange
+    auth_tokens = token_service.generate_auth_tokens(settings.ADMIN_USER)
+    access_token = auth_tokens["access_token"]["token"]
+    # Act
+    revoke_response = await client.post(
+        f"{settings.API_PATH}/auth/revoke", json={"token": access_token, "token_type": "access_token"}
+    )
+    response = await client.delete(
+        f"{settings.API_PATH}/skills/0", headers={"Authorization": f"Bearer {access_token}"}
+    )
+    # Assert
+    assert revoke_response.status_code == status.HTTP_204_NO_CONTENT
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["detail"] == "Invalid bearer token"
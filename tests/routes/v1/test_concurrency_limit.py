@@ -0,0 +1,77 @@
+from typing import Any, Dict
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from src.config.settings import settings
+from src.middlewares.concurrency_limit_middleware import (
+    ConcurrencyLimitMiddleware,
+    limiters,
+)
+from src.util.adaptive_limiter import AdaptiveLimiter
+
+
+async def send_response(status_code: int) -> None:
+    """
+    Sends a request through the middleware to an app responding with the status.
+    """
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": status_code, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message: Dict[str, Any]) -> None:
+        pass
+
+    scope = {"type": "http", "method": "GET", "path": f"{settings.API_PATH}/articles/"}
+    await ConcurrencyLimitMiddleware(app)(scope, None, send)  # type: ignore[arg-type]
+
+
+async def test_requests_exceeding_limit_are_shed(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(limiters["read"], "limit", 0.0)
+    monkeypatch.setattr(settings, "CONCURRENCY_QUEUE_SIZE", 0)
+    # Act
+    response = await client.get(f"{settings.API_PATH}/articles/")
+    # Assert
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == str(settings.CONCURRENCY_RETRY_AFTER_SECONDS)
+
+
+async def test_invalid_requests_do_not_adapt_limit(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(limiters["read"], "latency", None)
+    monkeypatch.setattr(limiters["read"], "baseline", None)
+    # Act
+    response = await client.get(f"{settings.API_PATH}/articles/", params={"skip": -1})
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert limiters["read"].latency is None
+    assert limiters["read"].baseline is None
+
+
+async def test_client_disconnects_do_not_adapt_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    monkeypatch.setitem(limiters, "read", limiter)
+    # Act
+    await send_response(status.HTTP_503_SERVICE_UNAVAILABLE)
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_INITIAL_LIMIT
+    assert limiter.latency is None
+
+
+async def test_exceeded_deadlines_decrease_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    monkeypatch.setitem(limiters, "read", limiter)
+    # Act
+    await send_response(status.HTTP_504_GATEWAY_TIMEOUT)
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_INITIAL_LIMIT * settings.CONCURRENCY_BACKOFF_RATIO
@@ -0,0 +1,42 @@
+import time
+from typing import Any, Dict
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.db.base import LazySession
+from src.services.skills_service import skills_service
+
+
+async def test_request_deadline_cancels_query(
+    client: AsyncClient, auth_header: Dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    async def slow_get_skills(skip: int, limit: int, db_session: AsyncSession, **kwargs: Any) -> None:
+        await db_session.execute(text("SELECT pg_sleep(5)"))
+
+    monkeypatch.setattr(settings, "REQUEST_DEADLINES", {"get_skills": 0.5})
+    monkeypatch.setattr(skills_service, "get_skills", slow_get_skills)
+    start = time.perf_counter()
+    # Act
+    response = await client.get(f"{settings.API_PATH}/skills/", headers=auth_header)
+    # Assert
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert time.perf_counter() - start < 2
+
+
+async def test_statement_timeout_of_session() -> None:
+    # Arrange
+    session = LazySession(deadline=time.monotonic() + 0.5)
+    start = time.perf_counter()
+    # Act
+    with pytest.raises(DBAPIError):
+        await session.execute(text("SELECT pg_sleep(5)"))
+    await session.release()
+    # Assert
+    assert time.perf_counter() - start < 2
@@ -0,0 +1,35 @@
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from tests.utils.article import create_article_in_db, remove_article_in_db
+
+
+async def test_get_rss(client: AsyncClient, db_session: AsyncSession) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    # Act
+    response = await client.get(f"{settings.API_PATH}/feed.xml")
+    revalidated_response = await client.get(
+        f"{settings.API_PATH}/feed.xml", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/rss+xml"
+    assert f"/articles/{article.id}</link>" in response.text
+    assert revalidated_response.status_code == status.HTTP_304_NOT_MODIFIED
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
+
+
+async def test_get_sitemap(client: AsyncClient, db_session: AsyncSession) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    await client.get(f"{settings.API_PATH}/sitemap.xml")
+    # Act
+    await remove_article_in_db(article.id, db_session)
+    response = await client.get(f"{settings.API_PATH}/sitemap.xml")
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert f"/articles/{article.id}</loc>" not in response.text
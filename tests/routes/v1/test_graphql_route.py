@@ -0,0 +1,113 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.main import app
+from src.services.token_service import token_service
+from tests.utils.article import create_article_in_db, remove_article_in_db
+
+pytest.importorskip("strawberry")
+
+
+def get_token_header() -> Dict[str, str]:
+    access_token = token_service.generate_auth_tokens(settings.ADMIN_USER)["access_token"]["token"]
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+async def test_query_article(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    query = "query ($id: Int!) { article(id: $id) { id title content tags { name } } }"
+    # Act
+    response = await client.post(
+        f"{settings.API_PATH}/graphql",
+        headers=auth_header,
+        json={"query": query, "variables": {"id": article.id}},
+    )
+    json_response = response.json()
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert "errors" not in json_response
+    assert json_response["data"]["article"] == {
+        "id": article.id,
+        "title": article.title,
+        "content": article.content,
+        "tags": [{"name": tag.name} for tag in article.tags],
+    }
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
+
+
+async def test_query_exceeding_cost_is_rejected(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "GRAPHQL_MAX_COST", 100)
+    # Costs 1 for the list and 4 for each of the up to 50 articles, 3 fields and the name of the tags
+    query = "{ articles(limit: 50) { id title tags { name } } }"
+    # Act
+    response = await client.post(
+        f"{settings.API_PATH}/graphql", headers=get_token_header(), json={"query": query}
+    )
+    json_response = response.json()
+    # Assert
+    assert json_response["data"] is None
+    assert json_response["errors"][0]["message"] == "Query cost of 201 exceeds the maximum of 100"
+
+
+async def test_query_with_variable_limit_is_charged_the_maximum(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "GRAPHQL_MAX_COST", settings.GRAPHQL_MAX_LIMIT)
+    query = "query ($limit: Int!) { skills(limit: $limit) { id } }"
+    # Act
+    response = await client.post(
+        f"{settings.API_PATH}/graphql",
+        headers=get_token_header(),
+        json={"query": query, "variables": {"limit": 1}},
+    )
+    json_response = response.json()
+    # Assert
+    assert "exceeds the maximum" in json_response["errors"][0]["message"]
+
+
+async def test_query_without_token_is_forbidden(client: AsyncClient) -> None:
+    # Act
+    response = await client.post(f"{settings.API_PATH}/graphql", json={"query": "{ skills { id } }"})
+    # Assert
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_websocket_without_token_is_closed() -> None:
+    # Arrange
+    scope = {
+        "type": "websocket",
+        "asgi": {"version": "3.0"},
+        "scheme": "ws",
+        "path": f"{settings.API_PATH}/graphql",
+        "raw_path": f"{settings.API_PATH}/graphql".encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("test", 80),
+        "subprotocols": ["graphql-transport-ws"],
+    }
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "websocket.connect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    # Act
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    # Assert
+    assert [message["type"] for message in messages] == ["websocket.close"]
@@ -0,0 +1,14 @@
+from typing import Dict
+
+from fastapi import status
+from httpx import AsyncClient
+
+from src.config.settings import settings
+
+
+async def test_get_metrics(client: AsyncClient, auth_header: Dict[str, str]) -> None:
+    # Act
+    response = await client.get(f"{settings.API_PATH}/metrics/", headers=auth_header)
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert "# TYPE event_loop_lag_seconds histogram" in response.text
@@ -0,0 +1,24 @@
+from typing import Dict
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from tests.utils.article import create_article_in_db, remove_article_in_db
+
+
+async def test_get_overview(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    article = await create_article_in_db(db_session)
+    # Act
+    response = await client.get(f"{settings.API_PATH}/overview/", headers=auth_header)
+    json_response = response.json()
+    # Assert
+    assert json_response["articles"][0]["id"] == article.id
+    assert json_response["articles"][0]["content"] is None
+    assert isinstance(json_response["projects"], list)
+    assert isinstance(json_response["skills"], dict)
+    # Cleanup
+    await remove_article_in_db(article.id, db_session)
@@ -0,0 +1,21 @@
+from typing import Dict
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.config.settings import settings
+
+pytest.importorskip("pyinstrument")
+
+
+async def test_profile_request(client: AsyncClient, auth_header: Dict[str, str]) -> None:
+    # Arrange
+    headers = {**auth_header, settings.PROFILING_HEADER: "1"}
+    # Act
+    response = await client.get(f"{settings.API_PATH}/articles/", headers=headers)
+    json_response = response.json()
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Profiled-Status"] == str(status.HTTP_200_OK)
+    assert json_response["$schema"] == "https://www.speedscope.app/file-format-schema.json"
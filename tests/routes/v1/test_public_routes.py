@@ -0,0 +1,28 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.config.settings import settings
+
+RESOURCES = ["articles", "projects", "skills"]
+
+
+@pytest.mark.parametrize("resource", RESOURCES)
+async def test_anonymous_read(client: AsyncClient, resource: str) -> None:
+    # Act
+    response = await client.get(f"{settings.API_PATH}/{resource}/")
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.json(), list)
+
+
+@pytest.mark.parametrize("resource", RESOURCES)
+@pytest.mark.parametrize(("method", "path"), [("POST", "/"), ("PUT", "/1"), ("DELETE", "/1")])
+async def test_anonymous_write_is_forbidden(
+    client: AsyncClient, resource: str, method: str, path: str
+) -> None:
+    # Act
+    response = await client.request(method, f"{settings.API_PATH}/{resource}{path}", json={})
+    # Assert
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["detail"] == "No credentials provided"
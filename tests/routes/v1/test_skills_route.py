@@ -0,0 +1,47 @@
+from typing import Dict
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import settings
+from src.models.skill_model import Skill
+from src.services.skills_service import skills_service
+from tests.utils.skill import create_skill_in_db, remove_skill_in_db
+
+
+async def test_get_skills_by_category(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    skill = await create_skill_in_db(db_session)
+    # Act
+    response = await client.get(f"{settings.API_PATH}/skills/by-category", headers=auth_header)
+    json_response = response.json()
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert next(skill_dict for skill_dict in json_response[skill.category] if skill_dict["id"] == skill.id)
+    # Cleanup
+    await remove_skill_in_db(skill.id, db_session)
+
+
+async def test_get_skills_by_category_without_category(
+    client: AsyncClient, db_session: AsyncSession, auth_header: Dict[str, str]
+) -> None:
+    # Arrange
+    uncategorized_skill = Skill(name="Uncategorized", category=None, experience=1)
+    db_session.add(uncategorized_skill)
+    await db_session.commit()
+    skills_service.skills_by_category_cache.clear()
+    # Act
+    response = await client.get(f"{settings.API_PATH}/skills/by-category", headers=auth_header)
+    json_response = response.json()
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert all(
+        skill_dict["id"] != uncategorized_skill.id
+        for skills in json_response.values()
+        for skill_dict in skills
+    )
+    # Cleanup
+    await remove_skill_in_db(uncategorized_skill.id, db_session)
@@ -0,0 +1,35 @@
+from typing import Any, List
+
+import pytest
+
+from src.db.base import LazySession
+from src.services.articles_service import articles_service
+from src.services.overview_service import overview_service
+from src.services.projects_service import projects_service
+from src.services.skills_service import skills_service
+
+
+async def test_get_overview_limits_queries_to_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    sessions: List[Any] = []
+
+    async def get_latest(limit: int, db_session: Any) -> list:
+        sessions.append(db_session)
+        return []
+
+    async def get_skills_by_category(db_session: Any) -> dict:
+        sessions.append(db_session)
+        return {}
+
+    monkeypatch.setattr(articles_service, "get_latest_articles", get_latest)
+    monkeypatch.setattr(projects_service, "get_latest_projects", get_latest)
+    monkeypatch.setattr(skills_service, "get_skills_by_category", get_skills_by_category)
+    overview_service.invalidate()
+    # Act
+    overview = await overview_service.get_overview(1, 1, deadline=123.0)
+    overview_service.invalidate()
+    # Assert
+    assert overview.articles == []
+    assert len(sessions) == 3
+    assert all(isinstance(session, LazySession) and session.deadline == 123.0 for session in sessions)
+    assert all(session.started is False for session in sessions)
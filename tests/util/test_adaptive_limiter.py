@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from src.config.settings import settings
+from src.util.adaptive_limiter import AdaptiveLimiter
+
+
+def test_limit_grows_with_constant_latency() -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    # Act
+    for _ in range(10000):
+        limiter.in_flight += 1
+        limiter.release(0.005)
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_MAX_LIMIT
+
+
+def test_limit_grows_with_mixed_fast_and_slow_latencies() -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    # Act
+    for index in range(10000):
+        limiter.in_flight += 1
+        limiter.release(0.0003 if index % 2 else 0.005)
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_MAX_LIMIT
+
+
+def test_limit_decreases_when_latency_increases() -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    for _ in range(100):
+        limiter.in_flight += 1
+        limiter.release(0.005)
+    limit_before = limiter.limit
+    # Act
+    for _ in range(20):
+        limiter.in_flight += 1
+        limiter.release(0.05)
+    # Assert
+    assert limiter.limit < limit_before
+
+
+def test_limit_decreases_once_per_latency_interval_when_overloaded() -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    # Act
+    for _ in range(5):
+        limiter.in_flight += 1
+        limiter.release(1.0, overloaded=True)
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_INITIAL_LIMIT * settings.CONCURRENCY_BACKOFF_RATIO
+
+
+def test_limit_does_not_fall_below_minimum(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "CONCURRENCY_INITIAL_LIMIT", settings.CONCURRENCY_MIN_LIMIT)
+    limiter = AdaptiveLimiter()
+    # Act
+    limiter.in_flight += 1
+    limiter.release(1.0, overloaded=True)
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_MIN_LIMIT
+
+
+def test_release_without_latency_does_not_adapt() -> None:
+    # Arrange
+    limiter = AdaptiveLimiter()
+    # Act
+    limiter.in_flight += 1
+    limiter.release()
+    # Assert
+    assert limiter.limit == settings.CONCURRENCY_INITIAL_LIMIT
+    assert limiter.baseline is None
+
+
+async def test_waiting_operation_is_admitted_on_release(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "CONCURRENCY_INITIAL_LIMIT", 1)
+    limiter = AdaptiveLimiter()
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    queued = limiter.queued
+    # Act
+    limiter.release()
+    # Assert
+    assert queued == 1
+    assert await waiting is True
+    assert limiter.in_flight == 1
+
+
+async def test_operation_is_rejected_when_queue_is_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "CONCURRENCY_INITIAL_LIMIT", 1)
+    monkeypatch.setattr(settings, "CONCURRENCY_QUEUE_SIZE", 0)
+    limiter = AdaptiveLimiter()
+    await limiter.acquire()
+    # Act
+    acquired = await limiter.acquire()
+    # Assert
+    assert acquired is False
+
+
+async def test_waiting_operation_is_rejected_after_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "CONCURRENCY_INITIAL_LIMIT", 1)
+    monkeypatch.setattr(settings, "CONCURRENCY_QUEUE_TIMEOUT_SECONDS", 0.01)
+    limiter = AdaptiveLimiter()
+    await limiter.acquire()
+    # Act
+    acquired = await limiter.acquire()
+    # Assert
+    assert acquired is False
+    assert limiter.queued == 0
@@ -0,0 +1,175 @@
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import ecdsa
+import pytest
+import rsa
+from jose import jwt
+
+from src.config.settings import settings
+from src.services.token_service import TokenService
+from src.util import jwt_keyset
+from src.util.jwt_keyset import JWTKeyset
+
+MAX_AGE_SECONDS = 300
+RELOAD_SECONDS = 60
+GRACE_MINUTES = 10
+
+
+class Clock:
+    """Replaces the clocks of the keyset, so that the time can be advanced in the tests."""
+
+    def __init__(self) -> None:
+        self.offset = 0.0
+        self.started_at = time.time()
+
+    def monotonic(self) -> float:
+        return 1000 + self.offset
+
+    def time(self) -> float:
+        return self.started_at + self.offset
+
+    def advance(self, seconds: float) -> None:
+        self.offset += seconds
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """
+    Freezes the time of the keyset and configures the rotation intervals.
+    """
+    fake_clock = Clock()
+    monkeypatch.setattr(
+        jwt_keyset, "time", SimpleNamespace(monotonic=fake_clock.monotonic, time=fake_clock.time)
+    )
+    monkeypatch.setattr(settings, "JWKS_MAX_AGE_SECONDS", MAX_AGE_SECONDS)
+    monkeypatch.setattr(settings, "JWT_KEYS_RELOAD_SECONDS", RELOAD_SECONDS)
+    monkeypatch.setattr(settings, "JWT_KEY_GRACE_MINUTES", GRACE_MINUTES)
+    return fake_clock
+
+
+def write_key(directory: Path, kid: str, algorithm: str, modified_at: float) -> None:
+    if algorithm.startswith("RS"):
+        _, private_key = rsa.newkeys(1024)
+        pem = private_key.save_pkcs1()
+    else:
+        pem = ecdsa.SigningKey.generate(curve=ecdsa.NIST256p).to_pem()
+    path = directory / f"{kid}.pem"
+    path.write_bytes(pem)
+    os.utime(path, (modified_at, modified_at))
+
+
+def get_kids(keyset: JWTKeyset) -> list:
+    return sorted(key["kid"] for key in jwt_keyset.json.loads(keyset.jwks.body)["keys"])
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256"])
+def test_token_is_signed_with_kid(
+    algorithm: str, tmp_path: Path, clock: Clock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    write_key(tmp_path, "first", algorithm, clock.time())
+    monkeypatch.setattr(settings, "ALGORITHM", algorithm)
+    monkeypatch.setattr(settings, "JWT_KEYS_DIR", str(tmp_path))
+    token_service = TokenService()
+    # Act
+    access_token = token_service.generate_auth_tokens("admin@example.com")["access_token"]["token"]
+    # Assert
+    assert jwt.get_unverified_header(access_token)["kid"] == "first"
+    assert token_service.decode_token(access_token).sub == "admin@example.com"
+    assert get_kids(token_service.keyset) == ["first"]
+
+
+def test_keys_of_previous_processes_are_active_on_startup(tmp_path: Path, clock: Clock) -> None:
+    # Arrange
+    write_key(tmp_path, "old", "ES256", clock.time() - 2 * (MAX_AGE_SECONDS + RELOAD_SECONDS))
+    write_key(tmp_path, "current", "ES256", clock.time() - (MAX_AGE_SECONDS + RELOAD_SECONDS))
+    write_key(tmp_path, "new", "ES256", clock.time())
+    # Act
+    keyset = JWTKeyset(str(tmp_path), "ES256")
+    # Assert
+    assert keyset.signing_key.kid == "current"
+    assert get_kids(keyset) == ["current", "new", "old"]
+
+
+def test_new_key_signs_after_max_age_since_publishing(tmp_path: Path, clock: Clock) -> None:
+    # Arrange
+    write_key(tmp_path, "old", "ES256", clock.time() - 2 * (MAX_AGE_SECONDS + RELOAD_SECONDS))
+    keyset = JWTKeyset(str(tmp_path), "ES256")
+    keyset.signing_key
+    # A key copied with an old modification time, that this process has not published yet
+    write_key(tmp_path, "new", "ES256", clock.time() - 2 * MAX_AGE_SECONDS)
+    # Act
+    clock.advance(RELOAD_SECONDS)
+    published_kid = keyset.signing_key.kid
+    published_kids = get_kids(keyset)
+    clock.advance(MAX_AGE_SECONDS - 1)
+    pending_kid = keyset.signing_key.kid
+    clock.advance(1)
+    activated_kid = keyset.signing_key.kid
+    # Assert
+    assert published_kid == "old"
+    assert published_kids == ["new", "old"]
+    assert pending_kid == "old"
+    assert activated_kid == "new"
+
+
+def test_previous_key_expires_after_grace(tmp_path: Path, clock: Clock) -> None:
+    # Arrange
+    write_key(tmp_path, "old", "RS256", clock.time() - 2 * (MAX_AGE_SECONDS + RELOAD_SECONDS))
+    keyset = JWTKeyset(str(tmp_path), "RS256")
+    old_token = jwt.encode({"sub": "user"}, keyset.signing_key.private_key, "RS256", headers={"kid": "old"})
+    write_key(tmp_path, "new", "RS256", clock.time())
+    clock.advance(RELOAD_SECONDS)
+    keyset.signing_key
+    clock.advance(MAX_AGE_SECONDS)
+    # Act
+    activated_kid = keyset.signing_key.kid
+    verified_in_grace = jwt.decode(old_token, keyset.verification_key("old"), "RS256")
+    clock.advance(GRACE_MINUTES * 60)
+    expired_key = keyset.verification_key("old")
+    # Assert
+    assert activated_kid == "new"
+    assert verified_in_grace == {"sub": "user"}
+    assert expired_key is None
+    assert get_kids(keyset) == ["new"]
+
+
+def test_unknown_kid_rescans_directory(tmp_path: Path, clock: Clock) -> None:
+    # Arrange
+    write_key(tmp_path, "old", "ES256", clock.time())
+    keyset = JWTKeyset(str(tmp_path), "ES256")
+    keyset.signing_key
+    # A key loaded by another worker, that this worker has not scanned yet
+    write_key(tmp_path, "new", "ES256", clock.time())
+    # Act
+    clock.advance(1)
+    new_key = keyset.verification_key("new")
+    # Assert
+    assert new_key is not None
+    assert get_kids(keyset) == ["new", "old"]
+
+
+def test_rescans_for_unknown_kids_are_throttled(tmp_path: Path, clock: Clock) -> None:
+    # Arrange
+    write_key(tmp_path, "old", "ES256", clock.time())
+    keyset = JWTKeyset(str(tmp_path), "ES256")
+    keyset.verification_key("unknown")
+    write_key(tmp_path, "new", "ES256", clock.time())
+    # Act
+    throttled_key = keyset.verification_key("new")
+    clock.advance(jwt_keyset.UNKNOWN_KID_RELOAD_SECONDS)
+    rescanned_key = keyset.verification_key("new")
+    # Assert
+    assert throttled_key is None
+    assert rescanned_key is not None
+
+
+def test_empty_directory_raises_error(tmp_path: Path, clock: Clock) -> None:
+    # Arrange
+    keyset = JWTKeyset(str(tmp_path), "ES256")
+    # Act & Assert
+    with pytest.raises(ValueError):
+        keyset.signing_key
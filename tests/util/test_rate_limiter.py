@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from src.config.settings import settings
+from src.util.rate_limiter import InMemoryRateLimiterBackend, LoginRateLimiter
+
+
+async def test_hashing_slot_waits_for_free_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "LOGIN_MAX_CONCURRENT_HASHES", 1)
+    rate_limiter = LoginRateLimiter(InMemoryRateLimiterBackend())
+    entered = []
+
+    async def hash_password(name: str) -> None:
+        async with rate_limiter.hashing_slot():
+            entered.append(name)
+            await asyncio.sleep(0.01)
+
+    # Act
+    first = asyncio.create_task(hash_password("first"))
+    second = asyncio.create_task(hash_password("second"))
+    await asyncio.sleep(0)
+    entered_while_busy = list(entered)
+    await asyncio.gather(first, second)
+    # Assert
+    assert entered_while_busy == ["first"]
+    assert entered == ["first", "second"]
+
+
+async def test_hashing_slot_is_released_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "LOGIN_MAX_CONCURRENT_HASHES", 1)
+    rate_limiter = LoginRateLimiter(InMemoryRateLimiterBackend())
+    with pytest.raises(ValueError):
+        async with rate_limiter.hashing_slot():
+            raise ValueError("Hashing failed")
+    # Act
+    async with rate_limiter.hashing_slot():
+        acquired = True
+    # Assert
+    assert acquired is True
@@ -0,0 +1,135 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from src.db.base import LazySession
+from src.util.single_flight import coalesced, single_flight
+from src.util.write_events import WriteTopics, write_events
+
+
+class Service:
+    """Records the calls and sessions of its coalesced method."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.sessions: List[Any] = []
+        self.release = asyncio.Event()
+
+    @coalesced(WriteTopics.ARTICLES)
+    async def get_item(self, item_id: int, db_session: Any) -> int:
+        self.calls += 1
+        self.sessions.append(db_session)
+        await self.release.wait()
+        if item_id < 0:
+            raise ValueError("Invalid item")
+        return item_id
+
+
+async def test_concurrent_calls_are_coalesced() -> None:
+    # Arrange
+    service = Service()
+    coalesced_before = single_flight.coalesced_counter.values.get(("Service.get_item",), 0)
+    calls = [asyncio.create_task(service.get_item(1, None)) for _ in range(5)]
+    await asyncio.sleep(0)
+    # Act
+    service.release.set()
+    results = await asyncio.gather(*calls)
+    # Assert
+    assert results == [1] * 5
+    assert service.calls == 1
+    assert single_flight.coalesced_counter.values[("Service.get_item",)] == coalesced_before + 4
+
+
+async def test_calls_with_different_arguments_are_not_coalesced() -> None:
+    # Arrange
+    service = Service()
+    service.release.set()
+    # Act
+    results = await asyncio.gather(service.get_item(1, None), service.get_item(2, None))
+    # Assert
+    assert results == [1, 2]
+    assert service.calls == 2
+
+
+async def test_exception_is_raised_for_all_callers() -> None:
+    # Arrange
+    service = Service()
+    calls = [asyncio.create_task(service.get_item(-1, None)) for _ in range(3)]
+    await asyncio.sleep(0)
+    # Act
+    service.release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    # Assert
+    assert service.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_write_starts_new_call_for_later_callers() -> None:
+    # Arrange
+    service = Service()
+    first = asyncio.create_task(service.get_item(1, None))
+    await asyncio.sleep(0)
+    # Act
+    write_events.publish(WriteTopics.ARTICLES, 1)
+    second = asyncio.create_task(service.get_item(1, None))
+    await asyncio.sleep(0)
+    service.release.set()
+    results = await asyncio.gather(first, second)
+    # Assert
+    assert results == [1, 1]
+    assert service.calls == 2
+
+
+async def test_write_of_other_resource_does_not_start_new_call() -> None:
+    # Arrange
+    service = Service()
+    first = asyncio.create_task(service.get_item(1, None))
+    await asyncio.sleep(0)
+    # Act
+    write_events.publish(WriteTopics.SKILLS, 1)
+    second = asyncio.create_task(service.get_item(1, None))
+    await asyncio.sleep(0)
+    service.release.set()
+    await asyncio.gather(first, second)
+    # Assert
+    assert service.calls == 1
+
+
+async def test_call_uses_earliest_deadline_of_callers() -> None:
+    # Arrange
+    service = Service()
+    first = asyncio.create_task(service.get_item(1, LazySession(deadline=200.0)))
+    await asyncio.sleep(0)
+    # Act
+    second = asyncio.create_task(service.get_item(1, LazySession(deadline=100.0)))
+    third = asyncio.create_task(service.get_item(1, LazySession()))
+    await asyncio.sleep(0)
+    deadline = service.sessions[0].deadline
+    service.release.set()
+    await asyncio.gather(first, second, third)
+    # Assert
+    assert deadline == 100.0
+    assert isinstance(service.sessions[0], LazySession)
+    assert service.sessions[0].started is False
+
+
+async def test_call_is_cancelled_when_all_callers_are_cancelled() -> None:
+    # Arrange
+    started = asyncio.Event()
+
+    async def function(db_session: LazySession) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    call = asyncio.create_task(single_flight.do("function", "cancelled", WriteTopics.ARTICLES, function))
+    await started.wait()
+    # Act
+    call.cancel()
+    # Assert
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert (
+        await single_flight.do("function", "cancelled", WriteTopics.ARTICLES, lambda _: asyncio.sleep(0, 1))
+        == 1
+    )
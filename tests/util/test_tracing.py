@@ -0,0 +1,85 @@
+import pytest
+
+from src.util import tracing
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+
+@pytest.fixture()
+def exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    """
+    Enables the tracing and records the spans in memory, without replacing
+    the global tracer provider.
+    """
+    span_exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    monkeypatch.setattr(tracing, "TRACING_AVAILABLE", True)
+    monkeypatch.setattr(trace, "get_tracer", lambda name, *args, **kwargs: provider.get_tracer(name))
+    return span_exporter
+
+
+def create_service_class() -> type:
+    class Service:
+        async def get_item(self, item_id: int) -> int:
+            return item_id
+
+        async def _get_cached_item(self, item_id: int) -> int:
+            return item_id
+
+        def count_items(self) -> int:
+            return 1
+
+    return Service
+
+
+def test_tracing_is_disabled_by_default() -> None:
+    # Assert
+    assert tracing.settings.TRACING_ENABLED is False
+    assert tracing.TRACING_AVAILABLE is False
+
+
+def test_traced_returns_class_unchanged_when_disabled() -> None:
+    # Arrange
+    service_class = create_service_class()
+    get_item = service_class.get_item
+    # Act
+    traced_class = tracing.traced(service_class)
+    # Assert
+    assert traced_class.get_item is get_item
+
+
+async def test_traced_records_span_for_public_coroutines(exporter: InMemorySpanExporter) -> None:
+    # Arrange
+    service = tracing.traced(create_service_class())()
+    # Act
+    result = await service.get_item(1)
+    await service._get_cached_item(1)
+    service.count_items()
+    # Assert
+    assert result == 1
+    assert [span.name for span in exporter.get_finished_spans()] == ["Service.get_item"]
+
+
+async def test_traced_records_exception(exporter: InMemorySpanExporter) -> None:
+    # Arrange
+    class FailingService:
+        async def get_item(self) -> None:
+            raise ValueError("Item not found")
+
+    service = tracing.traced(FailingService)()
+    # Act
+    with pytest.raises(ValueError):
+        await service.get_item()
+    # Assert
+    span = exporter.get_finished_spans()[0]
+    assert span.name == "FailingService.get_item"
+    assert span.status.is_ok is False
+    assert span.events[0].name == "exception"
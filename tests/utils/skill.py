@@ -0,0 +1,29 @@
+from typing import Any, Dict
+
+from faker import Faker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.skills_schema import SkillDB, SkillSchema
+from src.services.skills_service import skills_service
+
+
+def get_fake_skill() -> Dict[str, Any]:
+    fake = Faker()
+
+    skill = {
+        "name": fake.word(),
+        "category": fake.word(),
+        "experience": fake.random_int(min=1, max=3),
+    }
+
+    return skill
+
+
+async def create_skill_in_db(db_session: AsyncSession) -> SkillDB:
+    skill = SkillSchema(**get_fake_skill())
+    response = await skills_service.create_skill(skill, db_session)
+    return response
+
+
+async def remove_skill_in_db(skill_id: int, db_session: AsyncSession) -> None:
+    await skills_service.delete_skill(skill_id, db_session)